@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # Import all models so Alembic can detect them
 from app.core.database import Base
 from app.models.user import User
+from app.models.category import Category
 from app.models.transaction import Transaction
 from app.models.reflection import Reflection
 from app.models.goal import Goal
@@ -21,6 +22,8 @@ from app.models.streak import UserStreak
 from app.models.wishlist import WishlistItem
 from app.models.rollover import BudgetRollover
 from app.models.celebration import Celebration
+from app.models.revoked_token import RevokedToken
+from app.models.peer_benchmark import PeerBenchmark
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,35 @@
+"""add_reflection_analysis_columns
+
+Revision ID: a3c91e5d2b47
+Revises: 5ff0fa241708
+Create Date: 2026-10-19 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e5d2b47'
+down_revision: Union[str, Sequence[str], None] = '5ff0fa241708'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('reflections', sa.Column('analysis_triggers', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('reflections', sa.Column('analysis_suggestions', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('reflections', sa.Column('analysis_hash', sa.String(length=64), nullable=True))
+    op.add_column('reflections', sa.Column('analyzed_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('reflections', 'analyzed_at')
+    op.drop_column('reflections', 'analysis_hash')
+    op.drop_column('reflections', 'analysis_suggestions')
+    op.drop_column('reflections', 'analysis_triggers')
@@ -0,0 +1,52 @@
+"""store_money_as_integer_cents
+
+Revision ID: a6d4e9c2b731
+Revises: f3b8d2a6c417
+Create Date: 2026-10-19 17:31:26.904158
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d4e9c2b731'
+down_revision: Union[str, Sequence[str], None] = 'f3b8d2a6c417'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, previous type)
+MONEY_COLUMNS = [
+    ('users', 'monthly_income', sa.Numeric(precision=10, scale=2)),
+    ('users', 'fixed_expenses', sa.Numeric(precision=10, scale=2)),
+    ('budget_rollovers', 'unused_amount', sa.Numeric(precision=10, scale=2)),
+    ('category_limits', 'monthly_limit', sa.Numeric(precision=10, scale=2)),
+    ('category_limits', 'spent', sa.Numeric(precision=10, scale=2)),
+    ('goals', 'current', sa.Numeric(precision=10, scale=2)),
+    ('goals', 'target', sa.Numeric(precision=10, scale=2)),
+    ('transactions', 'amount', sa.Numeric(precision=10, scale=2)),
+    ('user_streaks', 'rollover_budget', sa.Numeric(precision=10, scale=2)),
+    ('wishlist_items', 'price', sa.Numeric(precision=10, scale=2)),
+    ('incomes', 'amount', sa.Numeric(precision=10, scale=2)),
+    ('avoided_impulses', 'amount', sa.Float()),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name, column_name, old_type in MONEY_COLUMNS:
+        op.alter_column(table_name, column_name,
+               existing_type=old_type,
+               type_=sa.BigInteger(),
+               postgresql_using=f'round("{column_name}" * 100)::bigint')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name, column_name, old_type in MONEY_COLUMNS:
+        op.alter_column(table_name, column_name,
+               existing_type=sa.BigInteger(),
+               type_=old_type,
+               postgresql_using=f'"{column_name}" / 100.0')
@@ -0,0 +1,37 @@
+"""add_impulse_count_to_user_streaks
+
+Revision ID: b58e2d7f1c34
+Revises: e71f04b9c2d8
+Create Date: 2026-10-19 13:02:51.774610
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b58e2d7f1c34'
+down_revision: Union[str, Sequence[str], None] = 'e71f04b9c2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user_streaks', sa.Column('impulse_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill lifetime impulse counts, creating summary rows where missing
+    op.execute("""
+        INSERT INTO user_streaks (id, user_id, current_streak, longest_streak, impulses_avoided, rollover_budget, impulse_count)
+        SELECT gen_random_uuid(), user_id, 0, 0, 0, 0, COUNT(*)
+        FROM transactions
+        WHERE is_impulse
+        GROUP BY user_id
+        ON CONFLICT (user_id) DO UPDATE SET impulse_count = EXCLUDED.impulse_count
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_streaks', 'impulse_count')
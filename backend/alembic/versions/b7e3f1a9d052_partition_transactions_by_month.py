@@ -0,0 +1,100 @@
+"""partition_transactions_by_month
+
+Revision ID: b7e3f1a9d052
+Revises: a6d4e9c2b731
+Create Date: 2026-10-19 18:12:40.518336
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3f1a9d052'
+down_revision: Union[str, Sequence[str], None] = 'a6d4e9c2b731'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Future months created up front; the scheduler keeps this many ahead
+MONTHS_AHEAD = 3
+
+INDEXES = [
+    'ix_transactions_date',
+    'ix_transactions_user_id_date',
+    'ix_transactions_user_id_category_date',
+    'ix_transactions_user_id_date_impulse',
+    'ix_transactions_note_trgm',
+]
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_transactions_date', 'transactions', ['date'], unique=False)
+    op.create_index('ix_transactions_user_id_date', 'transactions', ['user_id', 'date'], unique=False)
+    op.create_index('ix_transactions_user_id_category_date', 'transactions', ['user_id', 'category_id', 'date'], unique=False)
+    op.create_index('ix_transactions_user_id_date_impulse', 'transactions', ['user_id', 'date'], unique=False, postgresql_where=sa.text('is_impulse'))
+    op.create_index('ix_transactions_note_trgm', 'transactions', ['note'], unique=False, postgresql_using='gin', postgresql_ops={'note': 'gin_trgm_ops'})
+
+
+def _swap_out_transactions(old_name: str) -> None:
+    """Rename the current table out of the way, freeing its index names"""
+    op.execute(f'ALTER TABLE transactions RENAME TO {old_name}')
+    op.execute(f'ALTER INDEX transactions_pkey RENAME TO {old_name}_pkey')
+    for index_name in INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rewrites every transaction; transactions are unavailable while it runs
+    _swap_out_transactions('transactions_unpartitioned')
+    op.execute("""
+        CREATE TABLE transactions (LIKE transactions_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+        PARTITION BY RANGE (date)
+    """)
+    # The partition key has to be part of the primary key
+    op.create_primary_key('transactions_pkey', 'transactions', ['id', 'date'])
+    op.create_foreign_key('transactions_user_id_fkey', 'transactions', 'users', ['user_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('transactions_category_id_fkey', 'transactions', 'categories', ['category_id'], ['id'])
+
+    # Monthly partitions from the oldest transaction's month, in UTC
+    op.execute('CREATE TABLE transactions_default PARTITION OF transactions DEFAULT')
+    oldest = op.get_bind().execute(sa.text(
+        "SELECT min(date) AT TIME ZONE 'UTC' FROM transactions_unpartitioned"
+    )).scalar()
+    this_month = date.today().replace(day=1)
+    month = oldest.date().replace(day=1) if oldest else this_month
+    while month <= _add_months(this_month, MONTHS_AHEAD):
+        next_month = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE transactions_y{month.year}m{month.month:02d} PARTITION OF transactions "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{next_month.isoformat()} 00:00:00+00')"
+        )
+        month = next_month
+
+    op.execute('INSERT INTO transactions SELECT * FROM transactions_unpartitioned')
+    _create_indexes()
+    op.drop_table('transactions_unpartitioned')
+    op.execute('ANALYZE transactions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Partitions archived by the scheduler are detached and not copied back
+    _swap_out_transactions('transactions_partitioned')
+    op.execute("""
+        CREATE TABLE transactions (LIKE transactions_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+    """)
+    op.execute('INSERT INTO transactions SELECT * FROM transactions_partitioned')
+    op.create_primary_key('transactions_pkey', 'transactions', ['id'])
+    op.create_foreign_key('transactions_user_id_fkey', 'transactions', 'users', ['user_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('transactions_category_id_fkey', 'transactions', 'categories', ['category_id'], ['id'])
+    _create_indexes()
+    op.drop_table('transactions_partitioned')
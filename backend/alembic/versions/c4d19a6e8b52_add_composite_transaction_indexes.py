@@ -0,0 +1,42 @@
+"""add_composite_transaction_indexes
+
+Revision ID: c4d19a6e8b52
+Revises: b58e2d7f1c34
+Create Date: 2026-10-19 14:21:37.160842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d19a6e8b52'
+down_revision: Union[str, Sequence[str], None] = 'b58e2d7f1c34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so transactions stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index('ix_transactions_user_id_date', 'transactions', ['user_id', 'date'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_transactions_user_id_category_date', 'transactions', ['user_id', 'category', 'date'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_transactions_user_id_date_impulse', 'transactions', ['user_id', 'date'], unique=False, postgresql_where=sa.text('is_impulse'), postgresql_concurrently=True, if_not_exists=True)
+        # Covered by the composites above, or too unselective to be useful
+        op.drop_index('ix_transactions_user_id', table_name='transactions', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transactions_category', table_name='transactions', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transactions_is_impulse', table_name='transactions', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_transactions_is_impulse', 'transactions', ['is_impulse'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_transactions_category', 'transactions', ['category'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_transactions_user_id', 'transactions', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_transactions_user_id_date_impulse', table_name='transactions', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transactions_user_id_category_date', table_name='transactions', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transactions_user_id_date', table_name='transactions', postgresql_concurrently=True, if_exists=True)
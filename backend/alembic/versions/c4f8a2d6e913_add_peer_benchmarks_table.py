@@ -0,0 +1,35 @@
+"""add_peer_benchmarks_table
+
+Revision ID: c4f8a2d6e913
+Revises: b7e3f1a9d052
+Create Date: 2026-10-19 20:05:31.742116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8a2d6e913'
+down_revision: Union[str, Sequence[str], None] = 'b7e3f1a9d052'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('peer_benchmarks',
+    sa.Column('metric', sa.String(length=32), nullable=False),
+    sa.Column('quantiles', postgresql.ARRAY(sa.Float()), nullable=False),
+    sa.Column('sample_size', sa.Integer(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('metric')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('peer_benchmarks')
@@ -0,0 +1,39 @@
+"""seed_standard_categories
+
+Revision ID: d5a9e3b1c7f2
+Revises: c4f8a2d6e913
+Create Date: 2026-10-19 21:10:54.306218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a9e3b1c7f2'
+down_revision: Union[str, Sequence[str], None] = 'c4f8a2d6e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copy of app.core.categories.STANDARD_CATEGORIES at the time of writing
+STANDARD_CATEGORIES = ['food', 'transport', 'shopping', 'entertainment', 'bills', 'health', 'tech', 'gifts', 'other']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Requests no longer add categories, so the app's own set has to exist
+    op.execute(
+        sa.text("""
+            INSERT INTO categories (name)
+            SELECT seed.name FROM unnest(CAST(:names AS varchar[])) AS seed(name)
+            WHERE NOT EXISTS (SELECT 1 FROM categories c WHERE c.name = seed.name)
+        """).bindparams(names=STANDARD_CATEGORIES)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Seeded rows may be referenced by now; they are left in place
+    pass
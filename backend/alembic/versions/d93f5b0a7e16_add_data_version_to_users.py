@@ -0,0 +1,28 @@
+"""add_data_version_to_users
+
+Revision ID: d93f5b0a7e16
+Revises: c4d19a6e8b52
+Create Date: 2026-10-19 15:08:12.493027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd93f5b0a7e16'
+down_revision: Union[str, Sequence[str], None] = 'c4d19a6e8b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('data_version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'data_version')
@@ -0,0 +1,39 @@
+"""add_search_indexes
+
+Revision ID: e2a7c81f4d90
+Revises: d93f5b0a7e16
+Create Date: 2026-10-19 16:02:44.385119
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c81f4d90'
+down_revision: Union[str, Sequence[str], None] = 'd93f5b0a7e16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match SEARCH_DOCUMENT in app/models/reflection.py
+REFLECTION_SEARCH_DOCUMENT = (
+    "to_tsvector('english', coalesce(regret_purchase, '') || ' ' || "
+    "coalesce(good_purchase, '') || ' ' || coalesce(notes, ''))"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index('ix_transactions_note_trgm', 'transactions', ['note'], unique=False, postgresql_using='gin', postgresql_ops={'note': 'gin_trgm_ops'}, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_reflections_search', 'reflections', [sa.text(REFLECTION_SEARCH_DOCUMENT)], unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_reflections_search', table_name='reflections', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_transactions_note_trgm', table_name='transactions', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,64 @@
+"""add_categories_lookup_table
+
+Revision ID: f3b8d2a6c417
+Revises: e2a7c81f4d90
+Create Date: 2026-10-19 16:48:05.227913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d2a6c417'
+down_revision: Union[str, Sequence[str], None] = 'e2a7c81f4d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATEGORIZED_TABLES = ('transactions', 'category_limits', 'avoided_impulses')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('categories',
+    sa.Column('id', sa.SmallInteger(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.execute("""
+        INSERT INTO categories (name)
+        SELECT category FROM transactions
+        UNION SELECT category FROM category_limits
+        UNION SELECT category FROM avoided_impulses
+        ORDER BY 1
+    """)
+    for table_name in CATEGORIZED_TABLES:
+        op.add_column(table_name, sa.Column('category_id', sa.SmallInteger(), nullable=True))
+        op.execute(f"""
+            UPDATE {table_name} AS t SET category_id = c.id
+            FROM categories c
+            WHERE c.name = t.category
+        """)
+        op.alter_column(table_name, 'category_id', nullable=False)
+        op.create_foreign_key(f'{table_name}_category_id_fkey', table_name, 'categories', ['category_id'], ['id'])
+        # Also drops ix_transactions_user_id_category_date
+        op.drop_column(table_name, 'category')
+    op.create_index('ix_transactions_user_id_category_date', 'transactions', ['user_id', 'category_id', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in CATEGORIZED_TABLES:
+        op.add_column(table_name, sa.Column('category', sa.String(), nullable=True))
+        op.execute(f"""
+            UPDATE {table_name} AS t SET category = c.name
+            FROM categories c
+            WHERE c.id = t.category_id
+        """)
+        op.alter_column(table_name, 'category', nullable=False)
+        op.drop_column(table_name, 'category_id')
+    op.create_index('ix_transactions_user_id_category_date', 'transactions', ['user_id', 'category', 'date'], unique=False)
+    op.drop_table('categories')
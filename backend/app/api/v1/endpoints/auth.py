@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token
+from app.core.data_version import NotModified, data_versions, etag_matches, make_etag
+from app.core.dates import user_today
+from app.core.user_cache import user_cache
+from app.core.security import verify_password_async, get_password_hash_async, create_access_token, create_refresh_token, decode_token
+from app.core.revocation import revocation_list
 from app.models.user import User
-from app.schemas.auth import UserCreate, UserResponse, Token, UserUpdate
+from app.schemas.auth import UserCreate, UserResponse, Token, UserUpdate, RefreshRequest, LogoutRequest
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -25,7 +29,7 @@ async def register(user_in: UserCreate, db: Session = Depends(get_db)):
     user = User(
         email=user_in.email,
         name=user_in.name,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await get_password_hash_async(user_in.password),
         monthly_income=user_in.monthly_income or 0,
         fixed_expenses=user_in.fixed_expenses or 0,
     )
@@ -41,13 +45,22 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session =
     """Login and get access token"""
     user = db.query(User).filter(User.email == form_data.username).first()
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    valid, new_hash = False, None
+    if user:
+        valid, new_hash = await verify_password_async(form_data.password, user.hashed_password)
+    
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Stored hash used an old cost factor; upgrade it now we have the password
+    if new_hash:
+        user.hashed_password = new_hash
+        db.commit()
+    
     access_token = create_access_token(data={"sub": str(user.id)})
     refresh_token = create_refresh_token(data={"sub": str(user.id)})
     
@@ -61,17 +74,19 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session =
 @router.get("/me", response_model=UserResponse)
 async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     """Get current user info"""
-    from app.core.security import decode_token
-    
     payload = decode_token(token)
-    if not payload:
+    if not payload or revocation_list.is_revoked(db, payload.get("jti")):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
     
     user_id = payload.get("sub")
-    user = db.query(User).filter(User.id == user_id).first()
+    user = user_cache.get(db, User, user_id)
+    if user is None:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user:
+            user_cache.put(user)
     
     if not user:
         raise HTTPException(
@@ -82,40 +97,97 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     return user
 
 
+async def conditional_get(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    ETag for GET endpoints over the current user's data, derived from their
+    data version. A matching If-None-Match is answered with 304 before the
+    endpoint runs any query.
+    """
+    version = data_versions.get(db, current_user.id)
+    # Responses relative to "today" also change at the user's midnight
+    etag = make_etag(current_user.id, version, user_today(current_user).isoformat())
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise NotModified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
 @router.put("/me", response_model=UserResponse)
 async def update_current_user(
     user_update: UserUpdate,
-    token: str = Depends(oauth2_scheme),
+    user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update current user info"""
-    from app.core.security import decode_token
+    # Update fields if provided
+    if user_update.name is not None:
+        user.name = user_update.name
+    if user_update.monthly_income is not None:
+        user.monthly_income = user_update.monthly_income
+    if user_update.fixed_expenses is not None:
+        user.fixed_expenses = user_update.fixed_expenses
     
-    payload = decode_token(token)
-    if not payload:
+    db.commit()
+    user_cache.invalidate(user.id)
+    db.refresh(user)
+    
+    return user
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(request: RefreshRequest, db: Session = Depends(get_db)):
+    """Exchange a refresh token for a new token pair; the old one is revoked"""
+    payload = decode_token(request.refresh_token)
+    # Rotate: revoking is the check, so of concurrent refreshes with the
+    # same token only the one whose insert lands gets a new pair
+    if (
+        not payload
+        or payload.get("type") != "refresh"
+        or not revocation_list.revoke(db, payload.get("jti"), payload["exp"])
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
+            detail="Invalid refresh token"
         )
     
     user_id = payload.get("sub")
-    user = db.query(User).filter(User.id == user_id).first()
-    
+    user = user_cache.get(db, User, user_id) or db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
     
-    # Update fields if provided
-    if user_update.name is not None:
-        user.name = user_update.name
-    if user_update.monthly_income is not None:
-        user.monthly_income = user_update.monthly_income
-    if user_update.fixed_expenses is not None:
-        user.fixed_expenses = user_update.fixed_expenses
+    return {
+        "access_token": create_access_token(data={"sub": str(user.id)}),
+        "refresh_token": create_refresh_token(data={"sub": str(user.id)}),
+        "token_type": "bearer"
+    }
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    request: LogoutRequest = None,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+):
+    """Revoke the current access token and, if given, the refresh token"""
+    payload = decode_token(token)
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token"
+        )
+    revocation_list.revoke(db, payload.get("jti"), payload["exp"])
     
-    db.commit()
-    db.refresh(user)
+    if request and request.refresh_token:
+        refresh_payload = decode_token(request.refresh_token)
+        if refresh_payload and refresh_payload.get("sub") == payload.get("sub"):
+            revocation_list.revoke(db, refresh_payload.get("jti"), refresh_payload["exp"])
     
-    return user
+    return None
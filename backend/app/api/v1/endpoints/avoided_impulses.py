@@ -5,11 +5,13 @@ from typing import List
 from datetime import datetime
 
 from app.core.database import get_db
-from app.api.v1.endpoints.auth import get_current_user
+from app.api.v1.endpoints.auth import conditional_get, get_current_user
 from app.models.user import User
 from app.models.avoided_impulse import AvoidedImpulse
 from app.models.transaction import Transaction
 from app.schemas.avoided_impulse import AvoidedImpulseCreate, AvoidedImpulseResponse
+from app.services.category_limits import adjust_spent
+from app.services.streaks import adjust_impulse_count
 
 router = APIRouter()
 
@@ -35,7 +37,7 @@ def create_avoided_impulse(
     return impulse
 
 
-@router.get("/", response_model=List[AvoidedImpulseResponse])
+@router.get("/", response_model=List[AvoidedImpulseResponse], dependencies=[Depends(conditional_get)])
 def get_avoided_impulses(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -99,6 +101,8 @@ def proceed_with_impulse(
     )
     
     db.add(transaction)
+    adjust_spent(db, current_user.id, transaction.category, transaction.amount, transaction.date)
+    adjust_impulse_count(db, current_user.id, 1)
     
     # Delete the impulse
     db.delete(impulse)
@@ -2,21 +2,21 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, extract
 from datetime import date, timedelta
-from decimal import Decimal
 
 from app.core.database import get_db
+from app.core.dates import user_day_window
 from app.models.user import User
-from app.models.transaction import Transaction
 from app.models.rollover import BudgetRollover
 from app.models.streak import UserStreak
 from app.models.category_limit import CategoryLimit
 from app.models.wishlist import WishlistItem, WishlistStatus
-from app.api.v1.endpoints.auth import get_current_user
+from app.api.v1.endpoints.auth import conditional_get, get_current_user
+from app.services.analytics import category_totals, spent_between
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", dependencies=[Depends(conditional_get)])
 async def get_budget(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -30,7 +30,7 @@ async def get_budget(
             BudgetRollover.user_id == current_user.id,
             BudgetRollover.rollover_applied == False
         )
-    ).scalar() or Decimal("0")
+    ).scalar() or 0.0
     
     # Get current streak
     streak = db.query(UserStreak).filter(
@@ -57,22 +57,15 @@ async def get_budget(
         CategoryLimit.user_id == current_user.id
     ).all()
     
+    # Spent this month per category, in one grouped query
+    spent_by_category = category_totals(db, current_user.id, today.replace(day=1)) if category_limits else {}
+    
     category_limits_data = []
     for limit in category_limits:
-        # Calculate spent this month for this category
-        spent = db.query(func.sum(Transaction.amount)).filter(
-            and_(
-                Transaction.user_id == current_user.id,
-                Transaction.category == limit.category,
-                extract('month', Transaction.date) == current_month,
-                extract('year', Transaction.date) == current_year
-            )
-        ).scalar() or Decimal("0")
-        
         category_limits_data.append({
             "category": limit.category,
             "monthlyLimit": float(limit.monthly_limit),
-            "spent": float(spent)
+            "spent": float(spent_by_category.get(limit.category, 0.0))
         })
     
     return {
@@ -83,13 +76,13 @@ async def get_budget(
     }
 
 
-@router.get("/today")
+@router.get("/today", dependencies=[Depends(conditional_get)])
 async def get_today_budget(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get today's available budget"""
-    today = date.today()
+    _, day_start, day_end = user_day_window(current_user)
     
     # Calculate daily limit from user's monthly income and expenses
     disposable_income = (current_user.monthly_income or 0) - (current_user.fixed_expenses or 0)
@@ -97,12 +90,7 @@ async def get_today_budget(
     daily_limit = disposable_income / days_in_month
     
     # Get today's spent amount
-    spent_today = db.query(func.sum(Transaction.amount)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date == today
-        )
-    ).scalar() or Decimal("0")
+    spent_today = spent_between(db, current_user.id, day_start, day_end)
     
     # Get rollover
     rollover = db.query(func.sum(BudgetRollover.unused_amount)).filter(
@@ -110,7 +98,7 @@ async def get_today_budget(
             BudgetRollover.user_id == current_user.id,
             BudgetRollover.rollover_applied == False
         )
-    ).scalar() or Decimal("0")
+    ).scalar() or 0.0
     
     available_today = daily_limit + float(rollover) - float(spent_today)
     
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, extract
 from typing import Optional
 from datetime import date, datetime
-from decimal import Decimal
 from uuid import UUID
+import hashlib
 
 from app.core.database import get_db
+from app.core.data_version import etag_matches
 from app.models.income import Income
 from app.models.user import User
 from app.schemas.income import (
@@ -17,14 +18,22 @@ from app.schemas.income import (
     IncomeSummaryResponse,
     INCOME_SOURCES
 )
-from app.api.v1.endpoints.auth import get_current_user
+from app.api.v1.endpoints.auth import conditional_get, get_current_user
 
 router = APIRouter()
 
+# The sources are static and public, so their ETag only changes with the list
+SOURCES_ETAG = f'"{hashlib.sha256("|".join(INCOME_SOURCES).encode("utf-8")).hexdigest()[:24]}"'
+SOURCES_CACHE_CONTROL = "public, max-age=86400"
+
 
 @router.get("/sources", response_model=list[str])
-async def get_income_sources():
+async def get_income_sources(request: Request, response: Response):
     """Get list of common income sources"""
+    headers = {"ETag": SOURCES_ETAG, "Cache-Control": SOURCES_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), SOURCES_ETAG):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return INCOME_SOURCES
 
 
@@ -50,7 +59,7 @@ async def create_income(
     return income
 
 
-@router.get("/", response_model=IncomeListResponse)
+@router.get("/", response_model=IncomeListResponse, dependencies=[Depends(conditional_get)])
 async def get_incomes(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -73,7 +82,7 @@ async def get_incomes(
     total = query.count()
     total_amount = db.query(func.sum(Income.amount)).filter(
         Income.user_id == current_user.id
-    ).scalar() or Decimal("0")
+    ).scalar() or 0.0
     
     incomes = query.order_by(Income.date.desc()).offset(offset).limit(limit).all()
     
@@ -84,7 +93,7 @@ async def get_incomes(
     )
 
 
-@router.get("/summary", response_model=IncomeSummaryResponse)
+@router.get("/summary", response_model=IncomeSummaryResponse, dependencies=[Depends(conditional_get)])
 async def get_income_summary(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -97,13 +106,13 @@ async def get_income_summary(
         Income.user_id == current_user.id,
         extract('month', Income.date) == today.month,
         extract('year', Income.date) == today.year
-    ).scalar() or Decimal("0")
+    ).scalar() or 0.0
     
     # Total this year
     total_this_year = db.query(func.sum(Income.amount)).filter(
         Income.user_id == current_user.id,
         extract('year', Income.date) == today.year
-    ).scalar() or Decimal("0")
+    ).scalar() or 0.0
     
     # By source
     by_source_results = db.query(
@@ -129,7 +138,7 @@ async def get_income_summary(
     )
 
 
-@router.get("/{income_id}", response_model=IncomeResponse)
+@router.get("/{income_id}", response_model=IncomeResponse, dependencies=[Depends(conditional_get)])
 async def get_income(
     income_id: UUID,
     db: Session = Depends(get_db),
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Literal
+
+from app.core.database import get_db
+from app.models.user import User
+from app.api.v1.endpoints.auth import conditional_get, get_current_user
+from app.services.search import search
+
+router = APIRouter()
+
+
+@router.get("/", dependencies=[Depends(conditional_get)])
+async def search_history(
+    q: str = Query(..., min_length=2, max_length=100),
+    type: Literal["all", "transactions", "reflections"] = Query("all"),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Search transaction notes and reflections.
+    Results are ranked by relevance, with matches wrapped in <mark> in `highlight`.
+    """
+    return search(db, current_user.id, q, kind=type, limit=limit, offset=offset)
@@ -1,20 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, extract
+from sqlalchemy import func, and_, extract, insert
 from datetime import date, datetime, timedelta
 from typing import Optional, List
 from decimal import Decimal
+from collections import defaultdict
+import os
+import tempfile
 
+from app.core.categories import category_registry
 from app.core.database import get_db
+from app.core.data_version import bump_data_version
+from app.core.dates import user_day_window
+from app.core.ids import uuid7
 from app.models.user import User
 from app.models.transaction import Transaction
-from app.api.v1.endpoints.auth import get_current_user
-from app.schemas.transaction import TransactionCreate, TransactionResponse, TransactionUpdate
+from app.api.v1.endpoints.auth import conditional_get, get_current_user
+from app.services.category_limits import adjust_spent, adjust_spent_by_category, in_current_period
+from app.services.jobs import job_registry
+from app.services.streaks import adjust_impulse_count
+from app.services.statement_import import detect_format, run_statement_import
+from app.schemas.transaction import TransactionCreate, TransactionPayload, TransactionResponse, TransactionUpdate
 from pydantic import field_serializer, BaseModel
 from uuid import UUID
 
 router = APIRouter()
 
+MAX_BULK_TRANSACTIONS = 500
+IMPORT_EXTENSIONS = {".csv", ".ofx", ".qfx"}
+MAX_IMPORT_SIZE = 20 * 1024 * 1024  # 20MB
+IMPORT_READ_SIZE = 1024 * 1024
+
 
 class TransactionResponseWithUUID(BaseModel):
     id: UUID
@@ -36,7 +52,7 @@ class TransactionResponseWithUUID(BaseModel):
         from_attributes = True
 
 
-@router.get("/", response_model=List[TransactionResponseWithUUID])
+@router.get("/", response_model=List[TransactionResponseWithUUID], dependencies=[Depends(conditional_get)])
 async def list_transactions(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
@@ -58,26 +74,30 @@ async def list_transactions(
     return transactions
 
 
+def transaction_values(transaction_data: TransactionPayload) -> dict:
+    """Map a transaction payload from the frontend to column values"""
+    values = transaction_data.model_dump()
+    values["date"] = values["date"] or datetime.now()
+    return values
+
+
 @router.post("/", response_model=TransactionResponseWithUUID, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
-    transaction_data: dict,
+    transaction_data: TransactionPayload,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new transaction"""
     try:
-        # Handle different field names from frontend
         transaction = Transaction(
             user_id=current_user.id,
-            amount=Decimal(str(transaction_data.get('amount'))),
-            category=transaction_data.get('category'),
-            date=datetime.fromisoformat(transaction_data.get('date')) if transaction_data.get('date') else datetime.now(),
-            is_impulse=transaction_data.get('is_impulse_buy', transaction_data.get('is_impulse', False)),
-            note=transaction_data.get('notes', transaction_data.get('note')),
-            emergency_reason=transaction_data.get('emergency_reason')
+            **transaction_values(transaction_data)
         )
         
         db.add(transaction)
+        adjust_spent(db, current_user.id, transaction.category, transaction.amount, transaction.date)
+        if transaction.is_impulse:
+            adjust_impulse_count(db, current_user.id, 1)
         db.commit()
         db.refresh(transaction)
         
@@ -88,24 +108,130 @@ async def create_transaction(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/today", response_model=List[TransactionResponseWithUUID])
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+async def create_transactions_bulk(
+    transactions_data: List[TransactionPayload] = Body(..., min_length=1, max_length=MAX_BULK_TRANSACTIONS),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create many transactions at once (e.g. replaying offline entries).
+    Rows go in with a single multi-row INSERT and category limits get one
+    update per category. Nothing is created if any row is invalid.
+    """
+    rows = [
+        {"id": uuid7(), "user_id": current_user.id, **transaction_values(transaction_data)}
+        for transaction_data in transactions_data
+    ]
+    
+    category_totals = defaultdict(Decimal)
+    for row in rows:
+        if in_current_period(row["date"]):
+            category_totals[row["category"]] += Decimal(str(row["amount"]))
+    
+    category_ids = category_registry.ids(row["category"] for row in rows)
+    for row in rows:
+        row["category_id"] = category_ids[row.pop("category")]
+    
+    try:
+        db.execute(insert(Transaction), rows)
+        adjust_spent_by_category(db, current_user.id, category_totals)
+        adjust_impulse_count(db, current_user.id, sum(1 for row in rows if row["is_impulse"]))
+        bump_data_version(db, [current_user.id])
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"Error creating transactions in bulk: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return {
+        "created": len(rows),
+        "ids": [str(row["id"]) for row in rows]
+    }
+
+
+@router.post("/import", status_code=status.HTTP_202_ACCEPTED)
+async def import_statement(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Import a bank statement (CSV, OFX or QFX) as a background job.
+    Only money going out is imported; rows that already exist are skipped.
+    Poll GET /transactions/import/{job_id} for progress.
+    """
+    file_ext = os.path.splitext(file.filename or "")[1].lower()
+    if file_ext and file_ext not in IMPORT_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File type not allowed. Allowed types: {', '.join(sorted(IMPORT_EXTENSIONS))}"
+        )
+    
+    # Spool to disk in blocks; the upload is closed once this request returns
+    spool = tempfile.NamedTemporaryFile(prefix="statement-", suffix=file_ext, delete=False)
+    try:
+        size = 0
+        head = b""
+        with spool:
+            while block := await file.read(IMPORT_READ_SIZE):
+                size += len(block)
+                if size > MAX_IMPORT_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large. Maximum size: {MAX_IMPORT_SIZE / 1024 / 1024}MB"
+                    )
+                if not head:
+                    head = block[:1024]
+                spool.write(block)
+        if not size:
+            raise HTTPException(status_code=400, detail="File is empty")
+    except BaseException:
+        os.remove(spool.name)
+        raise
+    
+    job = job_registry.create(current_user.id, "statement_import")
+    background_tasks.add_task(
+        run_statement_import,
+        job,
+        current_user.id,
+        spool.name,
+        detect_format(file.filename, head)
+    )
+    return job.as_dict()
+
+
+@router.get("/import/{job_id}")
+async def get_import_status(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Progress and result of a statement import"""
+    job = job_registry.get(job_id, current_user.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return job.as_dict()
+
+
+@router.get("/today", response_model=List[TransactionResponseWithUUID], dependencies=[Depends(conditional_get)])
 async def get_today_transactions(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get today's transactions"""
-    today = date.today()
+    """Get today's transactions (the user's local day)"""
+    _, day_start, day_end = user_day_window(current_user)
     transactions = db.query(Transaction).filter(
         and_(
             Transaction.user_id == current_user.id,
-            func.date(Transaction.date) == today
+            Transaction.date >= day_start,
+            Transaction.date < day_end
         )
     ).order_by(Transaction.date.desc()).all()
     
     return transactions
 
 
-@router.get("/{transaction_id}", response_model=TransactionResponseWithUUID)
+@router.get("/{transaction_id}", response_model=TransactionResponseWithUUID, dependencies=[Depends(conditional_get)])
 async def get_transaction(
     transaction_id: str,
     db: Session = Depends(get_db),
@@ -148,6 +274,9 @@ async def delete_transaction(
             detail="Transaction not found"
         )
     
+    adjust_spent(db, current_user.id, transaction.category, -transaction.amount, transaction.date)
+    if transaction.is_impulse:
+        adjust_impulse_count(db, current_user.id, -1)
     db.delete(transaction)
     db.commit()
     
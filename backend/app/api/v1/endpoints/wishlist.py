@@ -12,12 +12,12 @@ from app.schemas.wishlist import (
     WishlistItemUpdate,
     WishlistItemResponse
 )
-from app.api.v1.endpoints.auth import get_current_user
+from app.api.v1.endpoints.auth import conditional_get, get_current_user
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[WishlistItemResponse])
+@router.get("/", response_model=List[WishlistItemResponse], dependencies=[Depends(conditional_get)])
 async def get_wishlist(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -62,7 +62,7 @@ async def create_wishlist_item(
     return item
 
 
-@router.get("/{item_id}", response_model=WishlistItemResponse)
+@router.get("/{item_id}", response_model=WishlistItemResponse, dependencies=[Depends(conditional_get)])
 async def get_wishlist_item(
     item_id: UUID,
     db: Session = Depends(get_db),
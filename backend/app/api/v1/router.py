@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, transactions, reflections, goals, budget, income, wishlist, upload, avoided_impulses, reports, health
+from app.api.v1.endpoints import auth, transactions, reflections, goals, budget, income, wishlist, upload, avoided_impulses, reports, health, search
 
 api_router = APIRouter()
 
@@ -14,3 +14,4 @@ api_router.include_router(wishlist.router, prefix="/wishlist", tags=["wishlist"]
 api_router.include_router(upload.router, prefix="/upload", tags=["upload"])
 api_router.include_router(avoided_impulses.router, prefix="/avoided-impulses", tags=["avoided-impulses"])
 api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
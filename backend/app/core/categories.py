@@ -0,0 +1,158 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from sqlalchemy import Column, ForeignKey, SmallInteger, String, column, select, table, text
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
+from sqlalchemy.orm import declared_attr
+from app.core.config import settings
+
+# Categories the app offers; seeded by migration. Names outside this set are
+# only accepted if they are already in the table (kept from before the
+# lookup table existed), so user input can't grow the shared smallint table.
+STANDARD_CATEGORIES = (
+    "food", "transport", "shopping", "entertainment", "bills", "health", "tech", "gifts", "other",
+)
+
+# Lightweight table so this module works with both model packages
+categories = table(
+    "categories",
+    column("id", SmallInteger),
+    column("name", String),
+)
+
+
+class UnknownCategory(ValueError):
+    """Raised for a category name that isn't in the categories table"""
+
+
+class CategoryRegistry:
+    """
+    Process-wide name <-> id map of the categories lookup table. The table
+    is small, so it is loaded whole and reloaded every `ttl` seconds (renames
+    made by other workers show up within that) or when an unknown id is
+    seen. Rows are only ever added by migrations, never from requests.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def _engine(self):
+        # Imported here: app.core.database imports the models using this module
+        from app.core.database import engine
+        return engine
+
+    def _load(self, connection):
+        rows = connection.execute(select(categories.c.id, categories.c.name)).all()
+        self._ids = {name: category_id for category_id, name in rows}
+        self._names = {category_id: name for category_id, name in rows}
+        self._loaded_at = time.monotonic()
+
+    def _refresh(self, force: bool = False):
+        with self._lock:
+            if force or self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl:
+                with self._engine().connect() as connection:
+                    self._load(connection)
+
+    def name(self, category_id: Optional[int]) -> Optional[str]:
+        if category_id is None:
+            return None
+        self._refresh()
+        name = self._names.get(category_id)
+        if name is None:
+            self._refresh(force=True)
+            name = self._names.get(category_id)
+        return name
+
+    def known(self, name: str) -> bool:
+        self._refresh()
+        return name in self._ids
+
+    def ids(self, names: Iterable[str]) -> Dict[str, int]:
+        """Ids for `names`; raises UnknownCategory if any isn't in the table"""
+        wanted = {name for name in names if name}
+        self._refresh()
+        ids = self._ids
+        missing = wanted - ids.keys()
+        if missing:
+            raise UnknownCategory(f"Unknown category: {sorted(missing)[0]}")
+        return {name: ids[name] for name in wanted}
+
+    def id(self, name: Optional[str]) -> Optional[int]:
+        if not name:
+            return None
+        return self.ids([name])[name]
+
+
+category_registry = CategoryRegistry(ttl=settings.CATEGORY_CACHE_TTL_SECONDS)
+
+
+def ensure_standard_categories(connection):
+    """Add the standard categories missing from the table (for create_all setups)"""
+    connection.execute(
+        text("""
+            INSERT INTO categories (name)
+            SELECT seed.name FROM unnest(CAST(:names AS varchar[])) AS seed(name)
+            WHERE NOT EXISTS (SELECT 1 FROM categories c WHERE c.name = seed.name)
+            ON CONFLICT (name) DO NOTHING
+        """),
+        {"names": list(STANDARD_CATEGORIES)}
+    )
+
+
+class CategoryComparator(Comparator):
+    """
+    SQL side of `category`: comparisons against names become comparisons of
+    `category_id` against an uncorrelated id lookup (a one-off InitPlan), so
+    indexes on category_id still apply.
+    """
+
+    def __clause_element__(self):
+        return (
+            select(categories.c.name)
+            .where(categories.c.id == self.expression)
+            .scalar_subquery()
+        )
+
+    def _id_of(self, other):
+        # Another category attribute, e.g. CategoryLimit.category
+        other_comparator = getattr(other, "comparator", None)
+        if isinstance(other_comparator, CategoryComparator):
+            return other_comparator.expression
+        return select(categories.c.id).where(categories.c.name == other).scalar_subquery()
+
+    def __eq__(self, other):
+        return self.expression == self._id_of(other)
+
+    def __ne__(self, other):
+        return self.expression != self._id_of(other)
+
+    def in_(self, other):
+        return self.expression.in_(select(categories.c.id).where(categories.c.name.in_(other)))
+
+
+class CategoryMixin:
+    """
+    Stores a row's category as a smallint `category_id` into the categories
+    lookup table, while code and API payloads keep reading and writing the
+    name through `category`.
+    """
+
+    @declared_attr
+    def category_id(cls):
+        return Column(SmallInteger, ForeignKey("categories.id"), nullable=False)
+
+    @hybrid_property
+    def category(self) -> Optional[str]:
+        return category_registry.name(self.category_id)
+
+    @category.setter
+    def category(self, name: Optional[str]):
+        self.category_id = category_registry.id(name)
+
+    @category.comparator
+    def category(cls):
+        return CategoryComparator(cls.category_id)
@@ -9,12 +9,60 @@ class Settings(BaseSettings):
     # Redis (optional for now)
     REDIS_URL: Optional[str] = "redis://localhost:6379/0"
     
+    # Authenticated-user cache; USER_CACHE_REDIS shares it across workers
+    # through REDIS_URL (requires the redis package)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_REDIS: bool = False
+    
+    # Cached per-user data versions behind ETags; DATA_VERSION_CACHE_REDIS
+    # shares them across workers through REDIS_URL
+    DATA_VERSION_CACHE_TTL_SECONDS: int = 60
+    DATA_VERSION_CACHE_MAX_SIZE: int = 10000
+    DATA_VERSION_CACHE_REDIS: bool = False
+    
+    # How often the cached category name <-> id map is reloaded
+    CATEGORY_CACHE_TTL_SECONDS: int = 300
+    
+    # Monthly transaction partitions: how many future months to keep created,
+    # and how many months to keep attached (older ones are detached into the
+    # archive schema; unset keeps everything)
+    TRANSACTION_PARTITIONS_AHEAD: int = 3
+    TRANSACTION_PARTITION_RETENTION_MONTHS: Optional[int] = None
+    
+    # Cached spending aggregates (app.services.analytics), keyed by data
+    # version
+    ANALYTICS_CACHE_TTL_SECONDS: int = 300
+    ANALYTICS_CACHE_MAX_SIZE: int = 10000
+    
+    # Peer benchmarks: distributions over fewer users than this aren't
+    # stored, so no one can be singled out from them
+    PEER_BENCHMARK_MIN_USERS: int = 10
+    
+    # Excel report jobs: worker processes generating them, and the disk
+    # cache of finished reports (defaults to a directory under the system
+    # temp dir)
+    REPORT_EXPORT_WORKERS: int = 2
+    REPORT_CACHE_DIR: Optional[str] = None
+    REPORT_CACHE_TTL_SECONDS: int = 3600
+    
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
+    # Verified-token cache
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_MAX_TTL_SECONDS: int = 300
+    
+    # Token revocation Bloom filter size (grows on rebuild if exceeded)
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    
     # Minimax API
     MINIMAX_API_KEY: str
     MINIMAX_API_URL: str = "https://api.minimax.chat/v1/text/chatcompletion_v2"
@@ -0,0 +1,173 @@
+import hashlib
+from typing import Iterable, Optional, Set
+from sqlalchemy import BigInteger, column, event, select, table, update
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+
+# Lightweight table so this module doesn't depend on either User model
+users = table(
+    "users",
+    column("id", UUID(as_uuid=True)),
+    column("data_version", BigInteger),
+)
+
+_PENDING_KEY = "data_version_pending"  # user ids written in the current flush
+_COMMIT_KEY = "data_version_bumped"  # user ids bumped in the current transaction
+
+
+class NotModified(Exception):
+    """Raised by conditional GETs whose ETag still matches; answered with a 304"""
+
+    def __init__(self, etag: str):
+        self.etag = etag
+
+
+class DataVersionStore:
+    """
+    Per-user data versions (users.data_version), cached so that a poll of
+    unchanged data costs a cache lookup instead of a query. Entries are
+    invalidated when a transaction that bumped the version commits; the TTL
+    bounds staleness from a read racing that commit.
+    """
+
+    LOCAL_TTL_WITH_REDIS = 2
+
+    def __init__(self, maxsize: int, ttl: int, use_redis: bool = False):
+        self.ttl = ttl
+        self.use_redis = use_redis
+        local_ttl = min(ttl, self.LOCAL_TTL_WITH_REDIS) if use_redis else ttl
+        self._local = TTLCache(maxsize=maxsize, ttl=local_ttl)
+
+    def _redis_key(self, key: str) -> str:
+        return f"data-version:{key}"
+
+    def get(self, db: Session, user_id) -> int:
+        key = str(user_id)
+        version = self._local.get(key)
+        if version is not None:
+            return version
+
+        client = get_redis() if self.use_redis else None
+        if client is not None:
+            try:
+                raw = client.get(self._redis_key(key))
+                if raw is not None:
+                    version = int(raw)
+                    self._local.set(key, version)
+                    return version
+            except Exception as e:
+                print(f"Data version Redis read failed: {e}")
+
+        version = db.execute(
+            select(users.c.data_version).where(users.c.id == user_id)
+        ).scalar() or 0
+        self._local.set(key, version)
+        if client is not None:
+            try:
+                client.set(self._redis_key(key), version, ex=self.ttl)
+            except Exception as e:
+                print(f"Data version Redis write failed: {e}")
+        return version
+
+    def invalidate(self, user_ids: Iterable):
+        keys = [str(user_id) for user_id in user_ids]
+        for key in keys:
+            self._local.delete(key)
+        client = get_redis() if self.use_redis else None
+        if client is not None and keys:
+            try:
+                client.delete(*[self._redis_key(key) for key in keys])
+            except Exception as e:
+                print(f"Data version Redis delete failed: {e}")
+
+
+data_versions = DataVersionStore(
+    maxsize=settings.DATA_VERSION_CACHE_MAX_SIZE,
+    ttl=settings.DATA_VERSION_CACHE_TTL_SECONDS,
+    use_redis=settings.DATA_VERSION_CACHE_REDIS,
+)
+
+
+def bump_data_version(db: Session, user_ids: Iterable):
+    """
+    Increment the data version of users whose rows were written outside the
+    ORM (bulk inserts, COPY, Core UPDATEs). ORM flushes are tracked
+    automatically. Takes effect when the session commits.
+    """
+    ids = {user_id for user_id in user_ids if user_id is not None}
+    if not ids:
+        return
+    db.execute(
+        update(users)
+        .where(users.c.id.in_(ids))
+        .values(data_version=users.c.data_version + 1)
+    )
+    db.info.setdefault(_COMMIT_KEY, set()).update(ids)
+
+
+def _owner_id(instance) -> Optional[object]:
+    """Id of the user a mapped row belongs to, if any"""
+    if getattr(instance, "__tablename__", None) == "users":
+        return instance.id
+    return getattr(instance, "user_id", None)
+
+
+def _before_flush(session: Session, flush_context, instances):
+    ids: Set = session.info.setdefault(_PENDING_KEY, set())
+    for instance in session.new:
+        ids.add(_owner_id(instance))
+    for instance in session.deleted:
+        ids.add(_owner_id(instance))
+    for instance in session.dirty:
+        if session.is_modified(instance, include_collections=False):
+            ids.add(_owner_id(instance))
+    ids.discard(None)
+
+
+def _after_flush(session: Session, flush_context):
+    ids = session.info.pop(_PENDING_KEY, None)
+    if ids:
+        bump_data_version(session, ids)
+
+
+def _after_commit(session: Session):
+    ids = session.info.pop(_COMMIT_KEY, None)
+    if ids:
+        data_versions.invalidate(ids)
+
+
+def _after_rollback(session: Session):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_COMMIT_KEY, None)
+
+
+def register_session_events(session_factory):
+    """Track writes to user-owned rows in sessions made by `session_factory`"""
+    event.listen(session_factory, "before_flush", _before_flush)
+    event.listen(session_factory, "after_flush", _after_flush)
+    event.listen(session_factory, "after_commit", _after_commit)
+    event.listen(session_factory, "after_soft_rollback", lambda session, previous_transaction: _after_rollback(session))
+
+
+def make_etag(user_id, version: int, scope: str = "") -> str:
+    """
+    Weak ETag for a user's data at `version`. `scope` carries anything else
+    the response depends on, such as the user's current local date.
+    """
+    digest = hashlib.sha256(f"{user_id}:{version}:{scope}".encode("utf-8")).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    # Weak comparison: W/"x" and "x" match
+    bare = etag[2:] if etag.startswith("W/") else etag
+    return "*" in candidates or any(
+        (candidate[2:] if candidate.startswith("W/") else candidate) == bare
+        for candidate in candidates
+    )
@@ -0,0 +1,38 @@
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Tuple
+import pytz
+
+
+def user_timezone(user) -> tzinfo:
+    """The user's configured timezone, falling back to UTC if unset or unknown"""
+    try:
+        return pytz.timezone(getattr(user, "timezone", None) or "UTC")
+    except pytz.UnknownTimeZoneError:
+        return pytz.utc
+
+
+def user_today(user) -> date:
+    """The current date where the user is"""
+    return datetime.now(user_timezone(user)).date()
+
+
+def day_window(day: date, tz: tzinfo) -> Tuple[datetime, datetime]:
+    """
+    The local calendar day `day` in `tz` as a [start, end) range of UTC
+    datetimes. Filtering `Transaction.date >= start, Transaction.date < end`
+    keeps the indexed column bare, unlike `func.date(Transaction.date)`.
+    """
+    start = tz.localize(datetime.combine(day, time.min))
+    end = tz.localize(datetime.combine(day + timedelta(days=1), time.min))
+    return start.astimezone(pytz.utc), end.astimezone(pytz.utc)
+
+
+def user_day_window(user, days_ago: int = 0) -> Tuple[date, datetime, datetime]:
+    """
+    The user's local day `days_ago` days before today, with its
+    [start, end) UTC range: (day, start, end)
+    """
+    tz = user_timezone(user)
+    day = datetime.now(tz).date() - timedelta(days=days_ago)
+    start, end = day_window(day, tz)
+    return day, start, end
@@ -0,0 +1,46 @@
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_MAX = 0xFFF
+# A fresh millisecond starts the counter somewhere in its lower half, so
+# ids stay unpredictable but there is room to count up
+_COUNTER_SEED_MASK = 0x7FF
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): a 48-bit Unix millisecond
+    timestamp, a 12-bit counter keeping ids from this process increasing
+    within a millisecond (and across clock steps backwards), then 62 random
+    bits. New rows land at the right-hand edge of a primary key index
+    instead of on random pages.
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & _COUNTER_SEED_MASK
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                # Counter exhausted: borrow the next millisecond
+                _last_ms += 1
+                _counter = 0
+        timestamp, counter = _last_ms, _counter
+
+    random_bits = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (timestamp & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random_bits
+    )
+    return uuid.UUID(int=value)
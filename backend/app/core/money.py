@@ -0,0 +1,74 @@
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional, Union
+from sqlalchemy import BigInteger, Numeric, TypeDecorator, type_coerce
+from sqlalchemy.sql import operators
+
+CENTS_PER_DOLLAR = 100
+
+Number = Union[Decimal, float, int, str]
+
+# Operators whose other operand is a plain factor, not an amount of money
+_SCALAR_OPERATORS = {operators.mul, operators.truediv, operators.floordiv, operators.mod}
+_ARITHMETIC_OPERATORS = _SCALAR_OPERATORS | {operators.add, operators.sub}
+
+
+def to_cents(value: Optional[Number]) -> Optional[int]:
+    """Dollars to integer cents, rounding half up"""
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return value * CENTS_PER_DOLLAR
+    # Floats go through their shortest repr, so 1.005 rounds like "1.005"
+    return int(Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def from_cents(cents) -> Optional[float]:
+    """Integer cents (or a numeric aggregate of them) to float dollars"""
+    if cents is None:
+        return None
+    return float(cents) / CENTS_PER_DOLLAR
+
+
+class Money(TypeDecorator):
+    """
+    An amount of money stored as BIGINT cents. Python code reads and writes
+    float dollars; literals compared with or added to a Money column are
+    converted to cents too, while factors (`amount * 2`, `amount / 30`) are
+    left alone.
+
+    sum, min, max and coalesce keep the Money type, but func.avg comes back
+    untyped, i.e. as raw cents (100x too large); use
+    `type_coerce(func.avg(column), Money)` for an average in dollars.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    class comparator_factory(TypeDecorator.Comparator):
+        def _adapt_expression(self, op, other_comparator):
+            # Sums, differences and scaled amounts are still money; a ratio
+            # of two amounts is not
+            if op in _ARITHMETIC_OPERATORS:
+                if op in _SCALAR_OPERATORS and isinstance(other_comparator.type, Money):
+                    return op, Numeric()
+                return op, self.type
+            return super()._adapt_expression(op, other_comparator)
+
+    def process_bind_param(self, value, dialect):
+        return to_cents(value)
+
+    def process_result_value(self, value, dialect):
+        return from_cents(value)
+
+    def coerce_compared_value(self, op, value):
+        if op in _SCALAR_OPERATORS:
+            return Numeric()
+        return self
+
+
+def cents(expression):
+    """
+    A Money column or aggregate as raw integer cents, for sums and other
+    arithmetic done in Python on ints
+    """
+    return type_coerce(expression, BigInteger)
@@ -0,0 +1,32 @@
+from typing import Optional
+from app.core.config import settings
+
+try:
+    import redis
+except ImportError:  # Redis is optional; caches fall back to in-process only
+    redis = None
+
+_clients = {}
+
+
+def redis_client(url: Optional[str]) -> Optional["redis.Redis"]:
+    """
+    Redis client for `url`, shared per URL, or None when the redis package
+    isn't installed or no URL is given. Callers must tolerate connection
+    errors.
+    """
+    if redis is None or not url:
+        return None
+    client = _clients.get(url)
+    if client is None:
+        client = _clients[url] = redis.Redis.from_url(
+            url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    return client
+
+
+def get_redis() -> Optional["redis.Redis"]:
+    """Shared client for settings.REDIS_URL (see redis_client)"""
+    return redis_client(settings.REDIS_URL)
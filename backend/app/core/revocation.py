@@ -0,0 +1,136 @@
+import select
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.models.revoked_token import RevokedToken
+
+NOTIFY_CHANNEL = "token_revoked"
+
+# Revocations this recent are re-added after a rebuild swaps filters, so one
+# committed while the new filter was being built isn't lost (allows for
+# clock skew between the app and the database)
+REBUILD_OVERLAP = timedelta(minutes=1)
+
+
+class RevocationList:
+    """
+    Revoked token ids (jti), stored in the revoked_tokens table with a
+    per-process Bloom filter in front. Most tokens were never revoked, so
+    the common check is a filter miss that needs no query; only filter hits
+    are confirmed against the table.
+
+    The filter is rebuilt from the table on startup and periodically by the
+    scheduler (purging expired rows, so neither keeps growing), and kept
+    current across workers via Postgres LISTEN/NOTIFY.
+    """
+
+    def __init__(self):
+        self._filter = BloomFilter(settings.REVOCATION_BLOOM_CAPACITY)
+        # Until the filter has been loaded, every check goes to the table
+        self._loaded = False
+        self._stop = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+
+    def rebuild(self, db: Session) -> int:
+        """Purge expired rows and rebuild the filter from the rest"""
+        now = datetime.now(timezone.utc)
+        db.query(RevokedToken).filter(RevokedToken.expires_at <= now).delete(synchronize_session=False)
+        db.commit()
+
+        jtis = [jti for (jti,) in db.query(RevokedToken.jti)]
+        bloom = BloomFilter(max(settings.REVOCATION_BLOOM_CAPACITY, len(jtis) * 2))
+        for jti in jtis:
+            bloom.add(jti)
+        self._filter = bloom
+        self._loaded = True
+
+        # Notifications handled before the swap went into the old filter
+        recent = db.query(RevokedToken.jti).filter(RevokedToken.revoked_at >= now - REBUILD_OVERLAP)
+        for (jti,) in recent:
+            bloom.add(jti)
+        db.commit()
+        return len(jtis)
+
+    def is_revoked(self, db: Session, jti: Optional[str]) -> bool:
+        if not jti:
+            return False
+        if self._loaded and jti not in self._filter:
+            return False
+        return db.query(RevokedToken.jti).filter(RevokedToken.jti == jti).first() is not None
+
+    def revoke(self, db: Session, jti: Optional[str], expires_at) -> bool:
+        """
+        Revoke a token until its expiry; commits the session. Returns False
+        if it was already revoked, so the insert doubles as an atomic
+        check-and-revoke.
+        """
+        if not jti:
+            return False
+        if not isinstance(expires_at, datetime):
+            expires_at = datetime.fromtimestamp(expires_at, tz=timezone.utc)
+        inserted = db.execute(
+            insert(RevokedToken)
+            .values(jti=jti, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+            .returning(RevokedToken.jti)
+        ).scalar() is not None
+        if inserted:
+            # Delivered to every listening worker when the transaction commits
+            db.execute(text("SELECT pg_notify(:channel, :jti)"), {"channel": NOTIFY_CHANNEL, "jti": jti})
+        db.commit()
+        self._filter.add(jti)
+        return inserted
+
+    def _listen(self):
+        while not self._stop.is_set():
+            connection = None
+            try:
+                connection = engine.raw_connection()
+                dbapi_connection = connection.dbapi_connection
+                dbapi_connection.autocommit = True  # required for LISTEN
+                cursor = dbapi_connection.cursor()
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                # Anything revoked before LISTEN took effect is picked up here
+                db = SessionLocal()
+                try:
+                    self.rebuild(db)
+                finally:
+                    db.close()
+
+                while not self._stop.is_set():
+                    if select.select([dbapi_connection], [], [], 5) == ([], [], []):
+                        continue
+                    dbapi_connection.poll()
+                    while dbapi_connection.notifies:
+                        notify = dbapi_connection.notifies.pop(0)
+                        self._filter.add(notify.payload)
+            except Exception as e:
+                print(f"Token revocation listener error: {e}")
+                self._stop.wait(5)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.invalidate()
+                    except Exception:
+                        pass
+
+    def start(self):
+        """Load the filter and start following revocations from other workers"""
+        if self._listener is not None:
+            return
+        self._stop.clear()
+        self._listener = threading.Thread(target=self._listen, name="token-revocation", daemon=True)
+        self._listener.start()
+
+    def stop(self):
+        self._stop.set()
+        self._listener = None
+
+
+revocation_list = RevocationList()
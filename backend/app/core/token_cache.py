@@ -0,0 +1,56 @@
+import hashlib
+import time
+from typing import Optional
+from jose import JWTError, jwt
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+class TokenCache:
+    """
+    Bounded cache of verified JWT claims keyed by a digest of the token, so
+    repeated requests with the same bearer token skip signature checks and
+    JSON decoding. Entries never outlive the token's `exp` claim, and only
+    successfully verified tokens are cached.
+    """
+
+    def __init__(self, maxsize: int, max_ttl: float):
+        self.max_ttl = max_ttl
+        self._cache = TTLCache(maxsize=maxsize, ttl=max_ttl)
+
+    @staticmethod
+    def _key(token: str, secret_key: str, algorithm: str) -> bytes:
+        # The key and algorithm are part of the digest so a token verified
+        # under one configuration is never trusted under another.
+        return hashlib.sha256(
+            f"{algorithm}\0{secret_key}\0{token}".encode("utf-8")
+        ).digest()
+
+    def decode(self, token: str, secret_key: str, algorithm: str) -> Optional[dict]:
+        """Verified claims of the token, or None if it is invalid or expired"""
+        key = self._key(token, secret_key, algorithm)
+        claims = self._cache.get(key)
+        if claims is not None:
+            return dict(claims)
+
+        try:
+            claims = jwt.decode(token, secret_key, algorithms=[algorithm])
+        except JWTError:
+            return None
+
+        exp = claims.get("exp")
+        if exp is not None:
+            ttl = min(float(exp) - time.time(), self.max_ttl)
+            if ttl > 0:
+                self._cache.set(key, dict(claims), ttl=ttl)
+        return claims
+
+    def clear(self):
+        self._cache.clear()
+
+
+# Shared by app.core.security and the legacy utils.auth
+token_cache = TokenCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+    max_ttl=settings.TOKEN_CACHE_MAX_TTL_SECONDS,
+)
@@ -0,0 +1,147 @@
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional, Type, TypeVar
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import redis_client
+
+ModelT = TypeVar("ModelT")
+
+# Never cached (and never written to Redis); loaded from the DB on access
+EXCLUDED_COLUMNS = {"hashed_password"}
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return {"$uuid": str(value)}
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, Decimal):
+        return float(value)
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    raise TypeError(f"Can't cache a {type(value).__name__} column")
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$uuid" in value:
+            return uuid.UUID(value["$uuid"])
+        if "$datetime" in value:
+            return datetime.fromisoformat(value["$datetime"])
+    return value
+
+
+def dumps(row: Dict[str, Any]) -> str:
+    """Snapshot as JSON, with UUIDs and datetimes tagged so they round-trip"""
+    return json.dumps({key: _encode(value) for key, value in row.items()})
+
+
+def loads(raw) -> Dict[str, Any]:
+    return {key: _decode(value) for key, value in json.loads(raw).items()}
+
+
+class UserCache:
+    """
+    Cache of user rows keyed by id, so authenticated requests don't query
+    the users table every time. Rows are kept as plain column snapshots in
+    an in-process LRU+TTL cache, optionally backed by Redis so workers share
+    fills and invalidations.
+
+    Both the legacy and v1 User models map the users table, so a snapshot
+    written by one stack is usable by the other. Redis holds JSON, never
+    pickles, so whoever can write to it can't run code in the API.
+    """
+
+    # With Redis, the in-process layer only holds rows briefly so that
+    # invalidations made by other workers take effect quickly.
+    LOCAL_TTL_WITH_REDIS = 5
+
+    def __init__(self, maxsize: int, ttl: int, redis_url: Optional[str] = None):
+        self.ttl = ttl
+        self.redis_url = redis_url
+        self.use_redis = bool(redis_url)
+        local_ttl = min(ttl, self.LOCAL_TTL_WITH_REDIS) if self.use_redis else ttl
+        self._local = TTLCache(maxsize=maxsize, ttl=local_ttl)
+
+    def _redis_key(self, key: str) -> str:
+        # v2: JSON snapshots; the unversioned keys held pickles and are never read
+        return f"user-cache:v2:{key}"
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._local.get(key)
+        if row is not None or not self.use_redis:
+            return row
+        client = redis_client(self.redis_url)
+        if client is None:
+            return None
+        try:
+            raw = client.get(self._redis_key(key))
+        except Exception as e:
+            print(f"User cache Redis read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        try:
+            row = loads(raw)
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"User cache entry for {key} is unreadable: {e}")
+            return None
+        self._local.set(key, row)
+        return row
+
+    def get(self, db: Session, model: Type[ModelT], user_id) -> Optional[ModelT]:
+        """
+        Return the cached user attached to `db` without querying, or None on
+        a miss. The instance behaves like a freshly loaded row, so lazy
+        attributes and commits work as usual.
+        """
+        row = self._load(str(user_id))
+        if row is None:
+            return None
+        columns = {attr.key for attr in inspect(model).column_attrs} - EXCLUDED_COLUMNS
+        if not columns <= row.keys():
+            return None
+        user = model(**{key: row[key] for key in columns})
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    def put(self, user):
+        """Cache a user row that was just loaded from the database"""
+        row = {
+            attr.key: getattr(user, attr.key)
+            for attr in inspect(user).mapper.column_attrs
+            if attr.key not in EXCLUDED_COLUMNS
+        }
+        key = str(user.id)
+        self._local.set(key, row)
+        if self.use_redis:
+            client = redis_client(self.redis_url)
+            if client is not None:
+                try:
+                    client.set(self._redis_key(key), dumps(row), ex=self.ttl)
+                except Exception as e:
+                    print(f"User cache Redis write failed: {e}")
+
+    def invalidate(self, user_id):
+        """Drop a user after their row changed"""
+        key = str(user_id)
+        self._local.delete(key)
+        if self.use_redis:
+            client = redis_client(self.redis_url)
+            if client is not None:
+                try:
+                    client.delete(self._redis_key(key))
+                except Exception as e:
+                    print(f"User cache Redis delete failed: {e}")
+
+
+user_cache = UserCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    redis_url=settings.REDIS_URL if settings.USER_CACHE_REDIS else None,
+)
@@ -1,7 +1,14 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+from app.core.categories import UnknownCategory
 from app.core.config import settings
+from app.core.data_version import NotModified
+from app.core.revocation import revocation_list
+from app.services.report_jobs import report_jobs
+from app.services.scheduler import init_scheduler, shutdown_scheduler
 from app.api.v1.router import api_router
 import os
 
@@ -9,14 +16,38 @@ import os
 UPLOAD_DIR = "/app/uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup and shutdown events"""
+    revocation_list.start()
+    init_scheduler()
+    yield
+    shutdown_scheduler()
+    report_jobs.shutdown()
+    revocation_list.stop()
+
+
 app = FastAPI(
     title="Finance App API",
     description="Behavior-driven personal finance application",
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    lifespan=lifespan,
 )
 
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified):
+    return Response(
+        status_code=304,
+        headers={"ETag": exc.etag, "Cache-Control": "private, no-cache"}
+    )
+
+@app.exception_handler(UnknownCategory)
+async def unknown_category_handler(request: Request, exc: UnknownCategory):
+    return JSONResponse(status_code=422, content={"detail": str(exc)})
+
 # Mount static files for uploaded images
 app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
 
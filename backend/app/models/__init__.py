@@ -1,4 +1,5 @@
 from app.models.user import User
+from app.models.category import Category
 from app.models.transaction import Transaction
 from app.models.reflection import Reflection
 from app.models.goal import Goal
@@ -9,9 +10,12 @@ from app.models.rollover import BudgetRollover
 from app.models.celebration import Celebration
 from app.models.income import Income
 from app.models.avoided_impulse import AvoidedImpulse
+from app.models.revoked_token import RevokedToken
+from app.models.peer_benchmark import PeerBenchmark
 
 __all__ = [
     "User",
+    "Category",
     "Transaction",
     "Reflection",
     "Goal",
@@ -22,4 +26,6 @@ __all__ = [
     "Celebration",
     "Income",
     "AvoidedImpulse",
+    "RevokedToken",
+    "PeerBenchmark",
 ]
@@ -1,15 +1,16 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from app.core.categories import CategoryMixin
+from app.core.money import Money
 from app.core.database import Base
 
-class AvoidedImpulse(Base):
+class AvoidedImpulse(CategoryMixin, Base):
     __tablename__ = "avoided_impulses"
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    amount = Column(Float, nullable=False)
-    category = Column(String, nullable=False)
+    amount = Column(Money, nullable=False)
     description = Column(Text, nullable=True)
     avoided_at = Column(DateTime, default=datetime.utcnow, nullable=False)
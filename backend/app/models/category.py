@@ -0,0 +1,10 @@
+from sqlalchemy import Column, SmallInteger, String
+from app.core.database import Base
+
+
+class Category(Base):
+    """Lookup table behind CategoryMixin; names are shared by all users"""
+    __tablename__ = "categories"
+
+    id = Column(SmallInteger, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
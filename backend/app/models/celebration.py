@@ -1,8 +1,8 @@
 from sqlalchemy import Column, Boolean, DateTime, ForeignKey, Enum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
-import uuid
 import enum
+from app.core.ids import uuid7
 from app.core.database import Base
 
 
@@ -18,7 +18,7 @@ class MilestoneType(str, enum.Enum):
 class Celebration(Base):
     __tablename__ = "celebrations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     milestone_type = Column(Enum(MilestoneType), nullable=False, index=True)
@@ -1,19 +1,20 @@
-from sqlalchemy import Column, String, Numeric, Date, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, String, Date, DateTime, ForeignKey, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
-import uuid
+from app.core.money import Money
+from app.core.ids import uuid7
 from app.core.database import Base
 
 
 class Goal(Base):
     __tablename__ = "goals"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     name = Column(String, nullable=False)
-    current = Column(Numeric(10, 2), nullable=False, default=0)
-    target = Column(Numeric(10, 2), nullable=False)
+    current = Column(Money, nullable=False, default=0)
+    target = Column(Money, nullable=False)
     color = Column(String, nullable=False, default="bg-blue-500")
     deadline = Column(Date, nullable=True)
     
@@ -1,19 +1,20 @@
-from sqlalchemy import Column, String, Numeric, DateTime, Date, Text
+from sqlalchemy import Column, String, DateTime, Date, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import ForeignKey
 from sqlalchemy.sql import func
-import uuid
+from app.core.money import Money
+from app.core.ids import uuid7
 from app.core.database import Base
 
 
 class Income(Base):
     __tablename__ = "incomes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     
     # Income details
-    amount = Column(Numeric(10, 2), nullable=False)
+    amount = Column(Money, nullable=False)
     source = Column(String, nullable=False)  # e.g., "Gift", "Freelance", "Side Job", "Bonus"
     description = Column(Text, nullable=True)
     date = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, Float, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class PeerBenchmark(Base):
+    """Distribution of one metric across all users, recomputed nightly"""
+    __tablename__ = "peer_benchmarks"
+
+    metric = Column(String(32), primary_key=True)
+    # Value at each percentile from 0 to 100, ascending
+    quantiles = Column(ARRAY(Float), nullable=False)
+    sample_size = Column(Integer, nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,14 +1,21 @@
-from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey, UniqueConstraint, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
-import uuid
+from app.core.ids import uuid7
 from app.core.database import Base
 
+# Text searched by /search; ix_reflections_search indexes exactly this
+# expression, so queries must use it verbatim
+SEARCH_DOCUMENT = (
+    "to_tsvector('english', coalesce(regret_purchase, '') || ' ' || "
+    "coalesce(good_purchase, '') || ' ' || coalesce(notes, ''))"
+)
+
 
 class Reflection(Base):
     __tablename__ = "reflections"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     date = Column(Date, nullable=False, index=True)
@@ -16,9 +23,17 @@ class Reflection(Base):
     good_purchase = Column(Text, nullable=True)
     notes = Column(Text, nullable=True)
     
+    # LLM analysis, computed in the background when the reflection is written.
+    # analysis_hash is the content hash the analysis was computed from.
+    analysis_triggers = Column(JSONB, nullable=True)
+    analysis_suggestions = Column(JSONB, nullable=True)
+    analysis_hash = Column(String(64), nullable=True)
+    analyzed_at = Column(DateTime(timezone=True), nullable=True)
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     __table_args__ = (
         UniqueConstraint('user_id', 'date', name='unique_user_daily_reflection'),
+        Index('ix_reflections_search', text(SEARCH_DOCUMENT), postgresql_using='gin'),
     )
@@ -1,21 +1,33 @@
-from sqlalchemy import Column, String, Numeric, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Boolean, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
-import uuid
+from app.core.categories import CategoryMixin
+from app.core.money import Money
+from app.core.ids import uuid7
 from app.core.database import Base
 
 
-class Transaction(Base):
+class Transaction(CategoryMixin, Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Nearly every query is one user's transactions over a date range
+        Index("ix_transactions_user_id_date", "user_id", "date"),
+        Index("ix_transactions_user_id_category_date", "user_id", "category_id", "date"),
+        Index("ix_transactions_user_id_date_impulse", "user_id", "date", postgresql_where=text("is_impulse")),
+        # Trigram search over notes (requires pg_trgm)
+        Index("ix_transactions_note_trgm", "note", postgresql_using="gin", postgresql_ops={"note": "gin_trgm_ops"}),
+        # Monthly partitions, maintained by app.services.partitions
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
-    amount = Column(Numeric(10, 2), nullable=False)
-    category = Column(String, nullable=False, index=True)
-    date = Column(DateTime(timezone=True), nullable=False, index=True, server_default=func.now())
+    amount = Column(Money, nullable=False)
+    # Part of the primary key because the table is partitioned on it
+    date = Column(DateTime(timezone=True), primary_key=True, index=True, server_default=func.now())
     
-    is_impulse = Column(Boolean, default=False, index=True)
+    is_impulse = Column(Boolean, default=False)
     note = Column(Text, nullable=True)
     emergency_reason = Column(Text, nullable=True)  # For emergency pause overrides
     
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, String, Numeric, DateTime
+from sqlalchemy import BigInteger, Column, String, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
+from app.core.money import Money
 from app.core.database import Base
 
 
@@ -14,12 +15,15 @@ class User(Base):
     name = Column(String, nullable=False)
     
     # Financial settings
-    monthly_income = Column(Numeric(10, 2), nullable=False, default=0)
-    fixed_expenses = Column(Numeric(10, 2), nullable=False, default=0)
+    monthly_income = Column(Money, nullable=False, default=0)
+    fixed_expenses = Column(Money, nullable=False, default=0)
     
     # Timezone for accurate midnight calculations
     timezone = Column(String, default="UTC")
     
+    # Bumped on every write to the user's data; backs ETags
+    data_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
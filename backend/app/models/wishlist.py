@@ -1,8 +1,9 @@
-from sqlalchemy import Column, String, Numeric, Integer, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
-import uuid
 import enum
+from app.core.money import Money
+from app.core.ids import uuid7
 from app.core.database import Base
 
 
@@ -16,11 +17,11 @@ class WishlistStatus(str, enum.Enum):
 class WishlistItem(Base):
     __tablename__ = "wishlist_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     name = Column(String, nullable=False)
-    price = Column(Numeric(10, 2), nullable=False)
+    price = Column(Money, nullable=False)
     image_url = Column(String, nullable=True)
     cooldown_days = Column(Integer, nullable=False)
     status = Column(Enum(WishlistStatus), default=WishlistStatus.WAITING, index=True)
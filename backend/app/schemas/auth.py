@@ -1,30 +1,30 @@
 from pydantic import BaseModel, EmailStr, field_serializer
 from typing import Optional
 from datetime import datetime
-from decimal import Decimal
 from uuid import UUID
+from app.schemas.money import Money
 
 
 class UserCreate(BaseModel):
     email: EmailStr
     password: str
     name: str
-    monthly_income: Optional[Decimal] = None
-    fixed_expenses: Optional[Decimal] = None
+    monthly_income: Optional[Money] = None
+    fixed_expenses: Optional[Money] = None
 
 
 class UserUpdate(BaseModel):
     name: Optional[str] = None
-    monthly_income: Optional[Decimal] = None
-    fixed_expenses: Optional[Decimal] = None
+    monthly_income: Optional[Money] = None
+    fixed_expenses: Optional[Money] = None
 
 
 class UserResponse(BaseModel):
     id: UUID
     email: str
     name: str
-    monthly_income: Decimal
-    fixed_expenses: Decimal
+    monthly_income: Money
+    fixed_expenses: Money
     created_at: datetime
     
     @field_serializer('id')
@@ -39,3 +39,11 @@ class Token(BaseModel):
     access_token: str
     refresh_token: str
     token_type: str
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    refresh_token: Optional[str] = None
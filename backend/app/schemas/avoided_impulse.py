@@ -2,10 +2,11 @@ from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
+from app.schemas.category import Category
 
 class AvoidedImpulseCreate(BaseModel):
     amount: float
-    category: str
+    category: Category
     description: Optional[str] = None
 
 class AvoidedImpulseResponse(BaseModel):
@@ -1,20 +1,20 @@
 from datetime import date, datetime
-from decimal import Decimal
 from typing import List
 from pydantic import BaseModel, Field, ConfigDict
+from app.schemas.money import Money
 
 
 class BudgetResponse(BaseModel):
-    daily_budget: Decimal
-    rollover_amount: Decimal
-    available_today: Decimal
-    spent_today: Decimal
-    remaining_today: Decimal
+    daily_budget: Money
+    rollover_amount: Money
+    available_today: Money
+    spent_today: Money
+    remaining_today: Money
 
 
 class BudgetRolloverResponse(BaseModel):
     date: date
-    unused_amount: Decimal
+    unused_amount: Money
     rollover_applied: bool
     created_at: datetime
     
@@ -23,8 +23,8 @@ class BudgetRolloverResponse(BaseModel):
 
 class BudgetHistoryResponse(BaseModel):
     rollovers: List[BudgetRolloverResponse]
-    total_rollover: Decimal
-    max_rollover: Decimal  # 3 days worth
+    total_rollover: Money
+    max_rollover: Money  # 3 days worth
     days_saved: int
 
 
@@ -32,7 +32,7 @@ class StreakResponse(BaseModel):
     current_streak: int
     longest_streak: int
     impulses_avoided: int
-    rollover_budget: Decimal
+    rollover_budget: Money
     last_streak_date: date
     
     model_config = ConfigDict(from_attributes=True)
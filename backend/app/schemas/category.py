@@ -0,0 +1,13 @@
+from typing import Annotated
+from pydantic import AfterValidator, StringConstraints
+from app.core.categories import category_registry
+
+
+def _known_category(value: str) -> str:
+    if not category_registry.known(value):
+        raise ValueError("Unknown category")
+    return value
+
+
+# A name from the categories lookup table
+Category = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=50), AfterValidator(_known_category)]
@@ -1,12 +1,13 @@
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
+from app.schemas.category import Category
+from app.schemas.money import Money
 
 
 class CategoryLimitBase(BaseModel):
-    category: str = Field(..., min_length=1, max_length=50)
-    monthly_limit: Decimal = Field(..., gt=0, description="Monthly spending limit")
+    category: Category
+    monthly_limit: Money = Field(..., gt=0, description="Monthly spending limit")
 
 
 class CategoryLimitCreate(CategoryLimitBase):
@@ -14,13 +15,13 @@ class CategoryLimitCreate(CategoryLimitBase):
 
 
 class CategoryLimitUpdate(BaseModel):
-    monthly_limit: Optional[Decimal] = Field(None, gt=0)
+    monthly_limit: Optional[Money] = Field(None, gt=0)
 
 
 class CategoryLimitResponse(CategoryLimitBase):
     id: str
     user_id: str
-    spent: Decimal
+    spent: Money
     reset_date: datetime
     created_at: datetime
     updated_at: datetime
@@ -30,9 +31,9 @@ class CategoryLimitResponse(CategoryLimitBase):
 
 class CategoryLimitStatusResponse(BaseModel):
     category: str
-    monthly_limit: Decimal
-    spent: Decimal
-    remaining: Decimal
+    monthly_limit: Money
+    spent: Money
+    remaining: Money
     percentage_used: float
     is_exceeded: bool
 
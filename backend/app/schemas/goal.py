@@ -1,24 +1,24 @@
 from datetime import date, datetime
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
+from app.schemas.money import Money
 
 
 class GoalBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
-    target: Decimal = Field(..., gt=0, description="Target amount")
+    target: Money = Field(..., gt=0, description="Target amount")
     color: str = Field(..., min_length=1, max_length=20)
     deadline: Optional[date] = None
 
 
 class GoalCreate(GoalBase):
-    current: Decimal = Field(default=Decimal(0), ge=0)
+    current: Money = Field(default=0, ge=0)
 
 
 class GoalUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    current: Optional[Decimal] = Field(None, ge=0)
-    target: Optional[Decimal] = Field(None, gt=0)
+    current: Optional[Money] = Field(None, ge=0)
+    target: Optional[Money] = Field(None, gt=0)
     color: Optional[str] = Field(None, min_length=1, max_length=20)
     deadline: Optional[date] = None
 
@@ -26,7 +26,7 @@ class GoalUpdate(BaseModel):
 class GoalResponse(GoalBase):
     id: str
     user_id: str
-    current: Decimal
+    current: Money
     created_at: datetime
     updated_at: datetime
     
@@ -36,5 +36,5 @@ class GoalResponse(GoalBase):
 class GoalProgressResponse(BaseModel):
     goal: GoalResponse
     percentage: float
-    remaining: Decimal
+    remaining: Money
     days_until_deadline: Optional[int] = None
@@ -1,8 +1,8 @@
 from datetime import date, datetime
-from decimal import Decimal
 from typing import Optional, List
 from uuid import UUID
 from pydantic import BaseModel, Field, field_serializer, ConfigDict
+from app.schemas.money import Money
 
 
 # Common income sources
@@ -20,7 +20,7 @@ INCOME_SOURCES = [
 
 
 class IncomeBase(BaseModel):
-    amount: Decimal = Field(..., gt=0, description="Income amount (must be positive)")
+    amount: Money = Field(..., gt=0, description="Income amount (must be positive)")
     source: str = Field(..., min_length=1, description="Source of income")
     description: Optional[str] = None
     date: datetime
@@ -31,7 +31,7 @@ class IncomeCreate(IncomeBase):
 
 
 class IncomeUpdate(BaseModel):
-    amount: Optional[Decimal] = Field(None, gt=0)
+    amount: Optional[Money] = Field(None, gt=0)
     source: Optional[str] = None
     description: Optional[str] = None
     date: Optional[datetime] = None
@@ -52,11 +52,11 @@ class IncomeResponse(IncomeBase):
 class IncomeListResponse(BaseModel):
     incomes: List[IncomeResponse]
     total: int
-    total_amount: Decimal
+    total_amount: Money
 
 
 class IncomeSummaryResponse(BaseModel):
-    total_this_month: Decimal
-    total_this_year: Decimal
-    by_source: dict[str, Decimal]
+    total_this_month: Money
+    total_this_year: Money
+    by_source: dict[str, Money]
     recent_incomes: List[IncomeResponse]
@@ -0,0 +1,18 @@
+from decimal import InvalidOperation
+from typing import Annotated, Any
+from pydantic import BeforeValidator, Field
+from app.core.money import from_cents, to_cents
+
+
+def _round_to_cents(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    try:
+        # Via the decimal string, so 12.345 rounds up like "12.345" does
+        return from_cents(to_cents(str(value)))
+    except (InvalidOperation, ValueError):
+        return value  # Left for float validation to reject
+
+
+# Dollar amounts, rounded to whole cents like the Money columns storing them
+Money = Annotated[float, BeforeValidator(_round_to_cents), Field(allow_inf_nan=False)]
@@ -1,12 +1,13 @@
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict
+from app.schemas.category import Category
+from app.schemas.money import Money
 
 
 class TransactionBase(BaseModel):
-    amount: Decimal = Field(..., gt=0, description="Transaction amount (must be positive)")
-    category: str = Field(..., min_length=1, max_length=50)
+    amount: Money = Field(..., gt=0, description="Transaction amount (must be positive)")
+    category: Category
     description: Optional[str] = Field(None, max_length=255)
     is_impulse: bool = False
     emergency_reason: Optional[str] = Field(None, max_length=255)
@@ -16,9 +17,19 @@ class TransactionCreate(TransactionBase):
     pass
 
 
+class TransactionPayload(BaseModel):
+    """A new transaction as the frontend posts it, alternate field names included"""
+    amount: Money = Field(..., gt=0)
+    category: Category
+    date: Optional[datetime] = None
+    is_impulse: bool = Field(False, validation_alias=AliasChoices("is_impulse_buy", "is_impulse"))
+    note: Optional[str] = Field(None, max_length=255, validation_alias=AliasChoices("notes", "note"))
+    emergency_reason: Optional[str] = Field(None, max_length=255)
+
+
 class TransactionUpdate(BaseModel):
-    amount: Optional[Decimal] = Field(None, gt=0)
-    category: Optional[str] = Field(None, min_length=1, max_length=50)
+    amount: Optional[Money] = Field(None, gt=0)
+    category: Optional[Category] = None
     description: Optional[str] = Field(None, max_length=255)
     is_impulse: Optional[bool] = None
     emergency_reason: Optional[str] = Field(None, max_length=255)
@@ -33,8 +44,8 @@ class TransactionResponse(TransactionBase):
 
 
 class TransactionStatsResponse(BaseModel):
-    total_spent: Decimal
+    total_spent: Money
     impulse_count: int
-    impulse_amount: Decimal
-    average_transaction: Decimal
+    impulse_amount: Money
+    average_transaction: Money
     transactions_count: int
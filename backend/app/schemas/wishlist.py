@@ -1,9 +1,9 @@
 from datetime import date, datetime
-from decimal import Decimal
 from typing import Optional
 from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict, field_serializer
 from uuid import UUID
+from app.schemas.money import Money
 
 
 class WishlistStatus(str, Enum):
@@ -15,7 +15,7 @@ class WishlistStatus(str, Enum):
 
 class WishlistItemBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
-    price: Decimal = Field(..., gt=0, description="Item price")
+    price: Money = Field(..., gt=0, description="Item price")
 
 
 class WishlistItemCreate(WishlistItemBase):
@@ -26,7 +26,7 @@ class WishlistItemCreate(WishlistItemBase):
 
 class WishlistItemUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    price: Optional[Decimal] = Field(None, gt=0)
+    price: Optional[Money] = Field(None, gt=0)
     image_url: Optional[str] = Field(None, max_length=500)
     status: Optional[WishlistStatus] = None
 
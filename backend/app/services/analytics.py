@@ -0,0 +1,237 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Optional, Tuple, Union
+from sqlalchemy import func, text, tuple_
+from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.core.categories import category_registry
+from app.core.config import settings
+from app.core.data_version import data_versions
+from app.core.money import Number, from_cents, to_cents
+from app.models.transaction import Transaction
+
+When = Union[date, datetime]
+
+# Longest range a heat map covers (a leap year)
+MAX_HEAT_MAP_DAYS = 366
+
+# Results are keyed by the user's data version, so a write makes the old
+# entries unreachable rather than stale; the TTL only bounds memory
+_cache = TTLCache(maxsize=settings.ANALYTICS_CACHE_MAX_SIZE, ttl=settings.ANALYTICS_CACHE_TTL_SECONDS)
+
+
+def _cached(db: Session, user_id, name: str, args: tuple, compute: Callable):
+    key = (name, str(user_id), data_versions.get(db, user_id), args)
+    value = _cache.get(key)
+    if value is None:
+        value = compute()
+        _cache.set(key, value)
+    return value
+
+
+def _period(start: Optional[When], end: Optional[When]) -> list:
+    """Conditions for start <= date < end; either bound may be open"""
+    conditions = []
+    if start is not None:
+        conditions.append(Transaction.date >= start)
+    if end is not None:
+        conditions.append(Transaction.date < end)
+    return conditions
+
+
+@dataclass(frozen=True)
+class SpendingSummary:
+    """Aggregates of a user's transactions over a period"""
+    total: float = 0.0
+    count: int = 0
+    # (category, amount), largest first
+    categories: Tuple[Tuple[str, float], ...] = ()
+    impulse_total: float = 0.0
+    impulse_count: int = 0
+
+    @property
+    def impulse_average(self) -> float:
+        return self.impulse_total / self.impulse_count if self.impulse_count > 0 else 0
+
+    @property
+    def top_category(self) -> Tuple[str, float]:
+        return self.categories[0] if self.categories else ("Other", 0)
+
+
+@dataclass(frozen=True)
+class DaySpending:
+    day: date
+    spent: float = 0.0
+    impulses: int = 0
+
+
+@dataclass(frozen=True)
+class HeatMapDay:
+    day: date
+    spent: float
+    percentage: float  # of the daily limit
+    status: str  # safe (<= 50%), ok (<= 80%), warning (<= 100%) or over
+
+
+@dataclass(frozen=True)
+class PeriodComparison:
+    """Spending in a period and in the one before it"""
+    current: float
+    previous: float
+
+    @property
+    def change(self) -> float:
+        """Positive when less was spent than in the previous period"""
+        return self.previous - self.current
+
+    @property
+    def percentage_change(self) -> float:
+        return self.change / self.previous * 100 if self.previous > 0 else 0
+
+
+def spending_summary(db: Session, user_id, start: Optional[When], end: Optional[When] = None) -> SpendingSummary:
+    """
+    Total, per-category and impulse spending of a user from `start` (up to
+    `end`, exclusive, if given) in one grouped query: GROUPING SETS over
+    (), (category) and (impulse), so only a few aggregate rows come back
+    however many transactions there are.
+    """
+    def compute() -> SpendingSummary:
+        rows = db.query(
+            Transaction.category_id,
+            Transaction.is_impulse,
+            func.grouping(Transaction.category_id).label("all_categories"),
+            func.grouping(Transaction.is_impulse).label("all_impulse"),
+            # The () row comes back even without transactions, summing NULL
+            func.coalesce(func.sum(Transaction.amount), 0).label("amount"),
+            func.count().label("count"),
+        ).filter(Transaction.user_id == user_id, *_period(start, end)).group_by(
+            func.grouping_sets(tuple_(), tuple_(Transaction.category_id), tuple_(Transaction.is_impulse))
+        ).all()
+
+        fields = {}
+        categories = []
+        for row in rows:
+            if row.all_categories and row.all_impulse:
+                fields.update(total=row.amount, count=row.count)
+            elif not row.all_categories:
+                categories.append((category_registry.name(row.category_id), row.amount))
+            elif row.is_impulse:
+                fields.update(impulse_total=row.amount, impulse_count=row.count)
+        categories.sort(key=lambda x: x[1], reverse=True)
+        return SpendingSummary(categories=tuple(categories), **fields)
+
+    return _cached(db, user_id, "spending_summary", (start, end), compute)
+
+
+def category_totals(db: Session, user_id, start: Optional[When], end: Optional[When] = None) -> Dict[str, float]:
+    """Spending per category name; shares spending_summary's query and cache entry"""
+    return dict(spending_summary(db, user_id, start, end).categories)
+
+
+def impulse_stats(db: Session, user_id, start: Optional[When] = None, end: Optional[When] = None) -> Tuple[int, float]:
+    """(count, total) of impulse purchases; shares spending_summary's query"""
+    summary = spending_summary(db, user_id, start, end)
+    return summary.impulse_count, summary.impulse_total
+
+
+def spent_between(db: Session, user_id, start: When, end: When) -> float:
+    """Total a user spent in [start, end)"""
+    def compute() -> float:
+        spent = db.query(func.sum(Transaction.amount)).filter(
+            Transaction.user_id == user_id, *_period(start, end)
+        ).scalar()
+        return float(spent or 0.0)
+
+    return _cached(db, user_id, "spent_between", (start, end), compute)
+
+
+def daily_series(db: Session, user_id, start: date, end: date) -> Tuple[DaySpending, ...]:
+    """
+    Spending and impulse purchases per day from `start` to `end`, both
+    inclusive, one entry per day (zeros for days without transactions)
+    """
+    def compute() -> Tuple[DaySpending, ...]:
+        day = func.date(Transaction.date)
+        rows = db.query(
+            day.label("day"),
+            func.sum(Transaction.amount).label("spent"),
+            func.count().filter(Transaction.is_impulse == True).label("impulses"),
+        ).filter(
+            Transaction.user_id == user_id, *_period(start, end + timedelta(days=1))
+        ).group_by(day).all()
+        by_day = {row.day: row for row in rows}
+        series = []
+        for offset in range((end - start).days + 1):
+            current = start + timedelta(days=offset)
+            row = by_day.get(current)
+            series.append(DaySpending(current, row.spent, row.impulses) if row else DaySpending(current))
+        return tuple(series)
+
+    return _cached(db, user_id, "daily_series", (start, end), compute)
+
+
+def period_comparison(db: Session, user_id, start: When, previous_start: When, end: When) -> PeriodComparison:
+    """Spending in [start, end) against [previous_start, start), in one scan"""
+    def compute() -> PeriodComparison:
+        current, previous = db.query(
+            func.sum(Transaction.amount).filter(Transaction.date >= start),
+            func.sum(Transaction.amount).filter(Transaction.date < start),
+        ).filter(Transaction.user_id == user_id, *_period(previous_start, end)).one()
+        return PeriodComparison(float(current or 0), float(previous or 0))
+
+    return _cached(db, user_id, "period_comparison", (start, previous_start, end), compute)
+
+
+# Every day of the range from generate_series, left joined to the per-day
+# sums, classified against the daily limit in integer cents
+HEAT_MAP_SQL = text("""
+    WITH spent AS (
+        SELECT date(t.date) AS day, SUM(t.amount) AS cents
+        FROM transactions t
+        WHERE t.user_id = :user_id
+          AND t.date >= :start
+          AND t.date < CAST(:end AS date) + 1
+        GROUP BY 1
+    )
+    SELECT
+        d.day,
+        COALESCE(spent.cents, 0) AS cents,
+        CASE WHEN :limit_cents > 0 THEN COALESCE(spent.cents, 0) * 100.0 / :limit_cents ELSE 0 END AS percentage,
+        CASE
+            WHEN COALESCE(spent.cents, 0) * 2 <= :limit_cents THEN 'safe'
+            WHEN COALESCE(spent.cents, 0) * 5 <= :limit_cents * 4 THEN 'ok'
+            WHEN COALESCE(spent.cents, 0) <= :limit_cents THEN 'warning'
+            ELSE 'over'
+        END AS status
+    FROM (
+        SELECT CAST(g AS date) AS day
+        FROM generate_series(CAST(:start AS date), CAST(:end AS date), interval '1 day') AS g
+    ) d
+    LEFT JOIN spent ON spent.day = d.day
+    ORDER BY d.day
+""")
+
+
+def heat_map(db: Session, user_id, start: date, end: date, daily_limit: Number) -> Tuple[HeatMapDay, ...]:
+    """
+    Each day from `start` to `end` (inclusive, at most MAX_HEAT_MAP_DAYS)
+    with its spending classified against `daily_limit`, built entirely in
+    SQL. Cached by data version: rows can be backdated (statement imports,
+    edits and deletes of old transactions), so past days aren't immutable.
+    """
+    if (end - start).days + 1 > MAX_HEAT_MAP_DAYS:
+        raise ValueError(f"Heat maps cover at most {MAX_HEAT_MAP_DAYS} days")
+    limit_cents = to_cents(daily_limit or 0)
+
+    def compute() -> Tuple[HeatMapDay, ...]:
+        rows = db.execute(
+            HEAT_MAP_SQL,
+            {"user_id": user_id, "start": start, "end": end, "limit_cents": limit_cents}
+        ).all()
+        return tuple(
+            HeatMapDay(row.day, from_cents(row.cents), float(row.percentage), row.status)
+            for row in rows
+        )
+
+    return _cached(db, user_id, "heat_map", (start, end, limit_cents), compute)
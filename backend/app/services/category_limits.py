@@ -0,0 +1,110 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional, Union
+from sqlalchemy import func, text, update
+from sqlalchemy.orm import Session
+from app.core.data_version import bump_data_version
+from app.core.money import Number, from_cents, to_cents
+from app.models.category_limit import CategoryLimit
+
+
+
+def current_period_start() -> date:
+    """First day of the period `spent` covers; limits are reset monthly"""
+    return date.today().replace(day=1)
+
+
+def in_current_period(when: Optional[Union[date, datetime]]) -> bool:
+    """True if a transaction dated `when` counts towards the current `spent`"""
+    if when is None:
+        return True
+    if isinstance(when, datetime):
+        when = when.date()
+    return when >= current_period_start()
+
+
+def adjust_spent(
+    db: Session,
+    user_id,
+    category: Optional[str],
+    delta: Number,
+    when: Optional[Union[date, datetime]] = None
+):
+    """
+    Add `delta` to a category limit's spent with a single UPDATE, so
+    concurrent transactions can't overwrite each other's changes. Never goes
+    below zero. Transactions dated before the current period are ignored.
+    Does not commit.
+    """
+    if not category or not delta or not in_current_period(when):
+        return
+    db.execute(
+        update(CategoryLimit)
+        .where(
+            CategoryLimit.user_id == user_id,
+            CategoryLimit.category == category
+        )
+        .values(spent=func.greatest(CategoryLimit.spent + delta, 0))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def adjust_spent_by_category(db: Session, user_id, deltas: Dict[str, Number]):
+    """adjust_spent for several categories at once, e.g. after a bulk insert"""
+    for category, delta in deltas.items():
+        adjust_spent(db, user_id, category, delta)
+
+
+def move_spent(
+    db: Session,
+    user_id,
+    old_category: str,
+    old_amount: Number,
+    old_date,
+    new_category: str,
+    new_amount: Number,
+    new_date
+):
+    """Apply an edit of a transaction's amount, category or date to spent"""
+    if old_category == new_category and in_current_period(old_date) == in_current_period(new_date):
+        adjust_spent(db, user_id, new_category, from_cents(to_cents(new_amount) - to_cents(old_amount)), new_date)
+        return
+    adjust_spent(db, user_id, old_category, -old_amount, old_date)
+    adjust_spent(db, user_id, new_category, new_amount, new_date)
+
+
+# Recomputes every counter from raw transactions in one grouped scan and
+# corrects the ones that drifted, returning what was changed
+RECONCILE_SQL = text("""
+    UPDATE category_limits AS cl
+    SET spent = totals.actual
+    FROM (
+        SELECT cl.id, cl.spent AS recorded, COALESCE(SUM(t.amount), 0) AS actual
+        FROM category_limits cl
+        LEFT JOIN transactions t
+            ON t.user_id = cl.user_id
+            AND t.category_id = cl.category_id
+            AND t.date >= :period_start
+        GROUP BY cl.id, cl.spent
+    ) AS totals, categories c
+    WHERE cl.id = totals.id AND c.id = cl.category_id AND totals.recorded <> totals.actual
+    RETURNING cl.user_id, c.name AS category, totals.recorded, totals.actual
+""")
+
+
+def reconcile_spent(db: Session) -> List[dict]:
+    """
+    Verify every category limit's spent against its transactions and fix
+    any that drifted. Commits; returns the corrected counters.
+    """
+    rows = db.execute(RECONCILE_SQL, {"period_start": current_period_start()}).all()
+    bump_data_version(db, {row.user_id for row in rows})
+    db.commit()
+    return [
+        {
+            "user_id": str(row.user_id),
+            "category": row.category,
+            "recorded": from_cents(row.recorded),
+            "actual": from_cents(row.actual),
+        }
+        for row in rows
+    ]
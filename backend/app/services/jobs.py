@@ -0,0 +1,76 @@
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from app.core.cache import TTLCache
+
+# Finished jobs stay queryable for a day
+JOB_TTL_SECONDS = 24 * 60 * 60
+MAX_JOBS = 10000
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class Job:
+    """A background job and its progress, as reported to the client"""
+    id: str
+    user_id: str
+    kind: str
+    status: str = "pending"  # pending, running, complete, failed
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": dict(self.progress),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class JobRegistry:
+    """
+    In-process registry of background jobs run through FastAPI's
+    BackgroundTasks. The API runs as a single uvicorn process, so the worker
+    that accepted a job is also the one asked for its progress.
+    """
+
+    def __init__(self):
+        self._jobs = TTLCache(maxsize=MAX_JOBS, ttl=JOB_TTL_SECONDS)
+        self._lock = threading.Lock()
+
+    def create(self, user_id, kind: str) -> Job:
+        job = Job(id=uuid.uuid4().hex, user_id=str(user_id), kind=kind)
+        self._jobs.set(job.id, job)
+        return job
+
+    def get(self, job_id: str, user_id) -> Optional[Job]:
+        """Return a job, or None if it doesn't exist or belongs to another user"""
+        job = self._jobs.get(job_id)
+        if job is None or job.user_id != str(user_id):
+            return None
+        return job
+
+    def update(self, job: Job, progress: Optional[Dict[str, Any]] = None, **fields):
+        """Set job fields and merge in progress counters"""
+        with self._lock:
+            for name, value in fields.items():
+                setattr(job, name, value)
+            if progress:
+                job.progress = {**job.progress, **progress}
+            job.updated_at = _now()
+
+
+job_registry = JobRegistry()
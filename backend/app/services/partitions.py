@@ -0,0 +1,126 @@
+import re
+from datetime import date
+from typing import Dict, List
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.data_version import bump_data_version
+
+PARENT_TABLE = "transactions"
+DEFAULT_PARTITION = "transactions_default"
+ARCHIVE_SCHEMA = "archive"
+PARTITION_NAME = re.compile(r"^transactions_y(\d{4})m(\d{2})$")
+# pg_advisory_xact_lock key, so only one worker maintains partitions at a time
+MAINTENANCE_LOCK_KEY = 4313001
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"transactions_y{month.year}m{month.month:02d}"
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def is_partitioned(db: Session) -> bool:
+    """False for databases created by create_all, which get a plain table"""
+    return bool(db.execute(
+        text("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": PARENT_TABLE}
+    ).scalar())
+
+
+def attached_partitions(db: Session) -> Dict[date, str]:
+    """Monthly partitions currently attached, by month"""
+    rows = db.execute(text("""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(:table)
+    """), {"table": PARENT_TABLE}).scalars()
+    partitions = {}
+    for name in rows:
+        match = PARTITION_NAME.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return partitions
+
+
+def create_partition(db: Session, month: date):
+    """
+    Create the partition for `month`. Rows that already landed in the
+    default partition for that month are moved into it first, since a new
+    partition can't overlap rows left in the default one.
+    """
+    name = partition_name(month)
+    start, end = month, add_months(month, 1)
+    bounds = f"FOR VALUES FROM ({_bound(start)}) TO ({_bound(end)})"
+    in_default = db.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE date >= :start AND date < :end)"),
+        {"start": start, "end": end}
+    ).scalar()
+    if not in_default:
+        db.execute(text(f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} {bounds}"))
+        return
+    db.execute(text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    db.execute(text(f"""
+        WITH moved AS (
+            DELETE FROM {DEFAULT_PARTITION} WHERE date >= :start AND date < :end RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved
+    """), {"start": start, "end": end})
+    db.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} {bounds}"))
+
+
+def ensure_partitions(db: Session, months_ahead: int) -> List[str]:
+    """
+    Make sure this month and the next `months_ahead` have partitions.
+    Commits; returns the partitions created.
+    """
+    if not is_partitioned(db):
+        return []
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+    existing = attached_partitions(db)
+    this_month = month_start(date.today())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(this_month, offset)
+        if month not in existing:
+            create_partition(db, month)
+            created.append(partition_name(month))
+    db.commit()
+    return created
+
+
+def archive_partitions(db: Session, retention_months: int) -> List[str]:
+    """
+    Detach partitions for months more than `retention_months` before this
+    one and move them into the archive schema, where they can be dumped or
+    dropped without touching live data. Commits; returns the partitions
+    archived.
+    """
+    if not is_partitioned(db):
+        return []
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+    cutoff = add_months(month_start(date.today()), -retention_months)
+    archived = []
+    for month, name in sorted(attached_partitions(db).items()):
+        if month >= cutoff:
+            continue
+        # Their reports and exports change, so cached responses must go
+        user_ids = db.execute(text(f"SELECT DISTINCT user_id FROM {name}")).scalars().all()
+        db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+        db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        db.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+        bump_data_version(db, user_ids)
+        archived.append(name)
+    db.commit()
+    return archived
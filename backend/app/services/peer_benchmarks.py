@@ -0,0 +1,124 @@
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, List, Sequence
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.peer_benchmark import PeerBenchmark
+from app.services.partitions import add_months, month_start
+
+# Metric -> whether a lower value is the better one
+METRICS = {
+    "monthly_spending": True,
+    "impulse_purchases": True,
+    "savings_streak": False,
+    "rollover_savings": False,
+}
+
+# Percentiles stored per metric: 0, 1, ..., 100
+FRACTIONS = [step / 100 for step in range(101)]
+
+# The stored distributions only change nightly
+_cache = TTLCache(maxsize=1, ttl=settings.ANALYTICS_CACHE_TTL_SECONDS)
+
+# Spending and impulses are month to date, over users who spent this month;
+# streak and rollover over every user with a streak
+DISTRIBUTIONS_SQL = text("""
+    WITH monthly AS (
+        SELECT CAST(SUM(amount) AS float8) / 100 AS spent,
+               CAST(COUNT(*) FILTER (WHERE is_impulse) AS float8) AS impulses
+        FROM transactions
+        WHERE date >= :month_start AND date < :month_end
+        GROUP BY user_id
+    )
+    SELECT 'monthly_spending' AS metric,
+           percentile_cont(CAST(:fractions AS float8[])) WITHIN GROUP (ORDER BY spent) AS quantiles,
+           COUNT(*) AS sample_size
+    FROM monthly
+    UNION ALL
+    SELECT 'impulse_purchases',
+           percentile_cont(CAST(:fractions AS float8[])) WITHIN GROUP (ORDER BY impulses),
+           COUNT(*)
+    FROM monthly
+    UNION ALL
+    SELECT 'savings_streak',
+           percentile_cont(CAST(:fractions AS float8[])) WITHIN GROUP (ORDER BY CAST(COALESCE(current_streak, 0) AS float8)),
+           COUNT(*)
+    FROM user_streaks
+    UNION ALL
+    SELECT 'rollover_savings',
+           percentile_cont(CAST(:fractions AS float8[])) WITHIN GROUP (ORDER BY CAST(COALESCE(rollover_budget, 0) AS float8) / 100),
+           COUNT(*)
+    FROM user_streaks
+""")
+
+
+def compute_peer_benchmarks(db: Session, today: date) -> Dict[str, int]:
+    """
+    Recompute the population distribution of every metric in one pass and
+    store it. Metrics with fewer than PEER_BENCHMARK_MIN_USERS users are
+    removed instead. Returns the sample size per metric.
+    """
+    month = month_start(today)
+    rows = db.execute(
+        DISTRIBUTIONS_SQL,
+        {"month_start": month, "month_end": add_months(month, 1), "fractions": FRACTIONS}
+    ).all()
+
+    sizes = {}
+    for row in rows:
+        sizes[row.metric] = row.sample_size
+        if row.sample_size < settings.PEER_BENCHMARK_MIN_USERS:
+            db.query(PeerBenchmark).filter(PeerBenchmark.metric == row.metric).delete()
+            continue
+        statement = insert(PeerBenchmark).values(
+            metric=row.metric, quantiles=list(row.quantiles), sample_size=row.sample_size
+        )
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[PeerBenchmark.metric],
+            set_={
+                "quantiles": statement.excluded.quantiles,
+                "sample_size": statement.excluded.sample_size,
+                "computed_at": statement.excluded.computed_at,
+            }
+        ))
+    db.commit()
+    _cache.clear()
+    return sizes
+
+
+def distributions(db: Session) -> Dict[str, List[float]]:
+    """Stored quantiles per metric; a single small read, cached"""
+    stored = _cache.get("distributions")
+    if stored is None:
+        stored = {row.metric: row.quantiles for row in db.query(PeerBenchmark.metric, PeerBenchmark.quantiles)}
+        _cache.set("distributions", stored)
+    return stored
+
+
+def _share_below(quantiles: Sequence[float], value: float, bisect) -> float:
+    """
+    Share of the population (0-100) below `value` (or at it, with
+    bisect_right), interpolated between the neighbouring quantiles
+    """
+    steps = len(quantiles) - 1
+    position = bisect(quantiles, value)
+    if position == 0:
+        return 0.0
+    if position > steps:
+        return 100.0
+    low, high = quantiles[position - 1], quantiles[position]
+    return (position - 1 + (value - low) / (high - low)) * 100 / steps
+
+
+def percentile(quantiles: Sequence[float], value: float, lower_is_better: bool) -> float:
+    """
+    Share of users the value does at least as well as, found by binary
+    search over the stored quantiles: those at or above it when lower is
+    better, at or below it otherwise
+    """
+    if lower_is_better:
+        return 100.0 - _share_below(quantiles, value, bisect_left)
+    return _share_below(quantiles, value, bisect_right)
@@ -0,0 +1,260 @@
+import csv
+import gzip
+from datetime import datetime
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from sqlalchemy import and_, func, literal, null, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.categories import categories, category_registry
+from app.models.income import Income
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.analytics import spending_summary
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # Parquet export is optional
+    pyarrow = None
+
+EXCEL_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# Export format -> media type; the format doubles as the file extension
+EXPORT_MEDIA_TYPES = {
+    "xlsx": EXCEL_MEDIA_TYPE,
+    "csv": "text/csv",
+    "csv.gz": "application/gzip",
+    "parquet": "application/vnd.apache.parquet",
+}
+EXPORT_COLUMNS = ["date", "type", "category", "amount", "note", "impulse"]
+# Rows fetched per round trip while streaming transactions and incomes
+EXPORT_BATCH_SIZE = 1000
+
+MONEY_FORMAT = '$#,##0.00'
+_thin = Side(style='thin', color='B4C7E7')
+_border = Border(left=_thin, right=_thin, top=_thin, bottom=_thin)
+_header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_subtotal_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+
+
+def _style(name: str, **attributes) -> NamedStyle:
+    style = NamedStyle(name=name)
+    for key, value in attributes.items():
+        setattr(style, key, value)
+    return style
+
+
+def _named_styles() -> list:
+    """
+    Registered once per workbook (a NamedStyle binds to the workbook it is
+    added to); cells refer to them by name, so rows don't carry their own
+    font/border/fill objects
+    """
+    return [
+        _style("title", font=Font(name="Arial", size=16, bold=True, color="2F5496"),
+               alignment=Alignment(horizontal='center', vertical='center')),
+        _style("section", font=Font(name="Arial", size=12, bold=True)),
+        _style("header", font=Font(name="Arial", size=12, bold=True, color="FFFFFF"), fill=_header_fill,
+               alignment=Alignment(horizontal='center', vertical='center'), border=_border),
+        _style("row", border=_border),
+        _style("row_money", border=_border, number_format=MONEY_FORMAT),
+        _style("money", number_format=MONEY_FORMAT),
+        _style("percent", number_format='0.0%'),
+        _style("income_total", font=Font(color="008000", bold=True), number_format=MONEY_FORMAT),
+        _style("expense_total", font=Font(color="FF0000", bold=True), number_format=MONEY_FORMAT),
+        _style("net_positive", font=Font(color="0000FF", bold=True, size=12), number_format=MONEY_FORMAT),
+        _style("net_negative", font=Font(color="FF0000", bold=True, size=12), number_format=MONEY_FORMAT),
+        _style("subtotal", font=Font(name="Arial", size=11, bold=True), fill=_subtotal_fill),
+        _style("subtotal_money", font=Font(name="Arial", size=11, bold=True), fill=_subtotal_fill,
+               number_format=MONEY_FORMAT),
+    ]
+
+
+def _cell(ws, value, style: str = None) -> WriteOnlyCell:
+    cell = WriteOnlyCell(ws, value=value)
+    if style:
+        cell.style = style
+    return cell
+
+
+def _sheet(wb: Workbook, title: str, heading: str, widths: list, header_row: list = None):
+    """A write-only sheet with its title row (and table header) already written"""
+    ws = wb.create_sheet(title)
+    # Column widths and merges must be set before the first row is written
+    for index, width in enumerate(widths):
+        ws.column_dimensions[chr(ord('A') + index)].width = width
+    ws.merged_cells.ranges.add(f"A1:{chr(ord('A') + len(widths) - 1)}1")
+    ws.row_dimensions[1].height = 30 if header_row is None else 25
+    ws.append([_cell(ws, heading, "title")])
+    if header_row is not None:
+        ws.append([])
+        ws.append([_cell(ws, header, "header") for header in header_row])
+    return ws
+
+
+def write_excel_report(db: Session, path: str, user: User, period: str, start_date: datetime, end_date: datetime):
+    """
+    Write the styled Excel report for `user` between the two dates to
+    `path`. Built in write-only mode: totals come from SQL aggregates and
+    transactions and incomes are streamed in batches straight into the
+    sheets, so memory stays flat however many rows there are.
+    """
+    spent = and_(Transaction.user_id == user.id, Transaction.date >= start_date, Transaction.date < end_date)
+    earned = and_(Income.user_id == user.id, Income.date >= start_date, Income.date < end_date)
+
+    # Summed in integer cents by the database
+    summary = spending_summary(db, user.id, start_date, end_date)
+    total_expenses = summary.total
+    total_income = db.query(func.sum(Income.amount)).filter(earned).scalar() or 0.0
+    net_balance = total_income - total_expenses
+
+    wb = Workbook(write_only=True)
+    for style in _named_styles():
+        wb.add_named_style(style)
+
+    # Summary Sheet
+    ws = _sheet(wb, "Summary", f"Financial Report - {period.title()}", [25, 20, 15, 15])
+    ws.append([])
+    ws.append(["Report Generated:", datetime.now().strftime("%B %d, %Y at %I:%M %p")])
+    ws.append(["User:", user.email])
+    ws.append([])
+    ws.append([_cell(ws, "Financial Summary", "section")])
+    ws.append([])
+    ws.append(["Total Income", _cell(ws, total_income, "income_total")])
+    ws.append(["Total Expenses", _cell(ws, total_expenses, "expense_total")])
+    ws.append(["Net Balance", _cell(ws, net_balance, "net_positive" if net_balance >= 0 else "net_negative")])
+    ws.append([])
+    ws.append([_cell(ws, "Expenses by Category", "section")])
+    ws.append([])
+    for category, amount in summary.categories:
+        ws.append([
+            category.title(),
+            _cell(ws, amount, "money"),
+            _cell(ws, amount / total_expenses if total_expenses > 0 else 0, "percent"),
+        ])
+
+    # Transactions Sheet
+    ws = _sheet(
+        wb, "Transactions", "Expense Transactions", [15, 15, 15, 30, 10, 12],
+        ["Date", "Category", "Amount", "Note", "Impulse", "Time"]
+    )
+    rows = db.query(
+        Transaction.date, Transaction.category_id, Transaction.amount, Transaction.note, Transaction.is_impulse
+    ).filter(spent).order_by(Transaction.date.desc()).yield_per(EXPORT_BATCH_SIZE)
+    for row in rows:
+        ws.append([
+            _cell(ws, row.date.strftime("%Y-%m-%d"), "row"),
+            _cell(ws, category_registry.name(row.category_id).title(), "row"),
+            _cell(ws, row.amount, "row_money"),
+            _cell(ws, row.note or "", "row"),
+            _cell(ws, "Yes" if row.is_impulse else "No", "row"),
+            _cell(ws, row.date.strftime("%I:%M %p"), "row"),
+        ])
+    ws.append([_cell(ws, "TOTAL", "subtotal"), None, _cell(ws, total_expenses, "subtotal_money")])
+
+    # Income Sheet
+    ws = _sheet(
+        wb, "Income", "Income Records", [15, 20, 15, 35, 12],
+        ["Date", "Source", "Amount", "Description", "Time"]
+    )
+    rows = db.query(
+        Income.date, Income.source, Income.amount, Income.description
+    ).filter(earned).order_by(Income.date.desc()).yield_per(EXPORT_BATCH_SIZE)
+    for row in rows:
+        ws.append([
+            _cell(ws, row.date.strftime("%Y-%m-%d"), "row"),
+            _cell(ws, row.source, "row"),
+            _cell(ws, row.amount, "row_money"),
+            _cell(ws, row.description or "", "row"),
+            _cell(ws, row.date.strftime("%I:%M %p"), "row"),
+        ])
+    ws.append([_cell(ws, "TOTAL", "subtotal"), None, _cell(ws, total_income, "subtotal_money")])
+
+    wb.save(path)
+
+
+
+def parquet_available() -> bool:
+    return pyarrow is not None
+
+
+def _export_rows(db: Session, user: User, start_date: datetime, end_date: datetime):
+    """
+    The user's expenses and incomes between the two dates as flat rows
+    (EXPORT_COLUMNS), newest first, in batches from a server-side cursor
+    """
+    expenses = select(
+        Transaction.date,
+        literal("expense").label("type"),
+        categories.c.name.label("category"),
+        Transaction.amount,
+        Transaction.note,
+        Transaction.is_impulse.label("impulse"),
+    ).join(categories, categories.c.id == Transaction.category_id).where(
+        Transaction.user_id == user.id, Transaction.date >= start_date, Transaction.date < end_date
+    )
+    incomes = select(
+        Income.date,
+        literal("income"),
+        Income.source,
+        Income.amount,
+        Income.description,
+        null(),
+    ).where(Income.user_id == user.id, Income.date >= start_date, Income.date < end_date)
+    query = union_all(expenses, incomes).order_by(Transaction.date.desc())
+    result = db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    return result.partitions()
+
+
+def write_csv_export(db: Session, path: str, user: User, start_date: datetime, end_date: datetime, compress: bool):
+    """Write the rows as CSV (gzipped if `compress`), one batch at a time"""
+    opener = gzip.open if compress else open
+    with opener(path, "wt", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_COLUMNS)
+        for batch in _export_rows(db, user, start_date, end_date):
+            writer.writerows(
+                (
+                    row.date.isoformat(),
+                    row.type,
+                    row.category,
+                    f"{row.amount:.2f}",
+                    row.note or "",
+                    "" if row.impulse is None else str(row.impulse).lower(),
+                )
+                for row in batch
+            )
+
+
+def write_parquet_export(db: Session, path: str, user: User, start_date: datetime, end_date: datetime):
+    """Write the rows as Parquet, one row group per batch (requires pyarrow)"""
+    schema = pyarrow.schema([
+        ("date", pyarrow.timestamp("us", tz="UTC")),
+        ("type", pyarrow.string()),
+        ("category", pyarrow.string()),
+        ("amount", pyarrow.float64()),
+        ("note", pyarrow.string()),
+        ("impulse", pyarrow.bool_()),
+    ])
+    with pyarrow.parquet.ParquetWriter(path, schema, compression="zstd") as writer:
+        for batch in _export_rows(db, user, start_date, end_date):
+            columns = list(zip(*batch))
+            writer.write_table(pyarrow.Table.from_arrays(
+                [pyarrow.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema
+            ))
+
+
+def write_export(
+    db: Session, path: str, user: User, period: str, start_date: datetime, end_date: datetime, export_format: str
+):
+    """Write the report in one of EXPORT_MEDIA_TYPES' formats to `path`"""
+    if export_format == "xlsx":
+        write_excel_report(db, path, user, period, start_date, end_date)
+    elif export_format in ("csv", "csv.gz"):
+        write_csv_export(db, path, user, start_date, end_date, compress=export_format == "csv.gz")
+    elif export_format == "parquet":
+        write_parquet_export(db, path, user, start_date, end_date)
+    else:
+        raise ValueError(f"Unknown export format: {export_format}")
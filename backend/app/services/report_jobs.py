@@ -0,0 +1,222 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+from typing import Dict, Optional
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.services.jobs import JOB_TTL_SECONDS, MAX_JOBS, Job, job_registry
+from app.services.report_export import write_export
+
+
+def report_filename(period: str, day: date, export_format: str) -> str:
+    return f"Financial_Report_{period.title()}_{day.strftime('%Y%m%d')}.{export_format}"
+
+
+class ReportCache:
+    """
+    Finished reports on disk, one file per (user, period, data version,
+    day, format). Any write to the user's data changes the key, so a
+    cached report is never stale; files older than the TTL are evicted.
+    """
+
+    def __init__(self, directory: str, ttl: int):
+        self.directory = directory
+        self.ttl = ttl
+
+    def key(self, user_id, period: str, data_version: int, day: date, export_format: str) -> str:
+        return f"{user_id}-{period}-{data_version}-{day.isoformat()}.{export_format}"
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def ensure_directory(self):
+        """
+        Create the directory readable by this user only: the reports hold
+        financial data, and by default it lives under the shared temp dir
+        """
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        info = os.stat(self.directory)
+        if info.st_uid != os.getuid():
+            raise PermissionError(f"Report cache directory {self.directory} belongs to another user")
+        if info.st_mode & 0o077:
+            os.chmod(self.directory, 0o700)
+
+    def get(self, key: str) -> Optional[str]:
+        """Path of a cached report that hasn't expired, or None"""
+        path = self.path(key)
+        try:
+            if time.time() - os.path.getmtime(path) < self.ttl:
+                return path
+        except FileNotFoundError:
+            pass
+        return None
+
+    def evict_expired(self) -> int:
+        """Remove expired reports (and leftovers of crashed workers)"""
+        cutoff = time.time() - self.ttl
+        removed = 0
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+
+def write_cached_report(
+    db: Session, path: str, user: User, period: str, start_date: datetime, end_date: datetime, export_format: str
+):
+    """Write a report to a private file, then move it into place in the cache"""
+    partial = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+    try:
+        write_export(db, partial, user, period, start_date, end_date, export_format)
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+
+
+def _generate_report(
+    user_id, period: str, start_date: datetime, end_date: datetime, export_format: str, path: str
+) -> str:
+    """Runs in a worker process, with its own database connection"""
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        if user is None:
+            raise ValueError("User not found")
+        write_cached_report(db, path, user, period, start_date, end_date, export_format)
+        return path
+    finally:
+        db.close()
+
+
+class ReportJobRunner:
+    """
+    Generates reports as background jobs in a process pool, so large
+    exports hold neither a request worker nor the GIL of the API process.
+    Finished reports go into the ReportCache; asking again for a report
+    that is cached, or already being generated, costs nothing.
+    """
+
+    def __init__(self, workers: int, cache: ReportCache):
+        self.workers = workers
+        self.cache = cache
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._running: Dict[str, Job] = {}
+        self._keys = TTLCache(maxsize=MAX_JOBS, ttl=JOB_TTL_SECONDS)  # job id -> cache key
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self.cache.ensure_directory()
+            # Spawned, not forked: the API process has threads and open
+            # database connections a fork would copy
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _result(self, job: Job, period: str, day: date, export_format: str, cached: bool) -> Dict:
+        return {
+            "filename": report_filename(period, day, export_format),
+            "format": export_format,
+            "download_url": f"/api/v1/reports/jobs/{job.id}/download",
+            "cached": cached,
+        }
+
+    def submit(
+        self, user_id, period: str, start_date: datetime, end_date: datetime, data_version: int, export_format: str
+    ) -> Job:
+        # Periods run up to today, so a report is only reused the same day
+        day = end_date.date()
+        key = self.cache.key(user_id, period, data_version, day, export_format)
+        with self._lock:
+            running = self._running.get(key)
+            if running is not None:
+                return running
+
+            job = job_registry.create(user_id, "report_export")
+            self._keys.set(job.id, key)
+            if self.cache.get(key):
+                job_registry.update(job, status="complete", result=self._result(job, period, day, export_format, cached=True))
+                return job
+
+            args = (_generate_report, user_id, period, start_date, end_date, export_format, self.cache.path(key))
+            try:
+                future = self._pool().submit(*args)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool
+                self._executor = None
+                future = self._pool().submit(*args)
+            self._running[key] = job
+            job_registry.update(job, status="running")
+
+        def finished(future: Future):
+            with self._lock:
+                self._running.pop(key, None)
+            error = future.exception()
+            if error is not None:
+                print(f"Error generating report for job {job.id}: {error}")
+                job_registry.update(job, status="failed", error="Report generation failed")
+            else:
+                job_registry.update(job, status="complete", result=self._result(job, period, day, export_format, cached=False))
+
+        future.add_done_callback(finished)
+        return job
+
+    def build(
+        self,
+        db: Session,
+        user: User,
+        period: str,
+        start_date: datetime,
+        end_date: datetime,
+        data_version: int,
+        export_format: str
+    ) -> str:
+        """Path of the cached report, written in this process on a miss"""
+        key = self.cache.key(user.id, period, data_version, end_date.date(), export_format)
+        path = self.cache.get(key)
+        if path is None:
+            self.cache.ensure_directory()
+            path = self.cache.path(key)
+            write_cached_report(db, path, user, period, start_date, end_date, export_format)
+        return path
+
+    def download_path(self, job: Job) -> Optional[str]:
+        """The cached file of a finished job, or None if it has been evicted"""
+        key = self._keys.get(job.id)
+        if job.status != "complete" or key is None:
+            return None
+        return self.cache.get(key)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+report_cache = ReportCache(
+    directory=settings.REPORT_CACHE_DIR or os.path.join(tempfile.gettempdir(), "dalafin-reports"),
+    ttl=settings.REPORT_CACHE_TTL_SECONDS,
+)
+report_jobs = ReportJobRunner(workers=settings.REPORT_EXPORT_WORKERS, cache=report_cache)
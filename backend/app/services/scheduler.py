@@ -0,0 +1,163 @@
+from datetime import date, datetime
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.revocation import revocation_list
+from app.services.category_limits import reconcile_spent
+from app.services.partitions import archive_partitions, ensure_partitions
+from app.services.peer_benchmarks import compute_peer_benchmarks
+from app.services.report_jobs import report_cache
+
+scheduler = AsyncIOScheduler()
+
+
+def reconcile_category_limits_task():
+    """
+    Run every night: check each category limit's spent against its
+    transactions and correct drift. On the 1st this also starts the new
+    month's counters from zero.
+    """
+    print("Running category limit reconciliation...")
+    db = SessionLocal()
+    try:
+        corrected = reconcile_spent(db)
+        for row in corrected:
+            print(
+                f"  Corrected {row['category']} for user {row['user_id']}: "
+                f"{row['recorded']:.2f} -> {row['actual']:.2f}"
+            )
+        print(f"Category limit reconciliation corrected {len(corrected)} counters")
+    except Exception as e:
+        print(f"Error in category limit reconciliation: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def maintain_transaction_partitions_task():
+    """
+    Run every night: create the coming months' transaction partitions and,
+    if a retention is configured, archive the ones that fell out of it
+    """
+    print("Running transaction partition maintenance...")
+    db = SessionLocal()
+    try:
+        created = ensure_partitions(db, settings.TRANSACTION_PARTITIONS_AHEAD)
+        archived = []
+        if settings.TRANSACTION_PARTITION_RETENTION_MONTHS is not None:
+            archived = archive_partitions(db, settings.TRANSACTION_PARTITION_RETENTION_MONTHS)
+        print(f"Transaction partitions created: {created or 'none'}, archived: {archived or 'none'}")
+    except Exception as e:
+        print(f"Error in transaction partition maintenance: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def compute_peer_benchmarks_task():
+    """
+    Run every night: recompute the population distributions peer
+    benchmarks rank users against
+    """
+    print("Computing peer benchmarks...")
+    db = SessionLocal()
+    try:
+        sizes = compute_peer_benchmarks(db, date.today())
+        print(f"Peer benchmarks computed: {sizes}")
+    except Exception as e:
+        print(f"Error computing peer benchmarks: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def rebuild_revocation_filter_task():
+    """
+    Run every hour: purge expired revoked tokens and rebuild this worker's
+    Bloom filter from the rest, so it doesn't fill up with them
+    """
+    db = SessionLocal()
+    try:
+        count = revocation_list.rebuild(db)
+        print(f"Token revocation filter rebuilt with {count} tokens")
+    except Exception as e:
+        print(f"Error rebuilding token revocation filter: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def evict_report_cache_task():
+    """Run every hour: delete cached reports past their TTL"""
+    try:
+        removed = report_cache.evict_expired()
+        if removed:
+            print(f"Evicted {removed} cached reports")
+    except Exception as e:
+        print(f"Error evicting cached reports: {e}")
+
+
+def init_scheduler():
+    """Initialize and start the scheduler"""
+    # Category limit reconciliation (12:05 AM every day)
+    scheduler.add_job(
+        reconcile_category_limits_task,
+        CronTrigger(hour=0, minute=5),
+        id="reconcile_category_limits",
+        name="Category limit reconciliation",
+        replace_existing=True
+    )
+
+    # Transaction partition maintenance (12:15 AM every day, and at startup)
+    scheduler.add_job(
+        maintain_transaction_partitions_task,
+        CronTrigger(hour=0, minute=15),
+        id="maintain_transaction_partitions",
+        name="Transaction partition maintenance",
+        replace_existing=True,
+        next_run_time=datetime.now()
+    )
+
+    # Peer benchmark distributions (12:45 AM every day, and at startup)
+    scheduler.add_job(
+        compute_peer_benchmarks_task,
+        CronTrigger(hour=0, minute=45),
+        id="compute_peer_benchmarks",
+        name="Peer benchmark distributions",
+        replace_existing=True,
+        next_run_time=datetime.now()
+    )
+
+    # Token revocation purge and filter rebuild (every hour, at quarter to)
+    scheduler.add_job(
+        rebuild_revocation_filter_task,
+        CronTrigger(minute=45),
+        id="rebuild_revocation_filter",
+        name="Token revocation filter rebuild",
+        replace_existing=True
+    )
+
+    # Report cache eviction (every hour, at half past)
+    scheduler.add_job(
+        evict_report_cache_task,
+        CronTrigger(minute=30),
+        id="evict_report_cache",
+        name="Report cache eviction",
+        replace_existing=True
+    )
+
+    scheduler.start()
+    print("Scheduler initialized with tasks:")
+    print("  - Category limit reconciliation (12:05 AM)")
+    print("  - Transaction partition maintenance (12:15 AM)")
+    print("  - Peer benchmark distributions (12:45 AM)")
+    print("  - Token revocation filter rebuild (hourly)")
+    print("  - Report cache eviction (hourly)")
+
+
+def shutdown_scheduler():
+    """Shutdown the scheduler"""
+    if scheduler.running:
+        scheduler.shutdown()
+        print("Scheduler shut down")
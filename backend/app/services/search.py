@@ -0,0 +1,121 @@
+import html
+import re
+from typing import Any, Dict, List
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+from app.core.money import from_cents
+from app.models.reflection import SEARCH_DOCUMENT as REFLECTION_DOCUMENT
+
+REFLECTION_TEXT = "concat_ws(E'\\n', regret_purchase, good_purchase, notes)"
+
+# Highlight markers, swapped for <mark> tags after the snippet is escaped.
+# Control characters that nobody types, stripped from transaction notes first.
+MARK_START = "\x02"
+MARK_END = "\x03"
+HEADLINE_OPTIONS = f"StartSel={MARK_START}, StopSel={MARK_END}, MaxFragments=2, MaxWords=20, MinWords=5"
+
+SEARCH_SQL = f"""
+    WITH hits AS (
+        SELECT 'transaction' AS kind, t.id::text AS id, t.date AS date,
+               t.amount AS amount, c.name AS category, t.note AS body,
+               word_similarity(:q, t.note) AS rank
+        FROM transactions t
+        JOIN categories c ON c.id = t.category_id
+        WHERE :search_transactions
+          AND t.user_id = :user_id
+          AND (:q <% t.note OR t.note ILIKE :pattern)
+        UNION ALL
+        SELECT 'reflection', r.id::text, r.date::timestamptz,
+               NULL, NULL, {REFLECTION_TEXT},
+               ts_rank({REFLECTION_DOCUMENT}, websearch_to_tsquery('english', :q))
+        FROM reflections r
+        WHERE :search_reflections
+          AND r.user_id = :user_id
+          AND {REFLECTION_DOCUMENT} @@ websearch_to_tsquery('english', :q)
+    ),
+    page AS (
+        SELECT * FROM hits
+        ORDER BY rank DESC, date DESC, id
+        LIMIT :limit OFFSET :offset
+    )
+    SELECT kind, id, date, amount, category, rank,
+           CASE WHEN kind = 'reflection'
+                THEN ts_headline('english', body, websearch_to_tsquery('english', :q), :headline_options)
+                ELSE body
+           END AS snippet
+    FROM page
+    ORDER BY rank DESC, date DESC, id
+"""
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _mark_terms(value: str, query: str) -> str:
+    """Wrap case-insensitive occurrences of the query's words in markers"""
+    terms = sorted({term for term in query.split() if term}, key=len, reverse=True)
+    if not terms:
+        return value
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    return pattern.sub(lambda match: f"{MARK_START}{match.group(0)}{MARK_END}", value)
+
+
+def _highlight(value: str) -> str:
+    """HTML-escape a snippet and turn markers into <mark> tags"""
+    escaped = html.escape(value)
+    return escaped.replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+def search(
+    db: Session,
+    user_id,
+    query: str,
+    kind: str = "all",
+    limit: int = 20,
+    offset: int = 0
+) -> Dict[str, Any]:
+    """
+    Ranked search over a user's transaction notes (trigram word similarity,
+    so partial words and typos match) and reflections (English full-text).
+    Snippets are HTML-escaped with matches wrapped in <mark>.
+    """
+    query = " ".join(query.split())
+    rows = db.execute(
+        text(SEARCH_SQL).bindparams(bindparam("user_id", type_=UUID(as_uuid=True))),
+        {
+            "q": query,
+            "pattern": f"%{_escape_like(query)}%",
+            "user_id": user_id,
+            "search_transactions": kind in ("all", "transactions"),
+            "search_reflections": kind in ("all", "reflections"),
+            "headline_options": HEADLINE_OPTIONS,
+            # One extra row tells whether there's another page
+            "limit": limit + 1,
+            "offset": offset,
+        }
+    ).all()
+
+    results: List[Dict[str, Any]] = []
+    for row in rows[:limit]:
+        snippet = row.snippet or ""
+        if row.kind == "transaction":
+            snippet = _mark_terms(snippet.replace(MARK_START, "").replace(MARK_END, ""), query)
+        results.append({
+            "type": row.kind,
+            "id": row.id,
+            "date": row.date,
+            "amount": from_cents(row.amount),
+            "category": row.category,
+            "rank": float(row.rank),
+            "highlight": _highlight(snippet),
+        })
+
+    return {
+        "query": query,
+        "results": results,
+        "limit": limit,
+        "offset": offset,
+        "has_more": len(rows) > limit,
+    }
@@ -0,0 +1,364 @@
+import csv
+import hashlib
+import io
+import os
+import re
+from collections import Counter, defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from app.core.categories import category_registry
+from app.core.data_version import bump_data_version
+from app.core.database import SessionLocal
+from app.core.ids import uuid7
+from app.core.money import Number, to_cents
+from app.models.transaction import Transaction
+from app.services.category_limits import adjust_spent_by_category, in_current_period
+from app.services.jobs import Job, job_registry
+
+CHUNK_SIZE = 1000
+DEFAULT_CATEGORY = "other"
+# Imported rows only carry a date; noon UTC keeps them on the same calendar
+# day in every timezone the app is used in
+IMPORTED_TIME = time(12, 0, tzinfo=timezone.utc)
+# Rows used to learn how the user categorizes merchants they've logged before
+KNOWN_DESCRIPTIONS_LIMIT = 5000
+
+CSV_HEADER_SCAN_ROWS = 20
+CSV_DATE_COLUMNS = ("date", "transaction date", "posted date", "posting date", "booking date", "value date")
+CSV_DESCRIPTION_COLUMNS = ("description", "details", "payee", "merchant", "name", "narrative", "memo", "reference")
+CSV_AMOUNT_COLUMNS = ("amount", "value", "transaction amount")
+CSV_DEBIT_COLUMNS = ("debit", "withdrawal", "withdrawals", "money out", "paid out")
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%m/%d/%y", "%d/%m/%y", "%Y/%m/%d", "%d-%m-%Y", "%d %b %Y", "%b %d, %Y", "%d.%m.%Y")
+
+CATEGORY_RULES = (
+    ("food", ("uber eats", "doordash", "grubhub", "deliveroo", "restaurant", "cafe", "coffee", "starbucks", "mcdonald",
+              "burger", "pizza", "kfc", "subway", "chipotle", "bakery", "grocer", "supermarket", "whole foods",
+              "trader joe", "kroger", "aldi", "tesco", "safeway")),
+    ("transport", ("uber", "lyft", "taxi", "fuel", "petrol", "gas station", "shell", "chevron", "exxon", "parking",
+                   "metro", "transit", "railway", "airline", "toll")),
+    ("entertainment", ("netflix", "spotify", "hulu", "disney", "cinema", "movie", "theatre", "theater", "steam",
+                       "playstation", "xbox", "ticketmaster", "concert")),
+    ("bills", ("electric", "utility", "utilities", "water", "internet", "broadband", "comcast", "verizon", "t mobile",
+               "insurance", "rent", "mortgage", "council tax")),
+    ("health", ("pharmacy", "cvs", "walgreens", "doctor", "dental", "dentist", "clinic", "hospital", "gym", "fitness")),
+    ("tech", ("apple com", "best buy", "microsoft", "adobe", "github", "google storage", "digitalocean")),
+    ("gifts", ("gift", "florist", "flowers", "etsy")),
+    ("shopping", ("amazon", "target", "walmart", "ebay", "ikea", "costco", "zara")),
+)
+
+
+class StatementRow(NamedTuple):
+    day: date
+    amount: Decimal  # positive for money out
+    description: str
+
+
+class StatementImportError(Exception):
+    """Raised when a statement file can't be parsed"""
+
+
+def normalize_description(description: Optional[str]) -> str:
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", (description or "").lower()).split())
+
+
+_CATEGORY_PATTERNS = [
+    (category, re.compile(r"\b(?:" + "|".join(re.escape(keyword) for keyword in keywords) + r")"))
+    for category, keywords in CATEGORY_RULES
+]
+
+
+@lru_cache(maxsize=10000)
+def rule_category(normalized_description: str) -> str:
+    """Category from merchant keywords; expects a normalized description"""
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(normalized_description):
+            return category
+    return DEFAULT_CATEGORY
+
+
+def dedupe_key(user_id, day: date, amount: Number, description: Optional[str]) -> str:
+    """Identity of a transaction for duplicate detection across imports"""
+    content = f"{user_id}|{day.isoformat()}|{to_cents(amount)}|{normalize_description(description)}"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def detect_format(filename: Optional[str], head: bytes) -> str:
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension in (".ofx", ".qfx"):
+        return "ofx"
+    if extension == ".csv":
+        return "csv"
+    if b"OFXHEADER" in head.upper() or b"<OFX>" in head.upper():
+        return "ofx"
+    return "csv"
+
+
+def parse_amount(value: Optional[str]) -> Optional[Decimal]:
+    """Parse a bank amount such as "-1,234.56", "(12.00)" or "12.00 DR" """
+    value = (value or "").strip()
+    if not value:
+        return None
+    upper = value.upper()
+    negative = (
+        value.startswith("-") or value.endswith("-")
+        or (value.startswith("(") and value.endswith(")"))
+        or upper.endswith("DR")
+    )
+    digits = re.sub(r"[^0-9.]", "", value)
+    if not digits:
+        return None
+    try:
+        amount = Decimal(digits)
+    except InvalidOperation:
+        return None
+    return -amount if negative else amount
+
+
+class DateParser:
+    """Parses statement dates, sticking with whichever format matched last"""
+
+    def __init__(self):
+        self._formats = list(DATE_FORMATS)
+
+    def __call__(self, value: str) -> Optional[date]:
+        value = value.strip()
+        for index, fmt in enumerate(self._formats):
+            try:
+                parsed = datetime.strptime(value, fmt).date()
+            except ValueError:
+                continue
+            if index:
+                self._formats.insert(0, self._formats.pop(index))
+            return parsed
+        return None
+
+
+def _find_column(header: List[str], names) -> Optional[int]:
+    for name in names:
+        if name in header:
+            return header.index(name)
+    return None
+
+
+def iter_csv_rows(path: str, stats: Counter) -> Iterator[StatementRow]:
+    """
+    Stream money-out rows from a bank CSV. Banks often put account details
+    above the table, so the header is the first row naming a date column and
+    an amount (or debit) column. Money in is counted and skipped.
+    """
+    parse_date = DateParser()
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        reader = csv.reader(f)
+        columns = None
+        for row in reader:
+            cells = [cell.strip().lower() for cell in row]
+            if columns is None:
+                if reader.line_num > CSV_HEADER_SCAN_ROWS:
+                    break
+                date_col = _find_column(cells, CSV_DATE_COLUMNS)
+                amount_col = _find_column(cells, CSV_AMOUNT_COLUMNS)
+                debit_col = _find_column(cells, CSV_DEBIT_COLUMNS)
+                if date_col is not None and (amount_col is not None or debit_col is not None):
+                    columns = (date_col, _find_column(cells, CSV_DESCRIPTION_COLUMNS), amount_col, debit_col)
+                continue
+
+            if not any(cells):
+                continue
+            stats["rows_read"] += 1
+            date_col, description_col, amount_col, debit_col = columns
+            try:
+                day = parse_date(row[date_col])
+                if debit_col is not None:
+                    amount = parse_amount(row[debit_col])
+                    amount = abs(amount) if amount else None
+                else:
+                    amount = parse_amount(row[amount_col])
+                    amount = -amount if amount is not None and amount < 0 else None
+                description = row[description_col].strip() if description_col is not None else ""
+            except IndexError:
+                day = None
+            if day is None:
+                stats["invalid"] += 1
+                continue
+            if not amount:
+                stats["credits_skipped"] += 1
+                continue
+            yield StatementRow(day, amount, description)
+
+        if columns is None:
+            raise StatementImportError("Could not find a header row with date and amount columns")
+
+
+_OFX_TRANSACTION = re.compile(r"<STMTTRN>(.*?)</STMTTRN>", re.IGNORECASE | re.DOTALL)
+_OFX_FIELD = re.compile(r"<(\w+)>([^<\r\n]*)")
+OFX_READ_SIZE = 64 * 1024
+
+
+def iter_ofx_rows(path: str, stats: Counter) -> Iterator[StatementRow]:
+    """
+    Stream money-out rows from an OFX/QFX file. Files are read in blocks and
+    only complete <STMTTRN> elements are parsed, so memory stays flat; both
+    SGML (unclosed field tags) and XML flavours are handled.
+    """
+    buffer = ""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        while True:
+            block = f.read(OFX_READ_SIZE)
+            buffer += block
+            end = 0
+            for match in _OFX_TRANSACTION.finditer(buffer):
+                end = match.end()
+                stats["rows_read"] += 1
+                fields = {name.upper(): value.strip() for name, value in _OFX_FIELD.findall(match.group(1))}
+                amount = parse_amount(fields.get("TRNAMT"))
+                try:
+                    day = datetime.strptime(fields.get("DTPOSTED", "")[:8], "%Y%m%d").date()
+                except ValueError:
+                    day = None
+                if day is None or amount is None:
+                    stats["invalid"] += 1
+                    continue
+                if amount >= 0:
+                    stats["credits_skipped"] += 1
+                    continue
+                description = fields.get("NAME") or fields.get("MEMO") or ""
+                if fields.get("NAME") and fields.get("MEMO"):
+                    description = f"{fields['NAME']} {fields['MEMO']}"
+                yield StatementRow(day, -amount, description)
+            buffer = buffer[end:]
+            # Keep only a transaction that may be cut off at the block edge
+            start = buffer.upper().rfind("<STMTTRN>")
+            buffer = buffer[start:] if start >= 0 else buffer[-len("<STMTTRN>"):]
+            if not block:
+                break
+
+
+def _chunks(rows: Iterator[StatementRow], size: int) -> Iterator[List[StatementRow]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _known_categories(db, user_id) -> Dict[str, str]:
+    """Most recent category the user chose for each description they've logged"""
+    known = {}
+    rows = (
+        db.query(Transaction.note, Transaction.category_id)
+        .filter(Transaction.user_id == user_id, Transaction.note.isnot(None))
+        .order_by(Transaction.date.desc())
+        .limit(KNOWN_DESCRIPTIONS_LIMIT)
+    )
+    for note, category_id in rows:
+        known.setdefault(normalize_description(note), category_registry.name(category_id))
+    return known
+
+
+def _existing_keys(db, user_id, chunk: List[StatementRow]) -> Counter:
+    """Dedupe keys of the user's transactions in the chunk's date range"""
+    start = datetime.combine(min(row.day for row in chunk), time.min, tzinfo=timezone.utc)
+    end = datetime.combine(max(row.day for row in chunk) + timedelta(days=1), time.min, tzinfo=timezone.utc)
+    rows = db.query(Transaction.date, Transaction.amount, Transaction.note).filter(
+        Transaction.user_id == user_id,
+        Transaction.date >= start,
+        Transaction.date < end
+    )
+    return Counter(
+        dedupe_key(user_id, row_date.astimezone(timezone.utc).date(), amount, note)
+        for row_date, amount, note in rows
+    )
+
+
+def _copy_transactions(db, rows: List[tuple]):
+    """Write rows with COPY, inside the session's transaction"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(rows)
+    buffer.seek(0)
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(
+            "COPY transactions (id, user_id, amount, category_id, date, is_impulse, note) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+
+
+def run_statement_import(job: Job, user_id, path: str, file_format: str):
+    """
+    Background job: import a spooled statement file, then delete it.
+
+    Rows are processed in chunks of CHUNK_SIZE; each chunk is deduplicated
+    against the user's existing transactions, categorized, written with COPY
+    and committed together with its category limit updates. A failed import
+    can therefore simply be retried - chunks already written are skipped as
+    duplicates.
+
+    A row counts as a duplicate only as often as it already exists, so two
+    identical coffees on the same day in one statement are both kept.
+    """
+    stats = Counter()
+    db = SessionLocal()
+    try:
+        job_registry.update(job, status="running")
+        known = _known_categories(db, user_id)
+        category_ids = {}
+        # Rows this job has written, so later chunks don't count them as
+        # pre-existing
+        written = Counter()
+        # Occurrences of each key seen in the file so far
+        seen = Counter()
+
+        rows = iter_ofx_rows(path, stats) if file_format == "ofx" else iter_csv_rows(path, stats)
+        for chunk in _chunks(rows, CHUNK_SIZE):
+            existing = _existing_keys(db, user_id, chunk)
+            copy_rows = []
+            spent = defaultdict(Decimal)
+            for row in chunk:
+                key = dedupe_key(user_id, row.day, row.amount, row.description)
+                seen[key] += 1
+                if seen[key] <= existing[key] - written[key]:
+                    stats["duplicates"] += 1
+                    continue
+                written[key] += 1
+
+                normalized = normalize_description(row.description)
+                category = known.get(normalized) or rule_category(normalized)
+                known.setdefault(normalized, category)
+                if category not in category_ids:
+                    category_ids[category] = category_registry.id(category)
+                copy_rows.append((
+                    uuid7(), user_id, to_cents(row.amount), category_ids[category],
+                    datetime.combine(row.day, IMPORTED_TIME).isoformat(), "f", row.description or None
+                ))
+                if in_current_period(row.day):
+                    spent[category] += row.amount
+
+            if copy_rows:
+                _copy_transactions(db, copy_rows)
+                adjust_spent_by_category(db, user_id, spent)
+                bump_data_version(db, [user_id])
+                db.commit()
+                stats["imported"] += len(copy_rows)
+            job_registry.update(job, progress=dict(stats))
+
+        job_registry.update(job, status="complete", progress=dict(stats), result=dict(stats))
+    except StatementImportError as e:
+        db.rollback()
+        job_registry.update(job, status="failed", progress=dict(stats), error=str(e))
+    except Exception as e:
+        db.rollback()
+        print(f"Error importing statement for job {job.id}: {e}")
+        job_registry.update(job, status="failed", progress=dict(stats), error="Import failed")
+    finally:
+        db.close()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
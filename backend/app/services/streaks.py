@@ -0,0 +1,35 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.core.ids import uuid7
+from app.models.streak import UserStreak
+
+
+def adjust_impulse_count(db: Session, user_id, delta: int):
+    """
+    Add `delta` to the user's lifetime impulse purchase count, creating their
+    user_streaks row if needed. A single upsert, so concurrent transactions
+    can't lose counts. Does not commit.
+    """
+    if not delta:
+        return
+    stmt = insert(UserStreak).values(
+        id=uuid7(),
+        user_id=user_id,
+        current_streak=0,
+        longest_streak=0,
+        impulses_avoided=0,
+        rollover_budget=0,
+        impulse_count=max(delta, 0)
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[UserStreak.user_id],
+            set_={"impulse_count": func.greatest(UserStreak.impulse_count + delta, 0)}
+        )
+    )
+
+
+def impulse_delta(was_impulse: bool, is_impulse: bool) -> int:
+    """Change in impulse count when a transaction's flag goes from one to the other"""
+    return int(bool(is_impulse)) - int(bool(was_impulse))
@@ -0,0 +1,133 @@
+"""
+Time the shared spending aggregates in app.services.analytics.
+
+Seeds synthetic users with different numbers of transactions this month
+inside a transaction, then for each user times every aggregate cold (cache
+cleared before each run) and warm (served from the data-version cache).
+The monthly summary is also timed the way the endpoints used to compute
+it - loading every transaction of the month and summing in Python - so
+the cost of that approach growing with row count is visible next to the
+grouped query staying flat. Everything is rolled back afterwards, so it
+can be pointed at a development database that has been migrated to head.
+
+Usage:
+    DATABASE_URL=postgresql://... python benchmarks/analytics.py [--sizes 100 1000 10000] [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("MINIMAX_API_KEY", "unused")
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.models.transaction import Transaction  # noqa: E402
+from app.services import analytics  # noqa: E402
+
+CATEGORIES = ["food", "transport", "shopping", "entertainment", "bills", "health", "tech", "gifts"]
+
+SEED_SQL = text("""
+    WITH category_ids AS (
+        SELECT array_agg(id) AS ids FROM categories WHERE name = ANY(:categories)
+    ),
+    new_user AS (
+        INSERT INTO users (id, email, hashed_password, name, monthly_income, fixed_expenses)
+        VALUES (gen_random_uuid(), 'analytics-' || :rows || '-' || :tag || '@example.com', 'x', 'Analytics', 300000, 100000)
+        RETURNING id
+    )
+    INSERT INTO transactions (id, user_id, amount, category_id, date, is_impulse)
+    SELECT
+        gen_random_uuid(),
+        u.id,
+        (random() * 10000)::bigint,
+        category_ids.ids[1 + (random() * 7)::int],
+        date_trunc('month', now()) + random() * (now() - date_trunc('month', now())),
+        random() < 0.1
+    FROM new_user u, category_ids, generate_series(1, :rows)
+    RETURNING user_id
+""")
+
+
+def python_summary(db, user_id, month_start):
+    """The monthly summary as the endpoints computed it before the grouped query"""
+    transactions = db.query(Transaction).filter(
+        Transaction.user_id == user_id, Transaction.date >= month_start
+    ).all()
+    total = sum(t.amount for t in transactions)
+    by_category = {}
+    for t in transactions:
+        by_category[t.category] = by_category.get(t.category, 0) + t.amount
+    impulses = [t for t in transactions if t.is_impulse]
+    return total, by_category, len(impulses), sum(t.amount for t in impulses)
+
+
+def median_ms(fn, repeat: int, before=None) -> float:
+    timings = []
+    for _ in range(repeat):
+        if before:
+            before()
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main(sizes: list, repeat: int) -> int:
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        db.execute(
+            text("INSERT INTO categories (name) SELECT unnest(CAST(:categories AS varchar[])) ON CONFLICT (name) DO NOTHING"),
+            {"categories": CATEGORIES}
+        )
+        today = date.today()
+        month_start = today.replace(day=1)
+        week_start = today - timedelta(days=6)
+        last_week_start = week_start - timedelta(days=7)
+
+        cases = [
+            ("monthly summary (python loops)", lambda u: python_summary(db, u, month_start), False),
+            ("spending_summary", lambda u: analytics.spending_summary(db, u, month_start), True),
+            ("spent_between (today)", lambda u: analytics.spent_between(db, u, today, today + timedelta(days=1)), True),
+            ("daily_series (30 days)", lambda u: analytics.daily_series(db, u, today - timedelta(days=29), today), True),
+            (
+                "heat_map (366 days)",
+                lambda u: analytics.heat_map(db, u, today - timedelta(days=365), today, 100),
+                True
+            ),
+            (
+                "period_comparison (weeks)",
+                lambda u: analytics.period_comparison(db, u, week_start, last_week_start, today + timedelta(days=1)),
+                True
+            ),
+        ]
+
+        print(f"median of {repeat} runs (ms)")
+        print(f"{'rows':>8} {'aggregate':<32} {'cold':>9} {'warm':>9}")
+        for rows in sizes:
+            user_id = db.execute(SEED_SQL, {"rows": rows, "tag": tag, "categories": CATEGORIES}).scalars().first()
+            db.execute(text("ANALYZE transactions"))
+            for label, fn, cached in cases:
+                # Dropping the whole cache between runs keeps every run cold
+                cold = median_ms(lambda: fn(user_id), repeat, before=analytics._cache.clear)
+                warm = median_ms(lambda: fn(user_id), repeat) if cached else None
+                print(f"{rows:>8,} {label:<32} {cold:>9.2f} {warm if warm is not None else float('nan'):>9.3f}")
+        return 0
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="transactions this month")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    sys.exit(main(args.sizes, args.repeat))
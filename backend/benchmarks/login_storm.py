@@ -0,0 +1,98 @@
+"""
+Login-storm benchmark.
+
+Fires a burst of concurrent logins at a running API while probing a cheap
+endpoint, and reports how much the probe latency degrades. With password
+hashing on the event loop the probe stalls for the whole storm; with the
+hashing pool it should stay close to its idle latency.
+
+Usage:
+    uvicorn app.main:app --port 8000
+    python benchmarks/login_storm.py --base-url http://localhost:8000 --logins 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+async def probe(client: httpx.AsyncClient, path: str, stop: asyncio.Event, samples: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(path)
+        samples.append(time.perf_counter() - started)
+        await asyncio.sleep(0.01)
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> float:
+    started = time.perf_counter()
+    response = await client.post(
+        "/api/v1/auth/login", data={"username": email, "password": password}
+    )
+    response.raise_for_status()
+    return time.perf_counter() - started
+
+
+def summary(label: str, samples: list):
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if len(ordered) > 1 else ordered[0]
+    print(
+        f"{label:<18} n={len(ordered):<5} "
+        f"p50={statistics.median(ordered) * 1000:7.1f}ms "
+        f"p95={p95 * 1000:7.1f}ms "
+        f"max={ordered[-1] * 1000:7.1f}ms"
+    )
+
+
+async def main(args):
+    email = f"storm-{uuid.uuid4().hex[:8]}@example.com"
+    password = "benchmark-password"
+    limits = httpx.Limits(max_connections=args.concurrency + 4)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=120, limits=limits) as client:
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={"email": email, "password": password, "name": "Storm"},
+        )
+        response.raise_for_status()
+
+        # Baseline probe latency with an idle server
+        idle = []
+        stop = asyncio.Event()
+        probe_task = asyncio.create_task(probe(client, args.probe_path, stop, idle))
+        await asyncio.sleep(2)
+        stop.set()
+        await probe_task
+
+        # Probe latency during the storm
+        busy = []
+        stop = asyncio.Event()
+        probe_task = asyncio.create_task(probe(client, args.probe_path, stop, busy))
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def bounded_login():
+            async with semaphore:
+                return await login(client, email, password)
+
+        started = time.perf_counter()
+        login_times = await asyncio.gather(*(bounded_login() for _ in range(args.logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe_task
+
+    print(f"{args.logins} logins in {elapsed:.2f}s ({args.logins / elapsed:.1f}/s)")
+    summary("login", login_times)
+    summary(f"{args.probe_path} idle", idle)
+    summary(f"{args.probe_path} storm", busy)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--probe-path", default="/health")
+    asyncio.run(main(parser.parse_args()))
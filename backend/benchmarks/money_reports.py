@@ -0,0 +1,172 @@
+"""
+Compare report queries over NUMERIC(10, 2) amounts against BIGINT cents.
+
+Seeds synthetic users and transactions inside a transaction, copies them
+into two temporary tables that differ only in the amount column - the old
+NUMERIC(10, 2) dollars ("before") and integer cents ("after") - and times
+the query shapes behind the report endpoints on each, including turning
+the results into JSON-ready floats. Everything is rolled back afterwards,
+so it can be pointed at a development database that has been migrated to
+head.
+
+Usage:
+    DATABASE_URL=postgresql://... python benchmarks/money_reports.py [--users 200] [--rows 2000] [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("MINIMAX_API_KEY", "unused")
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.core.money import from_cents  # noqa: E402
+
+CATEGORIES = ["food", "transport", "shopping", "entertainment", "bills", "health", "tech", "gifts"]
+
+SEED_SQL = text("""
+    WITH category_ids AS (
+        SELECT array_agg(id) AS ids FROM categories WHERE name = ANY(:categories)
+    ),
+    new_users AS (
+        INSERT INTO users (id, email, hashed_password, name, monthly_income, fixed_expenses)
+        SELECT gen_random_uuid(), 'money-' || g || '-' || :tag || '@example.com', 'x', 'Money', 300000, 100000
+        FROM generate_series(1, :users) AS g
+        RETURNING id
+    )
+    INSERT INTO transactions (id, user_id, amount, category_id, date, is_impulse)
+    SELECT
+        gen_random_uuid(),
+        u.id,
+        (random() * 10000)::bigint,
+        category_ids.ids[1 + (random() * 7)::int],
+        now() - random() * interval '365 days',
+        random() < 0.1
+    FROM new_users u, category_ids, generate_series(1, :rows)
+""")
+
+COPY_SQL = """
+    CREATE TEMPORARY TABLE {table} ON COMMIT DROP AS
+    SELECT user_id, category_id, date, {amount} AS amount
+    FROM transactions
+    WHERE user_id IN (SELECT id FROM users WHERE email LIKE 'money-%-' || :tag || '@example.com');
+    CREATE INDEX ON {table} (user_id, date);
+    ANALYZE {table};
+"""
+
+# (label, SQL, columns holding amounts)
+QUERIES = [
+    (
+        "weekly summary (per day, 14 days)",
+        """
+        SELECT date_trunc('day', date) AS day, SUM(amount) AS spent
+        FROM {table}
+        WHERE user_id = :user_id AND date >= now() - interval '14 days'
+        GROUP BY 1
+        """,
+        ("spent",),
+    ),
+    (
+        "spending by category (this year)",
+        """
+        SELECT category_id, SUM(amount) AS amount, AVG(amount) AS average
+        FROM {table}
+        WHERE user_id = :user_id AND date >= date_trunc('year', now())
+        GROUP BY category_id
+        """,
+        ("amount", "average"),
+    ),
+    (
+        "peer comparison (all users, 30 days)",
+        """
+        SELECT user_id, SUM(amount) AS total
+        FROM {table}
+        WHERE date >= now() - interval '30 days'
+        GROUP BY user_id
+        """,
+        ("total",),
+    ),
+    (
+        "export rows (one user, all time)",
+        """
+        SELECT date, amount
+        FROM {table}
+        WHERE user_id = :user_id
+        ORDER BY date
+        """,
+        ("amount",),
+    ),
+]
+
+VARIANTS = [
+    ("before", "money_bench_numeric", "(amount / 100.0)::numeric(10, 2)", float),
+    ("after", "money_bench_cents", "amount", from_cents),
+]
+
+
+def run(db, sql: str, params: dict, columns, to_dollars) -> list:
+    """Run a report query and convert its amounts the way an endpoint would"""
+    rows = db.execute(text(sql), params).mappings().all()
+    return [
+        {key: (to_dollars(value) if key in columns and value is not None else value) for key, value in row.items()}
+        for row in rows
+    ]
+
+
+def main(users: int, rows: int, repeat: int) -> int:
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        db.execute(
+            text("INSERT INTO categories (name) SELECT unnest(CAST(:categories AS varchar[])) ON CONFLICT (name) DO NOTHING"),
+            {"categories": CATEGORIES}
+        )
+        db.execute(SEED_SQL, {"users": users, "rows": rows, "tag": tag, "categories": CATEGORIES})
+        for _, table, amount, _ in VARIANTS:
+            for statement in COPY_SQL.format(table=table, amount=amount).split(";"):
+                if statement.strip():
+                    db.execute(text(statement), {"tag": tag})
+        user_id = db.execute(text(
+            f"SELECT user_id FROM {VARIANTS[0][1]} ORDER BY random() LIMIT 1"
+        )).scalar()
+        params = {"user_id": user_id}
+
+        print(f"{users} users x {rows} transactions, median of {repeat} runs (ms)")
+        print(f"{'query':<40} {'before':>9} {'after':>9} {'change':>8}")
+        for label, sql, columns in QUERIES:
+            medians = []
+            results = []
+            for _, table, _, to_dollars in VARIANTS:
+                statement = sql.format(table=table)
+                run(db, statement, params, columns, to_dollars)  # warm up
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    result = run(db, statement, params, columns, to_dollars)
+                    timings.append((time.perf_counter() - started) * 1000)
+                medians.append(statistics.median(timings))
+                results.append(result)
+            if len(results[0]) != len(results[1]):
+                print(f"{label}: row counts differ between variants")
+                return 1
+            before, after = medians
+            print(f"{label:<40} {before:>9.2f} {after:>9.2f} {(after - before) / before:>+8.1%}")
+        return 0
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=2000, help="transactions per user")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    sys.exit(main(args.users, args.rows, args.repeat))
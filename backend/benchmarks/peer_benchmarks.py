@@ -0,0 +1,125 @@
+"""
+Time peer benchmarks against the size of the user population.
+
+Seeds synthetic users with transactions this month and streaks inside a
+transaction, then for each population size times:
+
+- the endpoint's old approach: grouping every user's transactions for the
+  month on each request and ranking the caller with a linear scan
+- the nightly query computing all four distributions
+- the per-request lookup: the caller's own summary plus a binary search
+  over the stored quantiles
+
+Everything is rolled back afterwards (the distributions are computed with
+the query directly rather than stored), so it can be pointed at a
+development database that has been migrated to head.
+
+Usage:
+    DATABASE_URL=postgresql://... python benchmarks/peer_benchmarks.py [--users 100 1000 10000] [--rows 50] [--repeat 10]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("MINIMAX_API_KEY", "unused")
+
+from sqlalchemy import func, text  # noqa: E402
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.models.transaction import Transaction  # noqa: E402
+from app.services import analytics, peer_benchmarks  # noqa: E402
+from app.services.partitions import add_months, month_start  # noqa: E402
+
+SEED_SQL = text("""
+    WITH new_users AS (
+        INSERT INTO users (id, email, hashed_password, name, monthly_income, fixed_expenses)
+        SELECT gen_random_uuid(), 'peers-' || :tag || '-' || :batch || '-' || n || '@example.com', 'x', 'Peers', 300000, 100000
+        FROM generate_series(1, :users) AS n
+        RETURNING id
+    ),
+    streaks AS (
+        INSERT INTO user_streaks (id, user_id, current_streak, rollover_budget)
+        SELECT gen_random_uuid(), id, (random() * 60)::int, (random() * 30000)::bigint
+        FROM new_users
+    )
+    INSERT INTO transactions (id, user_id, amount, category_id, date, is_impulse)
+    SELECT
+        gen_random_uuid(),
+        u.id,
+        (random() * 10000)::bigint,
+        (SELECT id FROM categories WHERE name = 'food'),
+        date_trunc('month', now()) + random() * (now() - date_trunc('month', now())),
+        random() < 0.1
+    FROM new_users u, generate_series(1, :rows)
+    RETURNING user_id
+""")
+
+
+def linear_scan(db, user_id, start):
+    """The monthly spending percentile as the endpoint computed it before"""
+    user_spent = analytics.spending_summary(db, user_id, start).total
+    totals = db.query(func.sum(Transaction.amount)).filter(
+        Transaction.date >= start
+    ).group_by(Transaction.user_id).all()
+    values = sorted(total for total, in totals)
+    return sum(1 for v in values if v >= user_spent) / len(values) * 100
+
+
+def median_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        analytics._cache.clear()
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main(populations: list, rows: int, repeat: int) -> int:
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        month = month_start(date.today())
+        params = {"month_start": month, "month_end": add_months(month, 1), "fractions": peer_benchmarks.FRACTIONS}
+        seeded = 0
+        db.execute(text("INSERT INTO categories (name) VALUES ('food') ON CONFLICT (name) DO NOTHING"))
+
+        print(f"median of {repeat} runs (ms), {rows} transactions per user")
+        print(f"{'users':>8} {'linear scan':>12} {'nightly query':>14} {'lookup':>9}")
+        for batch, users in enumerate(populations):
+            user_id = db.execute(
+                SEED_SQL, {"users": users - seeded, "rows": rows, "tag": tag, "batch": batch}
+            ).scalars().first()
+            seeded = users
+            db.execute(text("ANALYZE transactions"))
+            db.execute(text("ANALYZE user_streaks"))
+
+            stored = {row.metric: row.quantiles for row in db.execute(peer_benchmarks.DISTRIBUTIONS_SQL, params)}
+
+            def lookup():
+                spent = analytics.spending_summary(db, user_id, month).total
+                return peer_benchmarks.percentile(stored["monthly_spending"], spent, True)
+
+            scan = median_ms(lambda: linear_scan(db, user_id, month), repeat)
+            nightly = median_ms(lambda: db.execute(peer_benchmarks.DISTRIBUTIONS_SQL, params).all(), repeat)
+            request = median_ms(lookup, repeat)
+            print(f"{users:>8,} {scan:>12.2f} {nightly:>14.2f} {request:>9.2f}")
+        return 0
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1000, 10000], help="population sizes, ascending")
+    parser.add_argument("--rows", type=int, default=50, help="transactions per user this month")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    sys.exit(main(args.users, args.rows, args.repeat))
@@ -0,0 +1,104 @@
+"""
+Compare report export formats and check that memory stays flat as
+reports grow.
+
+Seeds one synthetic user per size inside a transaction, writes each user's
+yearly report in every export format (parquet only if pyarrow is
+installed) with app.services.report_export and reports the time taken,
+the Python heap peak (tracemalloc) while writing and the file size. The
+peak should stay roughly constant from the smallest size to the largest.
+Everything is rolled back afterwards, so it can be pointed at a
+development database that has been migrated to head.
+
+Usage:
+    DATABASE_URL=postgresql://... python benchmarks/report_export.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("MINIMAX_API_KEY", "unused")
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.report_export import EXPORT_MEDIA_TYPES, parquet_available, write_export  # noqa: E402
+
+CATEGORIES = ["food", "transport", "shopping", "entertainment", "bills", "health", "tech", "gifts"]
+
+SEED_SQL = text("""
+    WITH category_ids AS (
+        SELECT array_agg(id) AS ids FROM categories WHERE name = ANY(:categories)
+    ),
+    new_user AS (
+        INSERT INTO users (id, email, hashed_password, name, monthly_income, fixed_expenses)
+        VALUES (gen_random_uuid(), 'export-' || :rows || '-' || :tag || '@example.com', 'x', 'Export', 300000, 100000)
+        RETURNING id
+    )
+    INSERT INTO transactions (id, user_id, amount, category_id, date, is_impulse, note)
+    SELECT
+        gen_random_uuid(),
+        u.id,
+        (random() * 10000)::bigint,
+        category_ids.ids[1 + (random() * 7)::int],
+        date_trunc('year', now()) + random() * (now() - date_trunc('year', now())),
+        random() < 0.1,
+        'note ' || g
+    FROM new_user u, category_ids, generate_series(1, :rows) AS g
+    RETURNING user_id
+""")
+
+
+def main(sizes: list) -> int:
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        db.execute(
+            text("INSERT INTO categories (name) SELECT unnest(CAST(:categories AS varchar[])) ON CONFLICT (name) DO NOTHING"),
+            {"categories": CATEGORIES}
+        )
+        now = datetime.now()
+        start_date = now.replace(month=1, day=1)
+
+        formats = [name for name in EXPORT_MEDIA_TYPES if name != "parquet" or parquet_available()]
+
+        print(f"{'rows':>10} {'format':<8} {'seconds':>9} {'peak MB':>9} {'file MB':>9}")
+        for rows in sizes:
+            user_id = db.execute(SEED_SQL, {"rows": rows, "tag": tag, "categories": CATEGORIES}).scalars().first()
+            user = db.get(User, user_id)
+
+            for export_format in formats:
+                fd, path = tempfile.mkstemp(suffix=f".{export_format}")
+                os.close(fd)
+                tracemalloc.start()
+                started = time.perf_counter()
+                write_export(db, path, user, "yearly", start_date, now, export_format)
+                elapsed = time.perf_counter() - started
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                size = os.path.getsize(path)
+                os.remove(path)
+                print(
+                    f"{rows:>10,} {export_format:<8} {elapsed:>9.2f} {peak / 1024 / 1024:>9.1f} "
+                    f"{size / 1024 / 1024:>9.1f}"
+                )
+        return 0
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="transactions per report")
+    args = parser.parse_args()
+    sys.exit(main(args.sizes))
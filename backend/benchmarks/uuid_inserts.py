@@ -0,0 +1,111 @@
+"""
+Compare insert throughput and primary key index size for random (v4) and
+time-ordered (v7) UUID keys.
+
+For each key kind, creates an unlogged table shaped like transactions with
+a UUID primary key and inserts --rows rows in batches of --batch through
+multi-row INSERTs, the way the bulk endpoints write. Reports rows per second
+overall and for the first and last tenth of the run (random keys slow down
+as the index outgrows the buffer cache; ordered keys append to the
+rightmost leaf and don't) and the final primary key index size (random
+keys leave half-full pages behind page splits). Everything is rolled back
+afterwards.
+
+Usage:
+    DATABASE_URL=postgresql://... python benchmarks/uuid_inserts.py [--rows 3000000] [--batch 5000]
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("MINIMAX_API_KEY", "unused")
+
+from psycopg2.extras import execute_values  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.core.ids import uuid7  # noqa: E402
+
+KEY_KINDS = [("uuid4", uuid.uuid4), ("uuid7", uuid7)]
+
+CREATE_SQL = """
+    CREATE UNLOGGED TABLE {table} (
+        id uuid PRIMARY KEY,
+        user_id uuid NOT NULL,
+        amount bigint NOT NULL,
+        category_id smallint NOT NULL,
+        date timestamptz NOT NULL DEFAULT now()
+    )
+"""
+
+
+def run(cursor, table: str, make_id, rows: int, batch: int) -> dict:
+    cursor.execute(CREATE_SQL.format(table=table))
+    user_ids = [uuid.uuid4() for _ in range(50)]
+    tenth = max(rows // 10, batch)
+    rates = []
+    window_started, window_rows = time.perf_counter(), 0
+    started = window_started
+
+    inserted = 0
+    while inserted < rows:
+        count = min(batch, rows - inserted)
+        values = [
+            (str(make_id()), str(user_ids[i % len(user_ids)]), 100 + i % 9000, 1 + i % 8)
+            for i in range(inserted, inserted + count)
+        ]
+        execute_values(
+            cursor,
+            f"INSERT INTO {table} (id, user_id, amount, category_id) VALUES %s",
+            values,
+            template="(%s::uuid, %s::uuid, %s, %s)",
+            page_size=count
+        )
+        inserted += count
+        window_rows += count
+        if window_rows >= tenth or inserted == rows:
+            now = time.perf_counter()
+            rates.append(window_rows / (now - window_started))
+            window_started, window_rows = now, 0
+
+    elapsed = time.perf_counter() - started
+    cursor.execute("SELECT pg_relation_size(%s)", (f"{table}_pkey",))
+    index_size = cursor.fetchone()[0]
+    return {
+        "overall": rows / elapsed,
+        "first": rates[0],
+        "last": rates[-1],
+        "index_mb": index_size / 1024 / 1024,
+    }
+
+
+def main(rows: int, batch: int) -> int:
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        results = {}
+        for name, make_id in KEY_KINDS:
+            print(f"inserting {rows:,} rows with {name} keys...", flush=True)
+            results[name] = run(cursor, f"uuid_bench_{name}", make_id, rows, batch)
+
+        print(f"\n{'keys':<6} {'rows/s':>10} {'first 10%':>10} {'last 10%':>10} {'pkey MB':>9}")
+        for name, result in results.items():
+            print(
+                f"{name:<6} {result['overall']:>10,.0f} {result['first']:>10,.0f} {result['last']:>10,.0f} "
+                f"{result['index_mb']:>9.1f}"
+            )
+        return 0
+    finally:
+        connection.rollback()
+        connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--batch", type=int, default=5000)
+    args = parser.parse_args()
+    sys.exit(main(args.rows, args.batch))
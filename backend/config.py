@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 class Settings(BaseSettings):
     DATABASE_URL: str
@@ -9,7 +9,16 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     MINIMAX_API_KEY: str
     MINIMAX_API_URL: str
+    LLM_DAILY_TOKEN_BUDGET: int = 20000  # per user; 0 disables throttling
+    LLM_COST_PER_1K_PROMPT_TOKENS: float = 0.0
+    LLM_COST_PER_1K_COMPLETION_TOKENS: float = 0.0
     CORS_ORIGINS: List[str] = ["http://localhost:5173", "http://localhost:3000"]
+    # Authenticated-user cache (app.core.user_cache); with USER_CACHE_REDIS
+    # it is shared through REDIS_URL with the v1 API's cache
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_REDIS: bool = False
+    REDIS_URL: Optional[str] = "redis://localhost:6379/0"
     
     class Config:
         env_file = ".env"
@@ -1,4 +1,5 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from config import settings
@@ -16,9 +17,12 @@ from routes import (
     insights
 )
 from services.scheduler import init_scheduler, shutdown_scheduler
+from app.core.categories import UnknownCategory, ensure_standard_categories
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
+with engine.begin() as connection:
+    ensure_standard_categories(connection)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -36,6 +40,10 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+@app.exception_handler(UnknownCategory)
+async def unknown_category_handler(request: Request, exc: UnknownCategory):
+    return JSONResponse(status_code=422, content={"detail": str(exc)})
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,8 @@
+from sqlalchemy import Column, SmallInteger, String
+from database import Base
+
+class Category(Base):
+    __tablename__ = "categories"
+    
+    id = Column(SmallInteger, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
@@ -1,18 +1,20 @@
-from sqlalchemy import Column, String, Numeric, ForeignKey, Date, DateTime, Integer
+from sqlalchemy import Column, ForeignKey, Date, DateTime, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 from datetime import datetime
+from app.core.categories import CategoryMixin
+from app.core.money import Money
+from app.core.ids import uuid7
 from database import Base
+from models.category import Category  # noqa: F401 - categories must be in the metadata
 
-class CategoryLimit(Base):
+class CategoryLimit(CategoryMixin, Base):
     __tablename__ = "category_limits"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
-    category = Column(String, nullable=False)
-    monthly_limit = Column(Numeric(10, 2), nullable=False)
-    spent = Column(Numeric(10, 2), default=0)
+    monthly_limit = Column(Money, nullable=False)
+    spent = Column(Money, default=0)
     reset_date = Column(Date, default=datetime.utcnow)
     
     user = relationship("User", backref="category_limits")
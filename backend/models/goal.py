@@ -1,18 +1,19 @@
-from sqlalchemy import Column, String, Numeric, ForeignKey, Date, DateTime
+from sqlalchemy import Column, String, ForeignKey, Date, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 from datetime import datetime
+from app.core.money import Money
+from app.core.ids import uuid7
 from database import Base
 
 class Goal(Base):
     __tablename__ = "goals"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
-    current = Column(Numeric(10, 2), default=0)
-    target = Column(Numeric(10, 2), nullable=False)
+    current = Column(Money, default=0)
+    target = Column(Money, nullable=False)
     color = Column(String, default="bg-blue-500")
     deadline = Column(Date)
     created_at = Column(DateTime, default=datetime.utcnow)
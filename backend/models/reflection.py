@@ -1,19 +1,26 @@
 from sqlalchemy import Column, String, ForeignKey, Date, Text, DateTime, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-import uuid
 from datetime import datetime
+from app.core.ids import uuid7
 from database import Base
 
 class Reflection(Base):
     __tablename__ = "reflections"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     date = Column(Date, nullable=False, index=True)
     regret_purchase = Column(Text)
     good_purchase = Column(Text)
     notes = Column(Text)
+    
+    # LLM analysis, computed in the background when the reflection is written
+    analysis_triggers = Column(JSONB)
+    analysis_suggestions = Column(JSONB)
+    analysis_hash = Column(String(64))
+    analyzed_at = Column(DateTime)
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     
     user = relationship("User", backref="reflections")
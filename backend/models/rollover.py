@@ -1,17 +1,18 @@
-from sqlalchemy import Column, Numeric, ForeignKey, Date, Boolean, DateTime
+from sqlalchemy import Column, ForeignKey, Date, Boolean, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 from datetime import datetime
+from app.core.money import Money
+from app.core.ids import uuid7
 from database import Base
 
 class BudgetRollover(Base):
     __tablename__ = "budget_rollovers"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     date = Column(Date, nullable=False, index=True)
-    unused_amount = Column(Numeric(10, 2), nullable=False)
+    unused_amount = Column(Money, nullable=False)
     rollover_applied = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     
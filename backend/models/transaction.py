@@ -1,19 +1,26 @@
-from sqlalchemy import Column, String, Numeric, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, DateTime, Boolean, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 from datetime import datetime
+from app.core.categories import CategoryMixin
+from app.core.money import Money
+from app.core.ids import uuid7
 from database import Base
+from models.category import Category  # noqa: F401 - categories must be in the metadata
 
-class Transaction(Base):
+class Transaction(CategoryMixin, Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_user_id_date", "user_id", "date"),
+        Index("ix_transactions_user_id_category_date", "user_id", "category_id", "date"),
+        Index("ix_transactions_user_id_date_impulse", "user_id", "date", postgresql_where=text("is_impulse")),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
-    amount = Column(Numeric(10, 2), nullable=False)
-    category = Column(String, nullable=False, index=True)
-    date = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
-    is_impulse = Column(Boolean, default=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    amount = Column(Money, nullable=False)
+    date = Column(DateTime, primary_key=True, default=datetime.utcnow, index=True)
+    is_impulse = Column(Boolean, default=False)
     note = Column(Text)
     emergency_reason = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
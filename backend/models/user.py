@@ -1,7 +1,8 @@
-from sqlalchemy import Column, String, Numeric, DateTime, Integer
+from sqlalchemy import Column, String, DateTime, Integer, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import datetime
+from app.core.money import Money
 from database import Base
 
 class User(Base):
@@ -11,9 +12,10 @@ class User(Base):
     email = Column(String, unique=True, nullable=False, index=True)
     name = Column(String, nullable=False)
     hashed_password = Column(String, nullable=False)
-    monthly_income = Column(Numeric(10, 2), default=0)
-    fixed_expenses = Column(Numeric(10, 2), default=0)
+    monthly_income = Column(Money, default=0)
+    fixed_expenses = Column(Money, default=0)
     timezone = Column(String, default="UTC")
+    data_version = Column(BigInteger, nullable=False, default=0, server_default="0")  # Backs ETags
     created_at = Column(DateTime, default=datetime.utcnow)
     
     @property
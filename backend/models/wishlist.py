@@ -1,8 +1,9 @@
-from sqlalchemy import Column, String, Numeric, ForeignKey, DateTime, Integer, Enum
+from sqlalchemy import Column, String, ForeignKey, DateTime, Integer, Enum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 from datetime import datetime, timedelta
+from app.core.money import Money
+from app.core.ids import uuid7
 from database import Base
 import enum
 
@@ -15,10 +16,10 @@ class WishlistStatus(str, enum.Enum):
 class WishlistItem(Base):
     __tablename__ = "wishlist_items"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
-    price = Column(Numeric(10, 2), nullable=False)
+    price = Column(Money, nullable=False)
     cooldown_days = Column(Integer, nullable=False)
     added_date = Column(DateTime, default=datetime.utcnow, index=True)
     purchased_date = Column(DateTime)
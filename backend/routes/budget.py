@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_
 from datetime import date, timedelta, datetime
 from typing import List
 from database import get_db
 from models.user import User
-from models.transaction import Transaction
 from models.budget_rollover import BudgetRollover
 from models.streak import UserStreak
 from utils.deps import get_current_user
+from app.core.dates import user_day_window
+from app.services.analytics import MAX_HEAT_MAP_DAYS, heat_map, period_comparison, spent_between
 
 router = APIRouter(prefix="/api/budget", tags=["budget"])
 
@@ -28,14 +29,9 @@ def get_today_budget(
     
     rollover_budget = streak.rollover_budget if streak else 0.0
     
-    # Get today's spending
-    today = date.today()
-    today_spent = db.query(func.sum(Transaction.amount)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date == today
-        )
-    ).scalar() or 0.0
+    # Get today's spending (the user's local day)
+    today, day_start, day_end = user_day_window(current_user)
+    today_spent = spent_between(db, current_user.id, day_start, day_end)
     
     available = daily_limit + rollover_budget - today_spent
     
@@ -51,50 +47,27 @@ def get_today_budget(
 
 @router.get("/history")
 def get_budget_history(
-    days: int = 30,
+    days: int = Query(30, ge=1, le=MAX_HEAT_MAP_DAYS),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get spending history for heat map (last N days)"""
+    """Get spending history for heat map (last N days, up to a year)"""
     end_date = date.today()
     start_date = end_date - timedelta(days=days - 1)
     
     # Get daily limit
     daily_limit = current_user.daily_limit
     
-    # Get all transactions in range
-    transactions = db.query(
-        Transaction.date,
-        func.sum(Transaction.amount).label("spent")
-    ).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= start_date,
-            Transaction.date <= end_date
-        )
-    ).group_by(Transaction.date).all()
-    
-    # Create dict for easy lookup
-    spending_by_date = {t.date: t.spent for t in transactions}
-    
-    # Build array for each day
-    history = []
-    for i in range(days):
-        day = start_date + timedelta(days=i)
-        spent = spending_by_date.get(day, 0.0)
-        percentage = (spent / daily_limit * 100) if daily_limit > 0 else 0
-        
-        history.append({
-            "date": day,
-            "spent": spent,
+    return [
+        {
+            "date": d.day,
+            "spent": d.spent,
             "daily_limit": daily_limit,
-            "percentage": percentage,
-            "status": "over" if spent > daily_limit else 
-                     "warning" if percentage > 80 else 
-                     "safe" if percentage <= 50 else "ok"
-        })
-    
-    return history
+            "percentage": d.percentage,
+            "status": d.status
+        }
+        for d in heat_map(db, current_user.id, start_date, end_date, daily_limit)
+    ]
 
 @router.get("/rollover/history")
 def get_rollover_history(
@@ -125,15 +98,10 @@ def calculate_and_apply_rollover(
     Calculate yesterday's unused budget and apply to rollover
     (Max 3 days of rollover allowed)
     """
-    yesterday = date.today() - timedelta(days=1)
+    yesterday, day_start, day_end = user_day_window(current_user, days_ago=1)
     
     # Get yesterday's spending
-    yesterday_spent = db.query(func.sum(Transaction.amount)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date == yesterday
-        )
-    ).scalar() or 0.0
+    yesterday_spent = spent_between(db, current_user.id, day_start, day_end)
     
     daily_limit = current_user.daily_limit
     unused = max(0, daily_limit - yesterday_spent)
@@ -191,34 +159,15 @@ def get_weekly_savings(
     """Calculate savings for this week vs last week"""
     today = date.today()
     
-    # This week (last 7 days)
+    # This week (last 7 days) and last week (days 7-13 ago) in one scan
     week_start = today - timedelta(days=6)
-    this_week_spent = db.query(func.sum(Transaction.amount)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= week_start,
-            Transaction.date <= today
-        )
-    ).scalar() or 0.0
-    
-    # Last week (days 7-13 ago)
-    last_week_end = week_start - timedelta(days=1)
-    last_week_start = last_week_end - timedelta(days=6)
-    last_week_spent = db.query(func.sum(Transaction.amount)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= last_week_start,
-            Transaction.date <= last_week_end
-        )
-    ).scalar() or 0.0
-    
-    savings = last_week_spent - this_week_spent
-    percentage_change = ((last_week_spent - this_week_spent) / last_week_spent * 100) if last_week_spent > 0 else 0
+    last_week_start = week_start - timedelta(days=7)
+    comparison = period_comparison(db, current_user.id, week_start, last_week_start, today + timedelta(days=1))
     
     return {
-        "this_week_spent": this_week_spent,
-        "last_week_spent": last_week_spent,
-        "savings": savings,
-        "percentage_change": percentage_change,
-        "improved": savings > 0
+        "this_week_spent": comparison.current,
+        "last_week_spent": comparison.previous,
+        "savings": comparison.change,
+        "percentage_change": comparison.percentage_change,
+        "improved": comparison.change > 0
     }
@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
 from datetime import date, timedelta
 from pydantic import BaseModel
 from database import get_db
 from models.user import User
-from models.transaction import Transaction
 from models.reflection import Reflection
 from services.llm import minimax_service
+from services.llm_metrics import llm_metrics
+from services.reflection_analysis import analyze_reflection_job, needs_analysis
 from utils.deps import get_current_user
+from app.services.analytics import spending_summary
 
 router = APIRouter(prefix="/api/insights", tags=["insights"])
 
@@ -32,7 +34,8 @@ async def categorize_transaction(
     """Auto-categorize transaction using LLM"""
     category = await minimax_service.categorize_transaction(
         description=request.description,
-        amount=request.amount
+        amount=request.amount,
+        user_id=str(current_user.id)
     )
     return {"category": category}
 
@@ -46,26 +49,8 @@ async def analyze_spending(
     month_start = today.replace(day=1)
     
     # Gather spending data
-    transactions = db.query(Transaction).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= month_start
-        )
-    ).all()
-    
-    total_spent = sum(t.amount for t in transactions)
-    
-    # Category breakdown
-    category_spending = {}
-    for t in transactions:
-        category_spending[t.category] = category_spending.get(t.category, 0) + t.amount
-    
-    top_category = max(category_spending.items(), key=lambda x: x[1]) if category_spending else ("Other", 0)
-    
-    # Impulse data
-    impulse_transactions = [t for t in transactions if t.is_impulse]
-    impulse_count = len(impulse_transactions)
-    impulse_total = sum(t.amount for t in impulse_transactions)
+    summary = spending_summary(db, current_user.id, month_start)
+    top_category = summary.top_category
     
     # Streak
     from models.streak import UserStreak
@@ -81,17 +66,20 @@ async def analyze_spending(
     
     # Prepare data for LLM
     spending_data = {
-        "total_spent": total_spent,
+        "total_spent": summary.total,
         "budget": monthly_budget,
         "top_category": top_category[0],
         "top_category_amount": top_category[1],
-        "impulse_count": impulse_count,
-        "impulse_total": impulse_total,
+        "impulse_count": summary.impulse_count,
+        "impulse_total": summary.impulse_total,
         "streak": current_streak
     }
     
     # Get AI insights
-    insights = await minimax_service.analyze_spending_pattern(spending_data)
+    insights = await minimax_service.analyze_spending_pattern(
+        spending_data,
+        user_id=str(current_user.id)
+    )
     
     return {
         "insights": insights,
@@ -103,13 +91,57 @@ async def analyze_reflection(
     request: ReflectionAnalysisRequest,
     current_user: User = Depends(get_current_user)
 ):
-    """Analyze reflection for emotional triggers and suggestions"""
+    """
+    Analyze ad-hoc reflection text for emotional triggers and suggestions.
+    Saved reflections are analysed once at write time; read those from
+    /reflections/{reflection_id}/analysis instead.
+    """
     analysis = await minimax_service.analyze_reflection(
         reflection_text=request.reflection_text,
-        regret_purchase=request.regret_purchase
+        regret_purchase=request.regret_purchase,
+        user_id=str(current_user.id)
     )
     return analysis
 
+@router.get("/reflections/{reflection_id}/analysis")
+def get_reflection_analysis(
+    reflection_id: str,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the stored analysis of a saved reflection"""
+    reflection = db.query(Reflection).filter(
+        and_(
+            Reflection.id == reflection_id,
+            Reflection.user_id == current_user.id
+        )
+    ).first()
+    
+    if not reflection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reflection not found"
+        )
+    
+    # Analysis missing or stale (e.g. the LLM was down at write time)
+    if needs_analysis(reflection):
+        llm_metrics.record_cache("analyze_reflection", str(current_user.id), hit=False)
+        background_tasks.add_task(analyze_reflection_job, reflection.id)
+        return {
+            "status": "pending",
+            "triggers": [],
+            "suggestions": []
+        }
+    
+    llm_metrics.record_cache("analyze_reflection", str(current_user.id), hit=True)
+    return {
+        "status": "complete",
+        "triggers": reflection.analysis_triggers or [],
+        "suggestions": reflection.analysis_suggestions or [],
+        "analyzed_at": reflection.analyzed_at
+    }
+
 @router.post("/impulse-question")
 async def generate_impulse_question(
     request: ImpulseQuestionRequest,
@@ -118,6 +150,14 @@ async def generate_impulse_question(
     """Generate thoughtful question for impulse check"""
     question = await minimax_service.generate_impulse_question(
         item_name=request.item_name,
-        price=request.price
+        price=request.price,
+        user_id=str(current_user.id)
     )
     return {"question": question}
+
+@router.get("/usage")
+def get_llm_usage(
+    current_user: User = Depends(get_current_user)
+):
+    """Get today's LLM token usage and remaining budget for the current user"""
+    return llm_metrics.user_usage(str(current_user.id))
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from datetime import date, datetime
@@ -8,16 +8,19 @@ from models.user import User
 from models.reflection import Reflection
 from schemas import ReflectionCreate, ReflectionResponse
 from utils.deps import get_current_user
+from services.reflection_analysis import analyze_reflection_job, needs_analysis
+from services.llm_metrics import llm_metrics
 
 router = APIRouter(prefix="/api/reflections", tags=["reflections"])
 
 @router.post("/", response_model=ReflectionResponse, status_code=status.HTTP_201_CREATED)
 def create_reflection(
     reflection: ReflectionCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Create today's daily reflection (one per day)"""
+    """Create today's daily reflection (one per day) and queue its analysis"""
     today = date.today()
     
     # Check if reflection already exists for today
@@ -42,6 +45,9 @@ def create_reflection(
     db.add(db_reflection)
     db.commit()
     db.refresh(db_reflection)
+    
+    if needs_analysis(db_reflection):
+        background_tasks.add_task(analyze_reflection_job, db_reflection.id)
     return db_reflection
 
 @router.get("/today", response_model=Optional[ReflectionResponse])
@@ -112,10 +118,11 @@ def get_reflection(
 def update_reflection(
     reflection_id: str,
     reflection_update: ReflectionCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Update existing reflection"""
+    """Update existing reflection, re-analysing it only if its text changed"""
     db_reflection = db.query(Reflection).filter(
         and_(
             Reflection.id == reflection_id,
@@ -134,6 +141,12 @@ def update_reflection(
     
     db.commit()
     db.refresh(db_reflection)
+    
+    if needs_analysis(db_reflection):
+        background_tasks.add_task(analyze_reflection_job, db_reflection.id)
+    else:
+        # Text unchanged, the stored analysis is still valid
+        llm_metrics.record_cache("analyze_reflection", str(current_user.id), hit=True)
     return db_reflection
 
 @router.delete("/{reflection_id}", status_code=status.HTTP_204_NO_CONTENT)
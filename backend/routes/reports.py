@@ -1,13 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, case
+from sqlalchemy import and_
 from datetime import date, timedelta
 from typing import Dict, Any
 from database import get_db
 from models.user import User
-from models.transaction import Transaction
 from models.reflection import Reflection
 from utils.deps import get_current_user
+from app.services import peer_benchmarks
+from app.services.analytics import MAX_HEAT_MAP_DAYS, daily_series, heat_map, spending_summary
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
@@ -20,50 +21,28 @@ def get_weekly_summary(
     today = date.today()
     week_start = today - timedelta(days=6)
     
-    daily_limit = current_user.daily_limit
-    
-    # Get this week's transactions
-    transactions = db.query(Transaction).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= week_start,
-            Transaction.date <= today
-        )
-    ).all()
+    last_week_start = week_start - timedelta(days=7)
     
-    # Calculate metrics
-    total_spent = sum(t.amount for t in transactions)
-    weekly_budget = daily_limit * 7
-    saved = weekly_budget - total_spent
-    
-    impulse_count = sum(1 for t in transactions if t.is_impulse)
-    
-    # Count safe days (under budget)
-    daily_spending = {}
-    for t in transactions:
-        daily_spending[t.date] = daily_spending.get(t.date, 0) + t.amount
+    daily_limit = current_user.daily_limit
     
-    safe_days = sum(1 for spent in daily_spending.values() if spent <= daily_limit)
+    # Per-day totals for this week and last week
+    days = daily_series(db, current_user.id, last_week_start, today)
+    this_week = [d for d in days if d.day >= week_start]
+    total_spent = round(sum(d.spent for d in this_week), 2)
+    impulse_count = sum(d.impulses for d in this_week)
+    # Days with spending that stayed under the limit
+    safe_days = sum(1 for d in this_week if 0 < d.spent <= daily_limit)
+    last_week_spent = round(sum(d.spent for d in days if d.day < week_start), 2)
     
-    # Get streak from database
     from models.streak import UserStreak
-    streak = db.query(UserStreak).filter(
+    current_streak = db.query(UserStreak.current_streak).filter(
         UserStreak.user_id == current_user.id
-    ).first()
+    ).scalar()
     
-    current_streak = streak.current_streak if streak else 0
-    
-    # Compare to last week
-    last_week_end = week_start - timedelta(days=1)
-    last_week_start = last_week_end - timedelta(days=6)
-    
-    last_week_spent = db.query(func.sum(Transaction.amount)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= last_week_start,
-            Transaction.date <= last_week_end
-        )
-    ).scalar() or 0.0
+    # Calculate metrics
+    current_streak = current_streak or 0
+    weekly_budget = daily_limit * 7
+    saved = weekly_budget - total_spent
     
     last_week_saved = weekly_budget - last_week_spent
     savings_improvement = saved - last_week_saved
@@ -100,32 +79,9 @@ def get_monthly_summary(
     today = date.today()
     month_start = today.replace(day=1)
     
-    # Get this month's transactions
-    transactions = db.query(Transaction).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= month_start
-        )
-    ).all()
-    
-    total_spent = sum(t.amount for t in transactions)
-    
-    # Spending by category
-    category_spending = {}
-    for t in transactions:
-        category_spending[t.category] = category_spending.get(t.category, 0) + t.amount
-    
-    # Sort categories by spending
-    top_categories = sorted(
-        [{"category": k, "amount": v} for k, v in category_spending.items()],
-        key=lambda x: x["amount"],
-        reverse=True
-    )
-    
-    # Impulse purchases
-    impulse_transactions = [t for t in transactions if t.is_impulse]
-    impulse_total = sum(t.amount for t in impulse_transactions)
-    impulse_count = len(impulse_transactions)
+    summary = spending_summary(db, current_user.id, month_start)
+    total_spent = summary.total
+    top_categories = [{"category": k, "amount": v} for k, v in summary.categories]
     
     # Days data
     days_in_month = (today - month_start).days + 1
@@ -144,9 +100,9 @@ def get_monthly_summary(
             "percentage_used": (total_spent / monthly_budget * 100) if monthly_budget > 0 else 0
         },
         "impulses": {
-            "count": impulse_count,
-            "total": impulse_total,
-            "average": impulse_total / impulse_count if impulse_count > 0 else 0
+            "count": summary.impulse_count,
+            "total": summary.impulse_total,
+            "average": summary.impulse_average
         },
         "categories": top_categories,
         "daily_average": total_spent / days_in_month if days_in_month > 0 else 0
@@ -154,55 +110,26 @@ def get_monthly_summary(
 
 @router.get("/heat-map")
 def get_heat_map_data(
-    days: int = 30,
+    days: int = Query(30, ge=1, le=MAX_HEAT_MAP_DAYS),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get spending heat map data for last N days"""
+    """Get spending heat map data for last N days (up to a year)"""
     end_date = date.today()
     start_date = end_date - timedelta(days=days - 1)
     
-    daily_limit = current_user.daily_limit
-    
-    # Get daily spending
-    daily_spending = db.query(
-        Transaction.date,
-        func.sum(Transaction.amount).label("amount")
-    ).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= start_date,
-            Transaction.date <= end_date
-        )
-    ).group_by(Transaction.date).all()
-    
-    spending_dict = {d.date: d.amount for d in daily_spending}
-    
-    # Build heat map array
-    heat_map = []
-    for i in range(days):
-        day = start_date + timedelta(days=i)
-        spent = spending_dict.get(day, 0.0)
-        percentage = (spent / daily_limit * 100) if daily_limit > 0 else 0
-        
-        status = "safe" if percentage <= 50 else \
-                "ok" if percentage <= 80 else \
-                "warning" if percentage <= 100 else "over"
-        
-        heat_map.append({
-            "date": day,
-            "spent": spent,
-            "percentage": percentage,
-            "status": status
-        })
+    series = [
+        {"date": d.day, "spent": d.spent, "percentage": d.percentage, "status": d.status}
+        for d in heat_map(db, current_user.id, start_date, end_date, current_user.daily_limit)
+    ]
     
     # Summary stats
-    total_days = len(heat_map)
-    safe_days = sum(1 for d in heat_map if d["status"] == "safe")
-    over_days = sum(1 for d in heat_map if d["status"] == "over")
+    total_days = len(series)
+    safe_days = sum(1 for d in series if d["status"] == "safe")
+    over_days = sum(1 for d in series if d["status"] == "over")
     
     return {
-        "heat_map": heat_map,
+        "heat_map": series,
         "summary": {
             "total_days": total_days,
             "safe_days": safe_days,
@@ -218,28 +145,15 @@ def get_peer_benchmarks(
 ):
     """
     Get peer benchmarks (anonymized comparison with other users)
-    Note: This is a simplified version. Production would need proper anonymization
-    and aggregation of sufficient user data.
+    Percentiles come from distributions precomputed nightly across all
+    users, so only the caller's own rows are read here. Metrics without
+    enough users to compare against report the 50th percentile.
     """
     today = date.today()
     month_start = today.replace(day=1)
     
-    # Get user's monthly spending
-    user_spent = db.query(func.sum(Transaction.amount)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= month_start
-        )
-    ).scalar() or 0.0
-    
-    # Get user's impulse count
-    user_impulses = db.query(func.count(Transaction.id)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date >= month_start,
-            Transaction.is_impulse == True
-        )
-    ).scalar() or 0
+    # Get user's monthly spending and impulse count
+    summary = spending_summary(db, current_user.id, month_start)
     
     # Get user's streak
     from models.streak import UserStreak
@@ -250,45 +164,22 @@ def get_peer_benchmarks(
     current_streak = user_streak.current_streak if user_streak else 0
     rollover = user_streak.rollover_budget if user_streak else 0.0
     
-    # Get all users' monthly spending for comparison
-    all_users_spending = db.query(
-        Transaction.user_id,
-        func.sum(Transaction.amount).label("total")
-    ).filter(
-        Transaction.date >= month_start
-    ).group_by(Transaction.user_id).all()
-    
-    spending_values = sorted([u.total for u in all_users_spending])
-    total_users = len(spending_values)
+    stored = peer_benchmarks.distributions(db)
     
-    if total_users == 0:
-        percentile = 50
-    else:
-        user_rank = sum(1 for v in spending_values if v >= user_spent)
-        percentile = (user_rank / total_users * 100) if total_users > 0 else 50
+    def benchmark(metric: str, value) -> Dict[str, Any]:
+        lower_is_better = peer_benchmarks.METRICS[metric]
+        quantiles = stored.get(metric)
+        return {
+            "user_value": value,
+            "percentile": round(peer_benchmarks.percentile(quantiles, value or 0, lower_is_better), 1) if quantiles else 50,
+            "interpretation": "Lower is better" if lower_is_better else "Higher is better"
+        }
     
-    # Mock percentiles for other metrics (in production, calculate from real data)
     return {
-        "monthly_spending": {
-            "user_value": user_spent,
-            "percentile": percentile,
-            "interpretation": "Lower is better"
-        },
-        "impulse_purchases": {
-            "user_value": user_impulses,
-            "percentile": 45,  # Mock value
-            "interpretation": "Lower is better"
-        },
-        "savings_streak": {
-            "user_value": current_streak,
-            "percentile": 60,  # Mock value
-            "interpretation": "Higher is better"
-        },
-        "rollover_savings": {
-            "user_value": rollover,
-            "percentile": 55,  # Mock value
-            "interpretation": "Higher is better"
-        }
+        "monthly_spending": benchmark("monthly_spending", summary.total),
+        "impulse_purchases": benchmark("impulse_purchases", summary.impulse_count),
+        "savings_streak": benchmark("savings_streak", current_streak),
+        "rollover_savings": benchmark("rollover_savings", rollover)
     }
 
 @router.get("/reflection-insights")
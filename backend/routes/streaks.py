@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
 from datetime import date, timedelta
 from database import get_db
 from models.user import User
 from models.streak import UserStreak
-from models.transaction import Transaction
 from utils.deps import get_current_user
+from app.core.dates import user_day_window
+from app.services.analytics import impulse_stats, spent_between
 
 router = APIRouter(prefix="/api/streaks", tags=["streaks"])
 
@@ -73,15 +73,10 @@ def validate_streak_day(
     Check if yesterday was under budget and update streak
     Called by scheduled task at midnight
     """
-    yesterday = date.today() - timedelta(days=1)
+    yesterday, day_start, day_end = user_day_window(current_user, days_ago=1)
     
     # Get yesterday's spending
-    yesterday_spent = db.query(func.sum(Transaction.amount)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.date == yesterday
-        )
-    ).scalar() or 0.0
+    yesterday_spent = spent_between(db, current_user.id, day_start, day_end)
     
     daily_limit = current_user.daily_limit
     under_budget = yesterday_spent <= daily_limit
@@ -146,12 +141,7 @@ def get_milestone_status(
     total_savings = streak.rollover_budget
     
     # Get impulses avoided from transactions
-    impulse_count = db.query(func.count(Transaction.id)).filter(
-        and_(
-            Transaction.user_id == current_user.id,
-            Transaction.is_impulse == True
-        )
-    ).scalar() or 0
+    impulse_count, _ = impulse_stats(db, current_user.id)
     
     return {
         "streak_7_days": streak.current_streak >= 7,
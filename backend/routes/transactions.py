@@ -1,14 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, insert
 from typing import List
 from datetime import datetime, date, timedelta
+from collections import defaultdict
 from database import get_db
 from models.user import User
 from models.transaction import Transaction
-from models.category_limit import CategoryLimit
-from schemas import TransactionCreate, TransactionUpdate, TransactionResponse
+from models.streak import UserStreak
+from schemas import TransactionCreate, TransactionUpdate, TransactionResponse, TransactionBulkCreate, TransactionBulkResponse
 from utils.deps import get_current_user
+from app.core.categories import category_registry
+from app.core.data_version import bump_data_version
+from app.core.dates import user_day_window
+from app.core.ids import uuid7
+from app.services.category_limits import adjust_spent, adjust_spent_by_category, move_spent
+from app.services.streaks import adjust_impulse_count, impulse_delta
 
 router = APIRouter(prefix="/api/transactions", tags=["Transactions"])
 
@@ -53,28 +60,60 @@ def create_transaction(
     db.add(transaction)
     
     # Update category limit spent
-    category_limit = db.query(CategoryLimit).filter(
-        CategoryLimit.user_id == current_user.id,
-        CategoryLimit.category == transaction_data.category
-    ).first()
-    
-    if category_limit:
-        category_limit.spent += transaction_data.amount
+    adjust_spent(db, current_user.id, transaction_data.category, transaction_data.amount)
+    if transaction_data.is_impulse:
+        adjust_impulse_count(db, current_user.id, 1)
     
     db.commit()
     db.refresh(transaction)
     return transaction
 
+@router.post("/bulk", response_model=TransactionBulkResponse, status_code=status.HTTP_201_CREATED)
+def create_transactions_bulk(
+    bulk_data: TransactionBulkCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create many transactions with one multi-row INSERT and one limit update per category"""
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid7(),
+            "user_id": current_user.id,
+            "date": now,
+            "created_at": now,
+            **transaction_data.dict()
+        }
+        for transaction_data in bulk_data.transactions
+    ]
+    category_ids = category_registry.ids(row["category"] for row in rows)
+    for row in rows:
+        row["category_id"] = category_ids[row.pop("category")]
+    db.execute(insert(Transaction), rows)
+    
+    # Update category limits spent, aggregated per category
+    category_totals = defaultdict(float)
+    for transaction_data in bulk_data.transactions:
+        category_totals[transaction_data.category] += transaction_data.amount
+    
+    adjust_spent_by_category(db, current_user.id, category_totals)
+    adjust_impulse_count(db, current_user.id, sum(1 for row in rows if row["is_impulse"]))
+    bump_data_version(db, [current_user.id])
+    
+    db.commit()
+    return {"created": len(rows), "ids": [row["id"] for row in rows]}
+
 @router.get("/today", response_model=List[TransactionResponse])
 def get_today_transactions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get today's transactions"""
-    today = date.today()
+    """Get today's transactions (the user's local day)"""
+    _, day_start, day_end = user_day_window(current_user)
     transactions = db.query(Transaction).filter(
         Transaction.user_id == current_user.id,
-        func.date(Transaction.date) == today
+        Transaction.date >= day_start,
+        Transaction.date < day_end
     ).order_by(desc(Transaction.date)).all()
     return transactions
 
@@ -84,39 +123,31 @@ def get_transaction_stats(
     db: Session = Depends(get_db)
 ):
     """Get transaction statistics"""
-    today = date.today()
-    week_ago = today - timedelta(days=7)
-    month_ago = today - timedelta(days=30)
-    
-    # Today's spending
-    today_spent = db.query(func.sum(Transaction.amount)).filter(
-        Transaction.user_id == current_user.id,
-        func.date(Transaction.date) == today
-    ).scalar() or 0
-    
-    # Week spending
-    week_spent = db.query(func.sum(Transaction.amount)).filter(
-        Transaction.user_id == current_user.id,
-        Transaction.date >= week_ago
-    ).scalar() or 0
-    
-    # Month spending
-    month_spent = db.query(func.sum(Transaction.amount)).filter(
+    today, day_start, day_end = user_day_window(current_user)
+    week_ago = day_start - timedelta(days=7)
+    month_ago = day_start - timedelta(days=30)
+    
+    # Lifetime impulse purchases, kept on the user's streak row
+    impulse_count = db.query(UserStreak.impulse_count).filter(
+        UserStreak.user_id == current_user.id
+    ).scalar_subquery()
+    
+    # One scan over the last 30 days for all three windows
+    today_spent, week_spent, month_spent, impulse_count = db.query(
+        func.sum(Transaction.amount).filter(Transaction.date >= day_start, Transaction.date < day_end),
+        func.sum(Transaction.amount).filter(Transaction.date >= week_ago),
+        func.sum(Transaction.amount),
+        impulse_count
+    ).filter(
         Transaction.user_id == current_user.id,
         Transaction.date >= month_ago
-    ).scalar() or 0
-    
-    # Impulse purchases count
-    impulse_count = db.query(func.count(Transaction.id)).filter(
-        Transaction.user_id == current_user.id,
-        Transaction.is_impulse == True
-    ).scalar() or 0
+    ).one()
     
     return {
-        "today_spent": float(today_spent),
-        "week_spent": float(week_spent),
-        "month_spent": float(month_spent),
-        "impulse_count": impulse_count
+        "today_spent": float(today_spent or 0),
+        "week_spent": float(week_spent or 0),
+        "month_spent": float(month_spent or 0),
+        "impulse_count": impulse_count or 0
     }
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
@@ -158,9 +189,18 @@ def update_transaction(
             detail="Transaction not found"
         )
     
+    old_category, old_amount, was_impulse = transaction.category, transaction.amount, transaction.is_impulse
     for key, value in transaction_data.dict(exclude_unset=True).items():
         setattr(transaction, key, value)
     
+    # Move the amount between category limits if it changed
+    move_spent(
+        db, current_user.id,
+        old_category, old_amount, transaction.date,
+        transaction.category, transaction.amount, transaction.date
+    )
+    adjust_impulse_count(db, current_user.id, impulse_delta(was_impulse, transaction.is_impulse))
+    
     db.commit()
     db.refresh(transaction)
     return transaction
@@ -184,13 +224,9 @@ def delete_transaction(
         )
     
     # Adjust category limit spent
-    category_limit = db.query(CategoryLimit).filter(
-        CategoryLimit.user_id == current_user.id,
-        CategoryLimit.category == transaction.category
-    ).first()
-    
-    if category_limit:
-        category_limit.spent = max(0, category_limit.spent - transaction.amount)
+    adjust_spent(db, current_user.id, transaction.category, -transaction.amount, transaction.date)
+    if transaction.is_impulse:
+        adjust_impulse_count(db, current_user.id, -1)
     
     db.delete(transaction)
     db.commit()
@@ -9,6 +9,7 @@ from models.wishlist import WishlistItem
 from models.transaction import Transaction
 from schemas import WishlistCreate, WishlistUpdate, WishlistResponse
 from utils.deps import get_current_user
+from app.services.category_limits import adjust_spent
 
 router = APIRouter(prefix="/api/wishlist", tags=["wishlist"])
 
@@ -151,6 +152,7 @@ def purchase_wishlist_item(
         date=date.today()
     )
     db.add(transaction)
+    adjust_spent(db, current_user.id, category, db_item.price)
     
     # Update wishlist item status
     db_item.status = "purchased"
@@ -1,8 +1,9 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime, date
-from decimal import Decimal
 from uuid import UUID
+from app.schemas.category import Category
+from app.schemas.money import Money
 
 # User schemas
 class UserBase(BaseModel):
@@ -14,14 +15,14 @@ class UserCreate(UserBase):
 
 class UserUpdate(BaseModel):
     name: Optional[str] = None
-    monthly_income: Optional[Decimal] = None
-    fixed_expenses: Optional[Decimal] = None
+    monthly_income: Optional[Money] = None
+    fixed_expenses: Optional[Money] = None
     timezone: Optional[str] = None
 
 class UserResponse(UserBase):
     id: UUID
-    monthly_income: Decimal
-    fixed_expenses: Decimal
+    monthly_income: Money
+    fixed_expenses: Money
     timezone: str
     created_at: datetime
     daily_limit: float
@@ -39,8 +40,8 @@ class TokenData(BaseModel):
 
 # Transaction schemas
 class TransactionBase(BaseModel):
-    amount: Decimal = Field(gt=0)
-    category: str
+    amount: Money = Field(gt=0)
+    category: Category
     is_impulse: bool = False
     note: Optional[str] = None
     emergency_reason: Optional[str] = None
@@ -48,9 +49,16 @@ class TransactionBase(BaseModel):
 class TransactionCreate(TransactionBase):
     pass
 
+class TransactionBulkCreate(BaseModel):
+    transactions: List[TransactionCreate] = Field(min_length=1, max_length=500)
+
+class TransactionBulkResponse(BaseModel):
+    created: int
+    ids: List[UUID]
+
 class TransactionUpdate(BaseModel):
-    amount: Optional[Decimal] = Field(None, gt=0)
-    category: Optional[str] = None
+    amount: Optional[Money] = Field(None, gt=0)
+    category: Optional[Category] = None
     is_impulse: Optional[bool] = None
     note: Optional[str] = None
 
@@ -77,6 +85,9 @@ class ReflectionResponse(ReflectionBase):
     user_id: UUID
     date: date
     created_at: datetime
+    analysis_triggers: Optional[List[str]] = None
+    analysis_suggestions: Optional[List[str]] = None
+    analyzed_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -84,7 +95,7 @@ class ReflectionResponse(ReflectionBase):
 # Goal schemas
 class GoalBase(BaseModel):
     name: str
-    target: Decimal = Field(gt=0)
+    target: Money = Field(gt=0)
     color: str = "bg-blue-500"
     deadline: Optional[date] = None
 
@@ -93,15 +104,15 @@ class GoalCreate(GoalBase):
 
 class GoalUpdate(BaseModel):
     name: Optional[str] = None
-    current: Optional[Decimal] = None
-    target: Optional[Decimal] = Field(None, gt=0)
+    current: Optional[Money] = None
+    target: Optional[Money] = Field(None, gt=0)
     color: Optional[str] = None
     deadline: Optional[date] = None
 
 class GoalResponse(GoalBase):
     id: UUID
     user_id: UUID
-    current: Decimal
+    current: Money
     created_at: datetime
     updated_at: datetime
     progress_percentage: float
@@ -111,14 +122,14 @@ class GoalResponse(GoalBase):
 
 # Category Limit schemas
 class CategoryLimitUpdate(BaseModel):
-    monthly_limit: Decimal = Field(ge=0)
+    monthly_limit: Money = Field(ge=0)
 
 class CategoryLimitResponse(BaseModel):
     id: UUID
     user_id: UUID
     category: str
-    monthly_limit: Decimal
-    spent: Decimal
+    monthly_limit: Money
+    spent: Money
     reset_date: date
     remaining: float
     percentage_used: float
@@ -129,13 +140,13 @@ class CategoryLimitResponse(BaseModel):
 # Wishlist schemas
 class WishlistItemCreate(BaseModel):
     name: str
-    price: Decimal = Field(gt=0)
+    price: Money = Field(gt=0)
 
 class WishlistItemResponse(BaseModel):
     id: UUID
     user_id: UUID
     name: str
-    price: Decimal
+    price: Money
     cooldown_days: int
     added_date: datetime
     purchased_date: Optional[datetime]
@@ -151,7 +162,7 @@ class StreakResponse(BaseModel):
     current_streak: int
     longest_streak: int
     impulses_avoided: int
-    rollover_budget: Decimal
+    rollover_budget: Money
     last_streak_date: Optional[date]
     
     class Config:
@@ -1,6 +1,8 @@
 import httpx
+import time
 from typing import Optional, Dict, Any
 from config import settings
+from services.llm_metrics import llm_metrics
 
 class MinimaxService:
     """Service for Minimax LLM API integration"""
@@ -15,37 +17,57 @@ class MinimaxService:
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
-        max_tokens: int = 500
+        max_tokens: int = 500,
+        operation: str = "chat",
+        user_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Make request to Minimax API"""
+        """
+        Make request to Minimax API, recording token usage and latency
+        under `operation` and `user_id`. Raises LLMBudgetExceeded if the
+        user is over their daily token budget.
+        """
+        llm_metrics.check_budget(operation, user_id)
         
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
+        started = time.perf_counter()
         async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/text/chatcompletion_v2",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens
-                },
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+            try:
+                response = await client.post(
+                    f"{self.base_url}/text/chatcompletion_v2",
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    json={
+                        "model": self.model,
+                        "messages": messages,
+                        "temperature": temperature,
+                        "max_tokens": max_tokens
+                    },
+                    timeout=30.0
+                )
+                response.raise_for_status()
+                result = response.json()
+            except Exception:
+                llm_metrics.record_request(
+                    operation, user_id, time.perf_counter() - started, error=True
+                )
+                raise
+        
+        llm_metrics.record_request(
+            operation, user_id, time.perf_counter() - started, usage=result.get("usage")
+        )
+        return result
     
     async def categorize_transaction(
         self,
         description: str,
-        amount: float
+        amount: float,
+        user_id: Optional[str] = None
     ) -> str:
         """
         Auto-categorize transaction from description
@@ -70,7 +92,9 @@ class MinimaxService:
                 prompt=prompt,
                 system_prompt=system_prompt,
                 temperature=0.3,
-                max_tokens=20
+                max_tokens=20,
+                operation="categorize",
+                user_id=user_id
             )
             
             # Extract category from response
@@ -87,12 +111,14 @@ class MinimaxService:
             
             return category
         except Exception as e:
+            llm_metrics.record_fallback("categorize", user_id)
             print(f"Error categorizing transaction: {e}")
             return "Other"
     
     async def analyze_spending_pattern(
         self,
-        spending_data: Dict[str, Any]
+        spending_data: Dict[str, Any],
+        user_id: Optional[str] = None
     ) -> str:
         """
         Analyze spending patterns and provide insights
@@ -116,23 +142,31 @@ class MinimaxService:
                 prompt=prompt,
                 system_prompt=system_prompt,
                 temperature=0.7,
-                max_tokens=200
+                max_tokens=200,
+                operation="analyze_spending",
+                user_id=user_id
             )
             
             insight = result.get("choices", [{}])[0].get("message", {}).get("content", "").strip()
             return insight
         except Exception as e:
+            llm_metrics.record_fallback("analyze_spending", user_id)
             print(f"Error analyzing spending: {e}")
             return "Unable to generate insights at this time."
     
     async def analyze_reflection(
         self,
         reflection_text: str,
-        regret_purchase: bool
+        regret_purchase: bool,
+        raise_on_error: bool = False,
+        user_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Analyze daily reflection for emotional triggers
         Returns: {triggers: [...], suggestions: [...]}
+        
+        With raise_on_error, API failures propagate instead of returning the
+        canned fallback, so callers that persist the result don't store it.
         """
         system_prompt = """You are a behavioral finance psychologist.
         Analyze reflections to identify emotional triggers and spending patterns.
@@ -148,7 +182,9 @@ class MinimaxService:
                 prompt=prompt,
                 system_prompt=system_prompt,
                 temperature=0.7,
-                max_tokens=300
+                max_tokens=300,
+                operation="analyze_reflection",
+                user_id=user_id
             )
             
             content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
@@ -178,6 +214,9 @@ class MinimaxService:
                 "suggestions": suggestions
             }
         except Exception as e:
+            if raise_on_error:
+                raise
+            llm_metrics.record_fallback("analyze_reflection", user_id)
             print(f"Error analyzing reflection: {e}")
             return {
                 "triggers": [],
@@ -187,7 +226,8 @@ class MinimaxService:
     async def generate_impulse_question(
         self,
         item_name: str,
-        price: float
+        price: float,
+        user_id: Optional[str] = None
     ) -> str:
         """
         Generate a thoughtful question for impulse check
@@ -205,12 +245,15 @@ class MinimaxService:
                 prompt=prompt,
                 system_prompt=system_prompt,
                 temperature=0.8,
-                max_tokens=50
+                max_tokens=50,
+                operation="impulse_question",
+                user_id=user_id
             )
             
             question = result.get("choices", [{}])[0].get("message", {}).get("content", "").strip()
             return question
         except Exception as e:
+            llm_metrics.record_fallback("impulse_question", user_id)
             print(f"Error generating question: {e}")
             return "Do you really need this right now?"
 
@@ -0,0 +1,154 @@
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from datetime import date
+from typing import Optional, Dict, Any
+from config import settings
+
+class LLMBudgetExceeded(Exception):
+    """Raised when a user has used up their daily LLM token budget"""
+
+@dataclass
+class UsageStats:
+    """Counters for a group of LLM calls"""
+    requests: int = 0
+    errors: int = 0
+    fallbacks: int = 0
+    throttled: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_seconds: float = 0.0
+    cost: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["total_tokens"] = self.total_tokens
+        data["avg_latency_seconds"] = (
+            self.latency_seconds / self.requests if self.requests else 0.0
+        )
+        return data
+
+class LLMMetrics:
+    """
+    In-process accounting of LLM usage, aggregated per operation and per
+    user per day. Each worker process keeps its own counters, so budgets
+    are enforced per worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_operation: Dict[str, UsageStats] = defaultdict(UsageStats)
+        self._day = date.today()
+        self._by_user: Dict[str, UsageStats] = defaultdict(UsageStats)
+
+    def _user_stats(self, user_id: Optional[str]) -> Optional[UsageStats]:
+        """Today's stats for a user; must be called with the lock held"""
+        today = date.today()
+        if today != self._day:
+            self._day = today
+            self._by_user.clear()
+        if user_id is None:
+            return None
+        return self._by_user[str(user_id)]
+
+    def _apply(self, operation: str, user_id: Optional[str], **deltas):
+        with self._lock:
+            targets = [self._by_operation[operation]]
+            user_stats = self._user_stats(user_id)
+            if user_stats is not None:
+                targets.append(user_stats)
+            for stats in targets:
+                for name, delta in deltas.items():
+                    setattr(stats, name, getattr(stats, name) + delta)
+
+    def check_budget(self, operation: str, user_id: Optional[str]):
+        """Raise LLMBudgetExceeded if the user is over today's token budget"""
+        budget = settings.LLM_DAILY_TOKEN_BUDGET
+        if not budget or user_id is None:
+            return
+        with self._lock:
+            used = self._user_stats(user_id).total_tokens
+        if used >= budget:
+            self._apply(operation, user_id, throttled=1)
+            raise LLMBudgetExceeded(
+                f"Daily LLM budget of {budget} tokens used ({used})"
+            )
+
+    def record_request(
+        self,
+        operation: str,
+        user_id: Optional[str],
+        latency: float,
+        usage: Optional[Dict[str, Any]] = None,
+        error: bool = False
+    ):
+        """Record one API call; usage is the response's `usage` field"""
+        usage = usage or {}
+        prompt_tokens = int(usage.get("prompt_tokens") or 0)
+        completion_tokens = int(usage.get("completion_tokens") or 0)
+        # Some responses only report the total
+        if not prompt_tokens and not completion_tokens:
+            completion_tokens = int(usage.get("total_tokens") or 0)
+        cost = (
+            prompt_tokens / 1000 * settings.LLM_COST_PER_1K_PROMPT_TOKENS
+            + completion_tokens / 1000 * settings.LLM_COST_PER_1K_COMPLETION_TOKENS
+        )
+        self._apply(
+            operation,
+            user_id,
+            requests=1,
+            errors=1 if error else 0,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency_seconds=latency,
+            cost=cost
+        )
+
+    def record_fallback(self, operation: str, user_id: Optional[str]):
+        """Record that a canned response was returned instead of the LLM's"""
+        self._apply(operation, user_id, fallbacks=1)
+
+    def record_cache(self, operation: str, user_id: Optional[str], hit: bool):
+        """Record whether a stored result saved an LLM call"""
+        if hit:
+            self._apply(operation, user_id, cache_hits=1)
+        else:
+            self._apply(operation, user_id, cache_misses=1)
+
+    def user_usage(self, user_id: str) -> Dict[str, Any]:
+        """Today's usage and remaining budget for a user"""
+        with self._lock:
+            stats = self._user_stats(user_id).as_dict()
+        budget = settings.LLM_DAILY_TOKEN_BUDGET
+        return {
+            "date": self._day,
+            "usage": stats,
+            "daily_token_budget": budget or None,
+            "remaining_tokens": max(0, budget - stats["total_tokens"]) if budget else None
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Aggregated usage per operation since process start"""
+        with self._lock:
+            operations = {
+                name: stats.as_dict() for name, stats in self._by_operation.items()
+            }
+            active_users = len(self._by_user)
+        totals = UsageStats()
+        for stats in operations.values():
+            for name in asdict(totals):
+                setattr(totals, name, getattr(totals, name) + stats[name])
+        return {
+            "operations": operations,
+            "totals": totals.as_dict(),
+            "active_users_today": active_users
+        }
+
+# Singleton instance
+llm_metrics = LLMMetrics()
@@ -0,0 +1,81 @@
+import hashlib
+from datetime import datetime
+from database import SessionLocal
+from models.reflection import Reflection
+from services.llm import minimax_service
+from services.llm_metrics import llm_metrics
+
+def reflection_text(reflection: Reflection) -> str:
+    """Combine the free-text fields of a reflection into one prompt body"""
+    parts = []
+    if reflection.regret_purchase:
+        parts.append(f"Regret: {reflection.regret_purchase}")
+    if reflection.good_purchase:
+        parts.append(f"Good purchase: {reflection.good_purchase}")
+    if reflection.notes:
+        parts.append(f"Notes: {reflection.notes}")
+    return "\n".join(parts)
+
+def reflection_content_hash(reflection: Reflection) -> str:
+    """Hash of every field the analysis depends on"""
+    content = "\x1f".join([
+        reflection.regret_purchase or "",
+        reflection.good_purchase or "",
+        reflection.notes or ""
+    ])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+def needs_analysis(reflection: Reflection) -> bool:
+    """True if the reflection has text whose analysis isn't stored yet"""
+    if not reflection_text(reflection):
+        return False
+    return reflection.analysis_hash != reflection_content_hash(reflection)
+
+async def analyze_reflection_job(reflection_id):
+    """
+    Background job: analyze a reflection and store the triggers and
+    suggestions on its row. Reflections whose content hash matches the
+    stored analysis are skipped, so unchanged text is never re-sent.
+    """
+    db = SessionLocal()
+    try:
+        reflection = db.query(Reflection).filter(Reflection.id == reflection_id).first()
+        if not reflection or not needs_analysis(reflection):
+            return
+
+        content_hash = reflection_content_hash(reflection)
+        text = reflection_text(reflection)
+        regret = bool(reflection.regret_purchase)
+        user_id = str(reflection.user_id)
+        # Don't hold a connection open while waiting on the LLM
+        db.rollback()
+
+        try:
+            analysis = await minimax_service.analyze_reflection(
+                reflection_text=text,
+                regret_purchase=regret,
+                raise_on_error=True,
+                user_id=user_id
+            )
+        except Exception as e:
+            # Leave the hash unset so the next write or read retries
+            llm_metrics.record_fallback("analyze_reflection", user_id)
+            print(f"Error analyzing reflection {reflection_id}: {e}")
+            return
+
+        reflection = db.query(Reflection).filter(Reflection.id == reflection_id).first()
+        if not reflection or reflection_content_hash(reflection) != content_hash:
+            # Deleted or edited while the request was in flight; the edit
+            # enqueued its own job
+            return
+
+        reflection.analysis_triggers = analysis["triggers"]
+        reflection.analysis_suggestions = analysis["suggestions"]
+        reflection.analysis_hash = content_hash
+        reflection.analyzed_at = datetime.utcnow()
+        db.commit()
+    except Exception as e:
+        print(f"Error storing reflection analysis {reflection_id}: {e}")
+        db.rollback()
+    finally:
+        db.close()
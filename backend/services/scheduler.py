@@ -1,3 +1,4 @@
+import json
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
@@ -11,6 +12,13 @@ from models.budget_rollover import BudgetRollover
 from models.category_limit import CategoryLimit
 from models.wishlist import WishlistItem
 from dateutil.relativedelta import relativedelta
+from app.services.scheduler import (
+    compute_peer_benchmarks_task,
+    maintain_transaction_partitions_task,
+    reconcile_category_limits_task,
+)
+from app.core.dates import user_day_window
+from services.llm_metrics import llm_metrics
 
 scheduler = AsyncIOScheduler()
 
@@ -33,19 +41,21 @@ async def midnight_rollover_task():
     db = get_db()
     
     try:
-        yesterday = date.today() - timedelta(days=1)
-        
         # Get all users
         users = db.query(User).all()
         
         for user in users:
+            # Yesterday in the user's own timezone
+            yesterday, day_start, day_end = user_day_window(user, days_ago=1)
+            
             # Calculate rollover
-            yesterday_spent = db.query(func.sum(Transaction.amount)).filter(
+            yesterday_spent = float(db.query(func.sum(Transaction.amount)).filter(
                 and_(
                     Transaction.user_id == user.id,
-                    Transaction.date == yesterday
+                    Transaction.date >= day_start,
+                    Transaction.date < day_end
                 )
-            ).scalar() or 0.0
+            ).scalar() or 0.0)
             
             daily_limit = user.daily_limit
             unused = max(0, daily_limit - yesterday_spent)
@@ -177,6 +187,16 @@ async def reflection_reminder_task():
     finally:
         db.close()
 
+def log_llm_metrics_task():
+    """
+    Run every hour: log this worker's aggregated LLM usage. Kept out of the
+    API since it covers all users.
+    """
+    snapshot = llm_metrics.snapshot()
+    print(f"LLM usage ({snapshot['active_users_today']} active users today): {json.dumps(snapshot['totals'])}")
+    for operation, stats in sorted(snapshot["operations"].items()):
+        print(f"  {operation}: {json.dumps(stats)}")
+
 def init_scheduler():
     """Initialize and start the scheduler"""
     
@@ -198,6 +218,42 @@ def init_scheduler():
         replace_existing=True
     )
     
+    # Category limit reconciliation (12:05 AM every day)
+    scheduler.add_job(
+        reconcile_category_limits_task,
+        CronTrigger(hour=0, minute=5),
+        id="reconcile_category_limits",
+        name="Category limit reconciliation",
+        replace_existing=True
+    )
+    
+    # Transaction partition maintenance (12:15 AM every day)
+    scheduler.add_job(
+        maintain_transaction_partitions_task,
+        CronTrigger(hour=0, minute=15),
+        id="maintain_transaction_partitions",
+        name="Transaction partition maintenance",
+        replace_existing=True
+    )
+    
+    # Peer benchmark distributions (12:45 AM every day)
+    scheduler.add_job(
+        compute_peer_benchmarks_task,
+        CronTrigger(hour=0, minute=45),
+        id="compute_peer_benchmarks",
+        name="Peer benchmark distributions",
+        replace_existing=True
+    )
+    
+    # LLM usage log (every hour, on the hour)
+    scheduler.add_job(
+        log_llm_metrics_task,
+        CronTrigger(minute=0),
+        id="log_llm_metrics",
+        name="LLM usage log",
+        replace_existing=True
+    )
+    
     # Reflection reminder (9 PM every day)
     scheduler.add_job(
         reflection_reminder_task,
@@ -211,6 +267,10 @@ def init_scheduler():
     print("Scheduler initialized with tasks:")
     print("  - Midnight rollover (12:00 AM)")
     print("  - Monthly reset (1st at 12:01 AM)")
+    print("  - Category limit reconciliation (12:05 AM)")
+    print("  - Transaction partition maintenance (12:15 AM)")
+    print("  - Peer benchmark distributions (12:45 AM)")
+    print("  - LLM usage log (hourly)")
     print("  - Reflection reminder (9:00 PM)")
 
 def shutdown_scheduler():
@@ -0,0 +1,218 @@
+"""
+Check that the hot endpoints read transactions through the indexes meant
+for them.
+
+Each case calls the endpoint function itself, captures the SQL it sends
+for transactions and runs EXPLAIN (FORMAT JSON) on exactly those
+statements with their parameters, so a change to an endpoint's query is
+checked as it ships. Synthetic users and transactions are seeded inside a
+transaction that is rolled back afterwards.
+
+Needs DATABASE_URL pointing at a Postgres migrated to head; skipped
+otherwise:
+    DATABASE_URL=postgresql://... python -m pytest tests/test_explain_indexes.py
+"""
+import asyncio
+import os
+import sys
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+if not os.environ.get("DATABASE_URL"):
+    pytest.skip("needs DATABASE_URL pointing at a migrated Postgres", allow_module_level=True)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SECRET_KEY", "explain-secret")
+os.environ.setdefault("MINIMAX_API_KEY", "unused")
+os.environ.setdefault("MINIMAX_API_URL", "unused")
+
+from sqlalchemy import event, text  # noqa: E402
+
+from app.api.v1.endpoints import budget as v1_budget  # noqa: E402
+from app.api.v1.endpoints import transactions as v1_transactions  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services import analytics  # noqa: E402
+from app.services.partitions import is_partitioned  # noqa: E402
+from models.user import User as LegacyUser  # noqa: E402
+from routes import reports as legacy_reports  # noqa: E402
+from routes import transactions as legacy_transactions  # noqa: E402
+
+try:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+except Exception as e:
+    pytest.skip(f"Postgres unavailable: {e}", allow_module_level=True)
+
+USERS = 200
+ROWS_PER_USER = 500
+
+SEED_SQL = text("""
+    WITH category_ids AS (
+        SELECT array_agg(id) AS ids FROM categories WHERE name = ANY(:categories)
+    ),
+    new_users AS (
+        INSERT INTO users (id, email, hashed_password, name, monthly_income, fixed_expenses)
+        SELECT gen_random_uuid(), 'explain-' || g || '-' || :tag || '@example.com', 'x', 'Explain', 300000, 100000
+        FROM generate_series(1, :users) AS g
+        RETURNING id
+    )
+    INSERT INTO transactions (id, user_id, amount, category_id, date, is_impulse)
+    SELECT
+        gen_random_uuid(),
+        u.id,
+        (random() * 10000)::bigint,
+        category_ids.ids[1 + (random() * (array_length(category_ids.ids, 1) - 1))::int],
+        now() - random() * interval '730 days',
+        random() < 0.1
+    FROM new_users u, category_ids, generate_series(1, :rows)
+""")
+
+PARENT_INDEX_SQL = text("""
+    SELECT coalesce(
+        (SELECT p.relname FROM pg_inherits i JOIN pg_class p ON p.oid = i.inhparent
+         WHERE i.inhrelid = to_regclass(:name)),
+        :name
+    )
+""")
+
+
+@pytest.fixture(scope="module")
+def db():
+    session = SessionLocal()
+    try:
+        session.execute(
+            SEED_SQL,
+            {"users": USERS, "rows": ROWS_PER_USER, "tag": uuid.uuid4().hex[:8], "categories": ["food", "transport", "shopping", "bills"]}
+        )
+        session.execute(text("ANALYZE transactions"))
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture(scope="module")
+def user_id(db):
+    return db.execute(text("SELECT user_id FROM transactions ORDER BY random() LIMIT 1")).scalar()
+
+
+def walk(plan, names: set, partitions: set):
+    """
+    Collect the indexes a plan reads transactions through ("seq" marks a
+    seq scan) and the transactions partitions it touches
+    """
+    relation = plan.get("Relation Name", "")
+    if relation.startswith("transactions"):
+        partitions.add(relation)
+        if plan.get("Node Type") == "Seq Scan":
+            names.add("seq")
+    if plan.get("Index Name"):
+        names.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        walk(child, names, partitions)
+
+
+def captured_statements(db, call) -> list:
+    """(statement, parameters) of every transactions query `call` runs"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "transactions" in statement and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    analytics._cache.clear()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return statements
+
+
+def explain(db, statement, parameters):
+    """(indexes used, named as on the parent table; partitions scanned)"""
+    plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+    names, partitions = set(), set()
+    walk(plan[0]["Plan"], names, partitions)
+    # Partitions have their own copies of each index, named after the partition
+    names = {db.execute(PARENT_INDEX_SQL, {"name": name}).scalar() for name in names}
+    return names, partitions
+
+
+def v1_user(db, user_id):
+    return db.get(User, user_id)
+
+
+def legacy_user(db, user_id):
+    return db.get(LegacyUser, user_id)
+
+
+# (endpoint, call(db, user_id), index expected, monthly partitions its date range covers)
+CASES = [
+    (
+        "GET /api/v1/transactions/today",
+        lambda db, user_id: asyncio.run(v1_transactions.get_today_transactions(db=db, current_user=v1_user(db, user_id))),
+        "ix_transactions_user_id_date",
+        1,
+    ),
+    (
+        "GET /api/v1/transactions/?category=food (this month)",
+        lambda db, user_id: asyncio.run(v1_transactions.list_transactions(
+            start_date=date.today().replace(day=1).isoformat(), end_date=None, category="food",
+            db=db, current_user=v1_user(db, user_id)
+        )),
+        "ix_transactions_user_id_category_date",
+        1,
+    ),
+    (
+        "GET /api/v1/budget/today",
+        lambda db, user_id: asyncio.run(v1_budget.get_today_budget(db=db, current_user=v1_user(db, user_id))),
+        "ix_transactions_user_id_date",
+        1,
+    ),
+    (
+        "GET /api/reports/weekly-summary",
+        lambda db, user_id: legacy_reports.get_weekly_summary(db=db, current_user=legacy_user(db, user_id)),
+        "ix_transactions_user_id_date",
+        1,
+    ),
+    (
+        "GET /api/reports/monthly-summary",
+        lambda db, user_id: legacy_reports.get_monthly_summary(db=db, current_user=legacy_user(db, user_id)),
+        "ix_transactions_user_id_date",
+        1,
+    ),
+    (
+        "GET /api/transactions?is_impulse=true (90 days)",
+        lambda db, user_id: legacy_transactions.list_transactions(
+            skip=0, limit=50, category=None, is_impulse=True,
+            start_date=date.today() - timedelta(days=90), end_date=None,
+            current_user=legacy_user(db, user_id), db=db
+        ),
+        "ix_transactions_user_id_date_impulse",
+        4,
+    ),
+]
+
+
+@pytest.mark.parametrize("endpoint, call, expected, max_partitions", CASES, ids=[case[0] for case in CASES])
+def test_endpoint_uses_index(db, user_id, endpoint, call, expected, max_partitions):
+    statements = captured_statements(db, lambda: call(db, user_id))
+    assert statements, f"{endpoint} ran no transactions query"
+
+    partitioned = is_partitioned(db)
+    used = set()
+    for statement, parameters in statements:
+        names, partitions = explain(db, statement, parameters)
+        assert "seq" not in names, f"{endpoint} scans transactions sequentially:\n{statement}"
+        if partitioned:
+            # Open-ended ranges can't prune the (empty) future partitions or
+            # the default one
+            limit = max_partitions + settings.TRANSACTION_PARTITIONS_AHEAD + 1
+            assert len(partitions) <= limit, f"{endpoint} reads {len(partitions)} partitions:\n{statement}"
+        used |= names
+    assert expected in used, f"{endpoint} uses {sorted(used)}, expected {expected}"
@@ -1,8 +1,9 @@
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+from jose import jwt
 from datetime import datetime, timedelta
 from typing import Optional
 from config import settings
+from app.core.token_cache import token_cache
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -36,11 +37,8 @@ def create_refresh_token(data: dict) -> str:
 
 def verify_token(token: str) -> Optional[str]:
     """Verify JWT token and return user_id"""
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
-        return user_id
-    except JWTError:
+    payload = token_cache.decode(token, settings.SECRET_KEY, settings.ALGORITHM)
+    if payload is None:
         return None
+    user_id: str = payload.get("sub")
+    return user_id